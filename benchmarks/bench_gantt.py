@@ -0,0 +1,106 @@
+"""Benchmark del diagrama de Gantt incremental.
+
+Reproduce una simulación paso a paso sobre un lienzo Agg (sin ventana) y
+mide el tiempo de dibujo por paso en distintos tramos del historial. Con el
+dibujo incremental, el tiempo por paso debe mantenerse plano aunque crezca
+el número de eventos; los picos aislados corresponden a los redibujados
+completos cuando cambia la escala.
+
+Con ``--lod-slices N`` mide además la vista LOD: construcción de los
+resúmenes para una línea de tiempo de N rebanadas y tiempo por cuadro al
+desplazar y acercar.
+
+Uso:
+    python benchmarks/bench_gantt.py [--processes N] [--steps S] [--png archivo.png]
+    python benchmarks/bench_gantt.py --lod-slices 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+from gantt import GanttRenderer, LodGanttView  # noqa: E402
+from scheduler import Process, schedule_rr_bulk, schedule_rr_step_by_step  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--steps', type=int, default=2000)
+    parser.add_argument('--quantum', type=int, default=1)
+    parser.add_argument('--window', type=int, default=200,
+                        help="Pasos por tramo al informar la mediana")
+    parser.add_argument('--png', help="Guardar la imagen final del diagrama")
+    parser.add_argument('--lod-slices', type=int, default=0,
+                        help="Medir la vista LOD con una línea de tiempo de N rebanadas")
+    args = parser.parse_args()
+
+    if args.lod_slices:
+        bench_lod(args.processes, args.lod_slices)
+        return
+
+    rng = random.Random(3)
+    burst = max(1, args.steps // args.processes)
+    processes = [Process(f'P{i + 1}', rng.randint(0, 5), burst + rng.randint(0, 5))
+                 for i in range(args.processes)]
+    history = schedule_rr_step_by_step(processes, args.quantum)
+    steps = min(args.steps, len(history))
+
+    figure = Figure(figsize=(8, 4), facecolor='#2b2b2b')
+    canvas = FigureCanvasAgg(figure)
+    renderer = GanttRenderer(figure, canvas)
+
+    timings = []
+    for step in range(steps):
+        n_events, _ = history.counts(step)
+        start = time.perf_counter()
+        renderer.sync(history.events, n_events, step)
+        timings.append(time.perf_counter() - start)
+
+    print(f"Pasos: {steps}  Eventos: {history.counts(steps - 1)[0]}")
+    print("Tramo de pasos      mediana (ms)   máx (ms)")
+    for begin in range(0, steps, args.window):
+        window = timings[begin:begin + args.window]
+        print(f"{begin:6}-{begin + len(window) - 1:<6}     {statistics.median(window) * 1000:10.3f} "
+              f"{max(window) * 1000:10.2f}")
+
+    if args.png:
+        renderer.redraw()
+        figure.savefig(args.png, facecolor=figure.get_facecolor())
+
+
+def bench_lod(process_count, slices):
+    burst = max(1, slices // process_count)
+    processes = [Process(f'P{i + 1}', i, burst) for i in range(process_count)]
+    events = schedule_rr_bulk(processes, 1, gantt='full')['events']
+
+    figure = Figure(figsize=(8, 4), facecolor='#2b2b2b')
+    canvas = FigureCanvasAgg(figure)
+    view = LodGanttView(figure, canvas)
+    start = time.perf_counter()
+    view.set_events(events)
+    canvas.draw()
+    build = time.perf_counter() - start
+    print(f"Vista LOD: {len(events):,} eventos, resúmenes + primer cuadro en {build:.2f} s")
+
+    end_time = view.summary.end_time
+    for label, span in (('completa', end_time), ('1/100', end_time / 100), ('detalle', 40)):
+        frames = []
+        for i in range(20):
+            offset = (end_time - span) * i / 20
+            start = time.perf_counter()
+            # Cambiar la ventana vuelve a consultar y pide un dibujo (draw_idle)
+            view.ax.set_xlim(offset, offset + span)
+            frames.append(time.perf_counter() - start)
+        print(f"   ventana {label:9}: {statistics.median(frames) * 1000:8.1f} ms por cuadro")
+
+
+if __name__ == '__main__':
+    main()
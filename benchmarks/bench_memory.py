@@ -0,0 +1,141 @@
+"""Benchmark de memoria de la tabla de procesos y la cola circular.
+
+Compara las representaciones compactas (``Process`` con ``__slots__``,
+``ProcessTable`` por columnas y ``CircularQueue`` sobre arreglos de
+índices) con la anterior, reproducida aquí: procesos con ``__dict__``, un
+objeto nodo por proceso en la cola y ``deepcopy`` de cada proceso al
+empezar la simulación. La memoria se mide con ``tracemalloc``.
+
+Uso:
+    python benchmarks/bench_memory.py [--processes N]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import CircularQueue, Process, ProcessTable, schedule_rr_metrics  # noqa: E402
+
+
+class DictProcess:
+    """``Process`` tal como era antes: un ``__dict__`` por instancia"""
+    def __init__(self, pid, arrival, burst):
+        self.id = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.original_burst = burst
+        self.remaining = burst
+        self.finish_time = 0
+        self.turnaround = 0
+        self.waiting = 0
+        self.start_time = -1
+
+    def copy(self):
+        # Antes cada simulación copiaba los procesos con deepcopy
+        return deepcopy(self)
+
+
+class DictNode:
+    def __init__(self, process):
+        self.process = process
+        self.next = None
+        self.prev = None
+
+
+class NodeQueue:
+    """La cola anterior: un objeto nodo enlazado por proceso"""
+    def __init__(self):
+        self.current = None
+        self.size = 0
+
+    def add_process(self, process):
+        node = DictNode(process)
+        if self.current is None:
+            node.next = node.prev = node
+            self.current = node
+        else:
+            last = self.current.prev
+            node.next, node.prev = self.current, last
+            last.next = node
+            self.current.prev = node
+        self.size += 1
+
+
+def allocated(build):
+    """Bytes que siguen asignados tras ``build()`` y el resultado"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def peak(function, *args):
+    tracemalloc.start()
+    function(*args)
+    result = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result
+
+
+def report(label, old, new, count):
+    print(f"{label:28} {old / count:8.1f} B/proc -> {new / count:8.1f} B/proc  ({old / new:.1f}x menos)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=200_000)
+    parser.add_argument('--quantum', type=int, default=4)
+    args = parser.parse_args()
+    count = args.processes
+    # Los IDs se crean antes para medir solo la estructura de cada proceso
+    pids = [f'P{i + 1}' for i in range(count)]
+
+    old_procs, old = allocated(lambda: [DictProcess(pid, i, 1 + i % 20) for i, pid in enumerate(pids)])
+    new_procs, new = allocated(lambda: [Process(pid, i, 1 + i % 20) for i, pid in enumerate(pids)])
+    print(f"Procesos: {count:,}")
+    report("Procesos con __slots__", old, new, count)
+
+    def build_table():
+        table = ProcessTable()
+        for i, pid in enumerate(pids):
+            table.append(pid, i, 1 + i % 20)
+        return table
+
+    table, new = allocated(build_table)
+    report("Tabla de procesos (columnas)", old, new, count)
+
+    def fill(queue, processes):
+        for process in processes:
+            queue.add_process(process)
+        return queue
+
+    _, old = allocated(lambda: fill(NodeQueue(), new_procs))
+    _, new = allocated(lambda: fill(CircularQueue(), new_procs))
+    report("Cola circular (nodos)", old, new, count)
+
+    start = time.perf_counter()
+    copies = [p.copy() for p in old_procs]
+    old_copy = time.perf_counter() - start
+    start = time.perf_counter()
+    copies = [p.copy() for p in new_procs]
+    new_copy = time.perf_counter() - start
+    start = time.perf_counter()
+    copies = table.copy()
+    table_copy = time.perf_counter() - start
+    del copies
+    print(f"{'Copia inicial':28} {old_copy:8.3f} s (deepcopy) -> {new_copy:8.3f} s (Process.copy)"
+          f" -> {table_copy:8.3f} s (ProcessTable.copy)")
+
+    # El motor trabaja sobre una copia en columnas: su pico no depende de la entrada
+    print(f"{'Pico de schedule_rr_metrics':28} "
+          f"{peak(schedule_rr_metrics, table, args.quantum) / count:8.1f} B/proc")
+
+
+if __name__ == '__main__':
+    main()
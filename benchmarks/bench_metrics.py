@@ -0,0 +1,88 @@
+"""Benchmark de los modos rápidos frente a la simulación paso a paso.
+
+Antes de medir, verifica sobre cargas aleatorias que ``schedule_rr_metrics``
+y ``schedule_rr_bulk`` producen exactamente los mismos Tf/Tr/Te, tiempo final
+y número de eventos que ``schedule_rr_step_by_step`` (y, con
+``gantt='full'``, la misma lista de eventos).
+
+Uso:
+    python benchmarks/bench_metrics.py [--processes N] [--quantum Q] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import (Process, schedule_rr_bulk, schedule_rr_metrics,  # noqa: E402
+                       schedule_rr_step_by_step)
+
+
+def random_workload(rng, count, max_arrival, max_burst):
+    return [Process(f'P{i + 1}', rng.randint(0, max_arrival), rng.randint(1, max_burst))
+            for i in range(count)]
+
+
+def results_of(completed):
+    return [(p.id, p.finish_time, p.turnaround, p.waiting) for p in completed]
+
+
+def check_equivalence(rng, trials):
+    for trial in range(trials):
+        count = rng.randint(1, 40)
+        processes = random_workload(rng, count, rng.randint(0, 60), rng.randint(1, 25))
+        quantum = rng.randint(1, 8)
+
+        history = schedule_rr_step_by_step(processes, quantum)
+        fast = schedule_rr_metrics(processes, quantum)
+        assert results_of(fast['completed']) == results_of(history.completed), trial
+        assert fast['current_time'] == history.current_time(-1), trial
+        assert fast['event_count'] == len(history.events), trial
+
+        bulk = schedule_rr_bulk(processes, quantum, gantt='full')
+        assert results_of(bulk['completed']) == results_of(history.completed), trial
+        assert bulk['current_time'] == history.current_time(-1), trial
+        assert bulk['events'] == history.events, trial
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=2000)
+    parser.add_argument('--quantum', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--trials', type=int, default=300,
+                        help="Cargas aleatorias para la verificación de equivalencia")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    check_equivalence(rng, args.trials)
+    print(f"✅ Equivalencia verificada en {args.trials} cargas aleatorias")
+
+    processes = random_workload(rng, args.processes, args.processes, 20)
+    history, slow = timed(schedule_rr_step_by_step, processes, args.quantum)
+    fast_result, fast = timed(schedule_rr_metrics, processes, args.quantum)
+    slices = fast_result['event_count']
+
+    print(f"Procesos: {args.processes}  Quantum: {args.quantum}  Rebanadas: {slices}")
+    print(f"schedule_rr_step_by_step: {slow:8.3f} s  ({slices / slow:12,.0f} rebanadas/s)")
+    print(f"schedule_rr_metrics:      {fast:8.3f} s  ({slices / fast:12,.0f} rebanadas/s)")
+    print(f"Aceleración: {slow / fast:.1f}x")
+
+    # Ráfagas enormes con quantum pequeño: solo el motor por rondas es viable
+    long_jobs = random_workload(rng, 100, 1000, 1_000_000)
+    bulk_result, bulk = timed(schedule_rr_bulk, long_jobs, 1)
+    slices = bulk_result['event_count']
+    print(f"schedule_rr_bulk (100 procesos, ráfagas de hasta 10^6, quantum 1): "
+          f"{bulk:8.3f} s  ({slices:,} rebanadas, {slices / bulk:,.0f} rebanadas/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark de arranque: coste de importar el planificador frente a la GUI.
+
+Cada importación se mide en un intérprete nuevo para que la caché de módulos
+no falsee los resultados. Se reporta el tiempo de arranque (mediana de varias
+repeticiones), la memoria máxima residente y si se cargaron PyQt5/matplotlib.
+
+Uso:
+    python benchmarks/bench_startup.py [--repeat N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+gui = sorted({{m.split('.')[0] for m in sys.modules if m.startswith(('PyQt5', 'matplotlib'))}})
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, rss_kb, ','.join(gui))
+"""
+
+TARGETS = [
+    ('scheduler', 'Núcleo sin GUI'),
+    ('main', 'Lanzador (GUI diferida)'),
+    ('gui', 'Interfaz completa'),
+]
+
+
+def measure(module, repeat):
+    times = []
+    rss = []
+    loaded = ''
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', PROBE.format(module=module)],
+                                cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            return {'module': module, 'error': result.stderr.strip().splitlines()[-1]}
+        elapsed, rss_kb, loaded = (result.stdout.strip().split(' ') + [''])[:3]
+        times.append(float(elapsed))
+        rss.append(int(rss_kb))
+    return {
+        'module': module,
+        'import_ms': round(statistics.median(times) * 1000, 2),
+        'max_rss_mb': round(statistics.median(rss) / 1024, 1),
+        'gui_modules': loaded.split(',') if loaded else [],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='Salida en JSON')
+    args = parser.parse_args()
+
+    results = [measure(module, args.repeat) for module, _ in TARGETS]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for (module, label), result in zip(TARGETS, results):
+        if 'error' in result:
+            print(f"{label:26} ({module}): no disponible - {result['error']}")
+            continue
+        gui = ', '.join(result['gui_modules']) or 'ninguno'
+        print(f"{label:26} ({module}): {result['import_ms']:8.2f} ms  "
+              f"{result['max_rss_mb']:6.1f} MB  GUI cargada: {gui}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""Suite de benchmarks de los motores de simulación con cargas sintéticas.
+
+Para cada generador de ``generators.py`` (uniforme, Poisson, Pareto y por
+ráfagas) y cada tamaño, mide los motores elegidos: tiempo de reloj (el
+mejor de ``--repeat`` ejecuciones), pico de memoria durante la simulación
+(con ``tracemalloc``, en una ejecución aparte para no afectar el tiempo) y
+rebanadas por segundo. Los resultados se escriben en JSON con los datos de
+la versión (commit de git si existe, Python, plataforma), de modo que se
+pueden guardar y comparar entre versiones con ``--baseline``.
+
+La simulación paso a paso guarda el historial completo; por encima de
+``--step-limit`` procesos se omite (queda registrada como omitida).
+
+Uso:
+    python benchmarks/bench_suite.py [--sizes 1e3,1e4,1e5] [--engines step,metrics,bulk]
+        [--workloads uniform,poisson,pareto,bursty] [-o resultados.json]
+        [--baseline anterior.json --tolerance 0.2]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generators import GENERATORS, generate_workload  # noqa: E402
+from scheduler import schedule_rr_bulk, schedule_rr_metrics, schedule_rr_step_by_step  # noqa: E402
+
+ENGINES = {
+    'step': schedule_rr_step_by_step,
+    'metrics': schedule_rr_metrics,
+    'bulk': schedule_rr_bulk,
+}
+
+
+def slice_count(result):
+    if isinstance(result, dict):
+        return result['event_count']
+    return len(result.events)  # StepHistory
+
+
+def measure_time(function, processes, quantum, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(processes, quantum)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def measure_peak(function, processes, quantum):
+    tracemalloc.start()
+    try:
+        function(processes, quantum)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def parse_list(text, choices=None):
+    items = [item.strip() for item in text.split(',') if item.strip()]
+    if choices is not None:
+        for item in items:
+            if item not in choices:
+                raise SystemExit(f"❌ Error: valor desconocido {item!r} (opciones: {', '.join(choices)})")
+    return items
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(args):
+    results = []
+    for kind in args.workloads:
+        for size in args.sizes:
+            processes = generate_workload(kind, size, args.seed, args.load, args.mean_burst)
+            for engine in args.engines:
+                entry = {'workload': kind, 'processes': size, 'engine': engine,
+                         'quantum': args.quantum}
+                if engine == 'step' and size > args.step_limit:
+                    entry['skipped'] = f"más de {args.step_limit} procesos"
+                    results.append(entry)
+                    print(f"{kind:8} {size:>10,} {engine:8} (omitido)", file=sys.stderr)
+                    continue
+                function = ENGINES[engine]
+                result, elapsed = measure_time(function, processes, args.quantum, args.repeat)
+                slices = slice_count(result)
+                del result
+                entry.update({
+                    'slices': slices,
+                    'wall_time': elapsed,
+                    'slices_per_second': slices / elapsed if elapsed else None,
+                })
+                if not args.no_memory:
+                    entry['peak_memory'] = measure_peak(function, processes, args.quantum)
+                results.append(entry)
+                memory = f"{entry['peak_memory'] / 2 ** 20:9.1f} MiB" if 'peak_memory' in entry else ''
+                print(f"{kind:8} {size:>10,} {engine:8} {elapsed:9.3f} s "
+                      f"{entry['slices_per_second']:14,.0f} rebanadas/s {memory}", file=sys.stderr)
+            del processes
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Comparar con otra ejecución; devuelve las regresiones de tiempo"""
+    def key(entry):
+        return entry['workload'], entry['processes'], entry['engine'], entry['quantum']
+
+    previous = {key(entry): entry for entry in baseline['results'] if 'wall_time' in entry}
+    regressions = []
+    print(f"\nComparación con {baseline.get('commit') or 'la línea base'}:", file=sys.stderr)
+    for entry in results:
+        old = previous.get(key(entry))
+        if old is None or 'wall_time' not in entry:
+            continue
+        ratio = entry['wall_time'] / old['wall_time'] if old['wall_time'] else 1.0
+        entry['baseline_ratio'] = ratio
+        mark = ''
+        if ratio > 1 + tolerance:
+            mark = '  ⚠️ regresión'
+            regressions.append(entry)
+        print(f"{entry['workload']:8} {entry['processes']:>10,} {entry['engine']:8} "
+              f"{ratio:6.2f}x{mark}", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='1e3,1e4,1e5',
+                        help="Tamaños de carga separados por comas (por ejemplo 1e3,1e5,1e7)")
+    parser.add_argument('--workloads', default=','.join(GENERATORS),
+                        help=f"Generadores (por defecto: {','.join(GENERATORS)})")
+    parser.add_argument('--engines', default=','.join(ENGINES),
+                        help=f"Motores a medir (por defecto: {','.join(ENGINES)})")
+    parser.add_argument('--quantum', type=int, default=4)
+    parser.add_argument('--load', type=float, default=0.9, help="Carga media del procesador")
+    parser.add_argument('--mean-burst', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Ejecuciones por medición de tiempo; se guarda la mejor (por defecto: 3)")
+    parser.add_argument('--step-limit', type=int, default=100_000,
+                        help="Máximo de procesos para la simulación paso a paso")
+    parser.add_argument('--no-memory', action='store_true', help="No medir el pico de memoria")
+    parser.add_argument('-o', '--output', help="Archivo JSON de resultados ('-' para stdout)")
+    parser.add_argument('--baseline', help="JSON de una ejecución anterior para comparar")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Aumento de tiempo tolerado frente a la línea base (por defecto: 0.2)")
+    args = parser.parse_args()
+    args.sizes = [int(float(size)) for size in parse_list(args.sizes)]
+    args.workloads = parse_list(args.workloads, GENERATORS)
+    args.engines = parse_list(args.engines, ENGINES)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {'quantum': args.quantum, 'load': args.load, 'mean_burst': args.mean_burst,
+                       'seed': args.seed, 'repeat': args.repeat},
+        'results': run_suite(args),
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as stream:
+            regressions = compare(report['results'], json.load(stream), args.tolerance)
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
+    elif args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            json.dump(report, stream, indent=2, ensure_ascii=False)
+            stream.write('\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
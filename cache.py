@@ -0,0 +1,202 @@
+"""Caché de resultados de simulación direccionada por contenido.
+
+La clave de un resultado es un hash de la carga (procesos en el orden en que
+los ve el planificador: por llegada, con desempate estable), del quantum y
+de las opciones que cambian el resultado (política, sobrecarga, CPUs...).
+Cambiar un proceso cambia la clave, así que nunca se devuelve un resultado
+viejo y no hace falta invalidar nada: las entradas que ya no se usan salen
+por antigüedad.
+
+``ResultCache`` tiene dos niveles:
+
+- En memoria: LRU con ``max_entries`` resultados (los mismos objetos, sin
+  copiar; quien los recibe no debe modificarlos).
+- En disco (opcional, ``directory``): un archivo JSON por clave. Los
+  resultados son diccionarios de números, listas y procesos completados;
+  los procesos se guardan como listas de campos y se leen como ``Process``.
+  Leer un archivo nunca ejecuta código, así que el directorio puede venir
+  de otro usuario: un archivo dañado o ajeno cuenta como ausente. Cuando
+  el directorio supera ``max_bytes`` se borran los archivos usados hace más
+  tiempo. Varios procesos pueden compartir el directorio (las escrituras son
+  atómicas).
+
+Este módulo solo usa la biblioteca estándar.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from scheduler import Process
+
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+SUFFIX = '.json'
+# Campos de un proceso en el archivo: ``{"__process__": [id, llegada, ...]}``
+PROCESS_FIELDS = ('id', 'arrival', 'burst', 'priority', 'remaining', 'finish_time',
+                  'turnaround', 'waiting', 'start_time')
+
+
+def workload_digest(processes):
+    """Hash de una carga de procesos sin ejecutar (id, llegada, ráfaga, prioridad)"""
+    rows = [(p.id, p.arrival, p.burst, p.priority)
+            for p in sorted(processes, key=lambda x: x.arrival)]
+    data = json.dumps(rows, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _encode(value):
+    """``default`` de ``json.dump``: procesos (``Process`` o vistas) y secuencias"""
+    if isinstance(value, Sequence):
+        return list(value)
+    if all(hasattr(value, field) for field in PROCESS_FIELDS):
+        return {'__process__': [getattr(value, field) for field in PROCESS_FIELDS]}
+    raise TypeError(f"no se puede guardar en la caché: {type(value).__name__}")
+
+
+def _decode(data):
+    """``object_hook`` de ``json.load``: vuelve a crear los procesos"""
+    fields = data.get('__process__')
+    if fields is None or len(data) != 1:
+        return data
+    values = dict(zip(PROCESS_FIELDS, fields))
+    process = Process(values['id'], values['arrival'], values['burst'], values['priority'])
+    for field in PROCESS_FIELDS[4:]:
+        setattr(process, field, values[field])
+    return process
+
+
+def result_key(digest, quantum, **options):
+    """Clave de un resultado: carga (``workload_digest``), quantum y opciones"""
+    data = json.dumps([digest, quantum, sorted(options.items())], separators=(',', ':'),
+                      ensure_ascii=False, default=str)
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Caché LRU en memoria con un nivel opcional en disco"""
+
+    def __init__(self, max_entries=16, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, _, size in self._disk_entries())
+
+    def __len__(self):
+        return len(self._memory)
+
+    def __contains__(self, key):
+        return key in self._memory or (self.directory is not None
+                                       and os.path.exists(self._path(key)))
+
+    def get(self, key, default=None):
+        """Resultado guardado con ``key`` o ``default``"""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path, encoding='utf-8') as stream:
+                    value = json.load(stream, object_hook=_decode)
+            except (OSError, ValueError, TypeError, KeyError):
+                value = None
+            if value is not None:
+                try:
+                    os.utime(path)  # Marca de uso para el desalojo
+                except OSError:
+                    pass
+                self._remember(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        handle, temporary = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8') as stream:
+                json.dump(value, stream, default=_encode, ensure_ascii=False,
+                          separators=(',', ':'))
+            path = self._path(key)
+            try:
+                replaced = os.path.getsize(path)  # Se sobrescribe una entrada existente
+            except OSError:
+                replaced = 0
+            self._disk_bytes += os.path.getsize(temporary) - replaced
+            os.replace(temporary, path)
+        except BaseException:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def get_or_compute(self, key, compute):
+        """Devolver el resultado de ``key``; si no está, calcularlo con ``compute()`` y guardarlo"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        self._memory.clear()
+        if self.directory is not None:
+            for path, _, _ in self._disk_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._disk_bytes = 0
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def _disk_entries(self):
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(SUFFIX):
+                    try:
+                        info = entry.stat()
+                    except OSError:
+                        continue  # Otro proceso lo borró
+                    entries.append((entry.path, info.st_mtime, info.st_size))
+        return entries
+
+    def _evict(self):
+        # Se vuelve a medir el directorio: otros procesos pueden compartirlo
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        self._disk_bytes = total
@@ -0,0 +1,543 @@
+"""Modo por lotes (sin interfaz gráfica) del simulador Round Robin.
+
+Ejemplos:
+    python cli.py run procesos.csv --quantum 3
+    python cli.py run traza.json -q 4 --format json -o resultados.json
+    cat procesos.csv | python cli.py run - -q 2 --format csv
+    python cli.py sweep carga1.csv carga2.csv --quanta 1:20 --best
+    python cli.py run procesos.csv -q 3 --policy srtf
+    python cli.py compare procesos.csv -q 3 --policies rr,fcfs,sjf,mlfq
+    python cli.py run procesos.csv -q 3 --cpus 8 --queues local --pin P1=0,P2=0
+    python cli.py run procesos.csv -q 2 --switch-cost 1 --warmup 1
+    python cli.py generate pareto -n 100000 --seed 3 -o carga.csv
+    python cli.py run carga.csv -q 4 --trace carga.rrt
+    python cli.py export carga.rrt -o carga.npz
+    python cli.py run carga.csv -q 4 --profile phases
+    python cli.py open --generate poisson --load 0.95 -q 4 --window 1000 --until 1e6
+    python cli.py open --follow llegadas.csv -q 4 --window 500 -f json
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from contextlib import ExitStack, nullcontext
+from functools import partial
+from itertools import islice
+
+from cache import ResultCache, result_key, workload_digest
+from generators import GENERATORS
+from multicore import QUEUE_MODES, parse_affinity, simulate_multicpu
+from opensystem import WINDOW_FIELDS, follow_lines, iter_open_rr, parse_address, socket_lines
+from policies import POLICIES, compare_policies, make_policy, simulate_policy
+from profiling import profile_rr_steps, run_with_cprofile, run_with_tracemalloc
+from scheduler import ENGINES, overhead_metrics, schedule_rr_bulk
+from sweep import METRICS, best_quanta, parse_quanta, sweep_quanta
+from tracefile import EXPORT_FORMATS, TraceReader, TraceWriter
+from workload import (INPUT_FORMATS, OUTPUT_FORMATS, iter_csv, load_processes, write_processes,
+                      write_results)
+
+PROFILE_MODES = ('phases', 'cprofile', 'tracemalloc')
+# Generadores que pueden producir llegadas sin fin (``count=None``)
+STREAM_GENERATORS = [kind for kind in GENERATORS if kind != 'uniform']
+
+
+def positive_number(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"debe ser positivo: {value}")
+    return int(number) if number.is_integer() else number
+
+
+def positive_integer(value):
+    """Entero positivo: los tiempos de las rebanadas deben ser exactos en todos los motores"""
+    number = float(value)
+    if number <= 0 or not number.is_integer():
+        raise argparse.ArgumentTypeError(f"debe ser un entero positivo: {value}")
+    return int(number)
+
+
+def non_negative_integer(value):
+    number = float(value)
+    if number < 0 or not number.is_integer():
+        raise argparse.ArgumentTypeError(f"debe ser un entero no negativo: {value}")
+    return int(number)
+
+
+def affinity_argument(value):
+    """``--pin``: afinidad ``'P1=0,P3=1'`` con CPUs no negativas (el límite se comprueba en ``main``)"""
+    try:
+        affinity = parse_affinity(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
+    for pid, cpu in affinity.items():
+        if cpu < 0:
+            raise argparse.ArgumentTypeError(f"CPU negativa para {pid}: {cpu}")
+    return affinity
+
+
+def check_pin(parser, args):
+    """Las CPUs de ``--pin`` deben existir con ``--cpus``: error de argumentos, no de simulación"""
+    for pid, cpu in (args.pin or {}).items():
+        if cpu >= args.cpus:
+            parser.error(f"argument --pin: CPU fuera de rango para {pid}: {cpu} "
+                         f"(con --cpus {args.cpus} van de 0 a {args.cpus - 1})")
+
+
+def open_output(path):
+    if path in (None, '-'):
+        return sys.stdout, False
+    return open(path, 'w', newline='', encoding='utf-8'), True
+
+
+def cmd_run(args):
+    processes = load_processes(args.input, args.input_format)
+    if not processes:
+        print("❌ Error: No hay procesos para simular", file=sys.stderr)
+        return 1
+
+    multicore = args.cpus > 1 or args.pin
+    if multicore and args.policy != 'rr':
+        raise ValueError("la simulación con varias CPUs solo admite la política 'rr'")
+    if args.profile == 'phases' and (multicore or args.policy != 'rr' or args.trace):
+        raise ValueError("--profile phases mide el Round Robin paso a paso con una CPU "
+                         "(sin --trace); usa cprofile o tracemalloc para el resto")
+
+    # Solo se necesitan las métricas finales: no se generan logs ni pasos.
+    # Con --trace los eventos se escriben al archivo a medida que ocurren
+    affinity = args.pin or {}
+    meta = {'switch_cost': args.switch_cost, 'warmup': args.warmup, 'policy': args.policy}
+    if multicore:
+        meta.update(cpus=args.cpus, queues=args.queues)
+    # Con --profile se mide siempre la simulación: no se usa la caché
+    if args.cache and not args.trace and not args.profile:
+        cache = ResultCache(directory=args.cache, max_bytes=int(args.cache_size * 2 ** 20))
+        # El motor es parte de la clave: con tiempos fraccionarios los motores
+        # pueden diferir en el redondeo
+        key = result_key(workload_digest(processes), args.quantum, kind='run',
+                         engine=args.engine, affinity=sorted(affinity.items()), **meta)
+        result = cache.get_or_compute(key, lambda: simulate(args, processes, multicore, affinity))
+    elif args.profile == 'phases':
+        history, profiler = profile_rr_steps(processes, args.quantum, args.switch_cost, args.warmup)
+        last = len(history) - 1
+        result = {
+            'completed': history.completed,
+            'current_time': history.current_time(last),
+            'event_count': history.slice_count(last),
+            'switches': history.switch_count(last),
+        }
+        print(f"⏱️ Perfil por fases (reloj total {profiler.wall_time():.3f} s):", file=sys.stderr)
+        print(profiler.format_report(), file=sys.stderr)
+    else:
+        def execute():
+            with (TraceWriter(args.trace, quantum=args.quantum, **meta) if args.trace
+                  else nullcontext()) as trace:
+                result = simulate(args, processes, multicore, affinity, trace)
+                if trace is not None:
+                    trace.write_results(result['completed'])
+                    trace.close(makespan=result['current_time'])
+            return result
+
+        if args.profile:
+            hook = run_with_cprofile if args.profile == 'cprofile' else run_with_tracemalloc
+            start = time.perf_counter()
+            result = hook(execute, sys.stderr)
+            elapsed = time.perf_counter() - start
+            rate = f", {result['event_count'] / elapsed:,.0f} rebanadas/s" if elapsed else ''
+            print(f"⏱️ {result['event_count']:,} rebanadas en {elapsed:.3f} s{rate} "
+                  f"(con el costo del perfilador)", file=sys.stderr)
+        else:
+            result = execute()
+    extra = {
+        'quantum': args.quantum,
+        'makespan': result['current_time'],
+        'events': result['event_count'],
+        'context_switches': result['switches'],
+    }
+    if args.policy != 'rr':
+        extra['policy'] = args.policy
+    if multicore:
+        extra['cpus'] = args.cpus
+        extra['queues'] = args.queues
+        extra['cpu_utilization'] = [round(value, 4) for value in result['utilization']]
+        extra['migrations'] = result['migrations']
+        extra['steals'] = result['steals']
+    if args.switch_cost or args.warmup:
+        metrics = overhead_metrics(result['completed'], result['current_time'],
+                                   result['switches'], args.switch_cost + args.warmup)
+        extra['overhead'] = metrics['overhead']
+        extra['cpu_efficiency'] = round(metrics['efficiency'], 4)
+        extra['throughput'] = round(metrics['throughput'], 6)
+
+    stream, close = open_output(args.output)
+    try:
+        write_results(result['completed'], stream, args.format, extra)
+    finally:
+        if close:
+            stream.close()
+    return 0
+
+
+def simulate(args, processes, multicore, affinity, trace=None):
+    overhead = {'switch_cost': args.switch_cost, 'warmup': args.warmup}
+    if multicore:
+        return simulate_multicpu(processes, args.quantum, args.cpus, args.queues, affinity,
+                                 sink=trace, **overhead)
+    if args.policy == 'rr' and trace is not None:
+        return schedule_rr_bulk(processes, args.quantum, sink=trace, **overhead)
+    if args.policy == 'rr':
+        return ENGINES[args.engine](processes, args.quantum, **overhead)
+    return simulate_policy(processes, make_policy(args.policy, args.quantum),
+                           sink=trace, **overhead)
+
+
+def cmd_sweep(args):
+    quanta = parse_quanta(args.quanta)
+    workloads = [load_processes(path, args.input_format) for path in args.inputs]
+    if not any(workloads):
+        print("❌ Error: No hay procesos para simular", file=sys.stderr)
+        return 1
+
+    results = sweep_quanta(workloads, quanta, args.workers, args.engine,
+                           args.switch_cost + args.warmup, args.cache,
+                           int(args.cache_size * 2 ** 20))
+    for result in results:
+        result['input'] = args.inputs[result['workload']]
+    best = best_quanta(results) if args.best else None
+
+    stream, close = open_output(args.output)
+    try:
+        write_sweep(results, best, args.inputs, stream, args.format)
+    finally:
+        if close:
+            stream.close()
+    return 0
+
+
+def cmd_compare(args):
+    processes = load_processes(args.input, args.input_format)
+    if not processes:
+        print("❌ Error: No hay procesos para simular", file=sys.stderr)
+        return 1
+
+    names = [name.strip() for name in args.policies.split(',') if name.strip()]
+    for name in names:
+        if name not in POLICIES:
+            raise ValueError(f"política desconocida: {name!r}")
+    rows = compare_policies(processes, args.quantum, names, args.switch_cost, args.warmup)
+
+    stream, close = open_output(args.output)
+    try:
+        write_comparison(rows, stream, args.format)
+    finally:
+        if close:
+            stream.close()
+    return 0
+
+
+def cmd_generate(args):
+    processes = GENERATORS[args.kind](args.count, args.seed, args.load, args.mean_burst)
+    stream, close = open_output(args.output)
+    try:
+        # Los generadores no asignan prioridades: todas valen 0
+        write_processes(processes, stream, args.format, priority=False)
+    finally:
+        if close:
+            stream.close()
+    return 0
+
+
+def cmd_open(args):
+    with ExitStack() as stack:
+        if args.generate:
+            arrivals = GENERATORS[args.generate](None, args.seed, args.load, args.mean_burst)
+        elif args.listen:
+            arrivals = iter_csv(socket_lines(*parse_address(args.listen)))
+        elif args.follow:
+            arrivals = iter_csv(follow_lines(args.follow, args.poll))
+        elif args.file == '-':
+            arrivals = iter_csv(sys.stdin)
+        else:
+            arrivals = iter_csv(stack.enter_context(open(args.file, newline='', encoding='utf-8')))
+
+        windows = iter_open_rr(arrivals, args.quantum, args.window, args.switch_cost,
+                               args.warmup, args.until)
+        if args.windows:
+            windows = islice(windows, args.windows)
+        stream, close = open_output(args.output)
+        if close:
+            stack.callback(stream.close)
+        try:
+            write_windows(windows, stream, args.format)
+        except KeyboardInterrupt:
+            pass  # Ctrl+C termina la simulación; las ventanas escritas quedan
+    return 0
+
+
+def cmd_export(args):
+    output = args.output or os.path.splitext(args.input)[0] + '.npz'
+    ext = os.path.splitext(output)[1].lower()
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"formato de exportación desconocido: {ext!r} "
+                         f"(opciones: {', '.join(EXPORT_FORMATS)})")
+    with TraceReader(args.input) as reader:
+        if ext == '.npz':
+            EXPORT_FORMATS[ext](reader, output, args.compress)
+        else:
+            EXPORT_FORMATS[ext](reader, output)
+    return 0
+
+
+def write_comparison(rows, stream, fmt):
+    columns = ['policy', 'avg_turnaround', 'avg_waiting', 'context_switches', 'makespan']
+    if fmt == 'json':
+        json.dump({'results': [{key: row[key] for key in columns} for row in rows]},
+                  stream, ensure_ascii=False)
+        stream.write('\n')
+        return
+
+    if fmt == 'csv':
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([row[key] for key in columns])
+        return
+
+    stream.write("Política                        | Tr prom | Te prom | Cambios de contexto | Makespan\n")
+    stream.write("--------------------------------|---------|---------|---------------------|---------\n")
+    for row in rows:
+        stream.write(f"{row['label']:31} | {row['avg_turnaround']:7.2f} | {row['avg_waiting']:7.2f} | "
+                     f"{row['context_switches']:19} | {row['makespan']}\n")
+
+
+def write_windows(windows, stream, fmt):
+    """Escribir cada ventana del sistema abierto apenas se publica"""
+    if fmt == 'json':
+        # Una línea JSON por ventana: el flujo puede no terminar
+        for window in windows:
+            json.dump(window, stream, ensure_ascii=False)
+            stream.write('\n')
+            stream.flush()
+        return
+
+    if fmt == 'csv':
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(WINDOW_FIELDS)
+        stream.flush()
+        for window in windows:
+            writer.writerow(['' if window[key] is None else window[key] for key in WINDOW_FIELDS])
+            stream.flush()
+        return
+
+    def triple(metric):
+        values = [window[f'{metric}_p{p}'] for p in (50, 95, 99)]
+        return '/'.join('-' if value is None else f'{value:g}' for value in values)
+
+    stream.write("Ventana               | Llegadas | Compl. | Throughput | Tr p50/p95/p99     | "
+                 "Te p50/p95/p99     | Cola media/máx\n")
+    stream.write("----------------------|----------|--------|------------|--------------------|"
+                 "--------------------|---------------\n")
+    stream.flush()
+    for window in windows:
+        span = f"{window['start']:g}–{window['end']:g}"
+        stream.write(f"{span:21} | {window['arrivals']:8} | {window['completed']:6} | "
+                     f"{window['throughput']:10.4f} | {triple('turnaround'):18} | "
+                     f"{triple('waiting'):18} | {window['queue_mean']:.2f}/{window['queue_max']}\n")
+        stream.flush()
+
+
+def write_sweep(results, best, inputs, stream, fmt):
+    columns = ['input', 'quantum', 'avg_turnaround', 'avg_waiting',
+               'context_switches', 'makespan']
+    if fmt == 'json':
+        data = {'results': [{key: result[key] for key in columns} for result in results]}
+        if best is not None:
+            data['best'] = {inputs[idx]: entry for idx, entry in best.items()}
+        json.dump(data, stream, ensure_ascii=False)
+        stream.write('\n')
+        return
+
+    if fmt == 'csv':
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(columns)
+        for result in results:
+            writer.writerow([result[key] for key in columns])
+        if best is not None:
+            for idx, entry in best.items():
+                for metric in METRICS:
+                    stream.write(f"# best,{inputs[idx]},{metric},{entry[metric]['quantum']}\n")
+        return
+
+    stream.write("Carga | Quantum | Tr prom | Te prom | Cambios de contexto | Makespan\n")
+    stream.write("------|---------|---------|---------|---------------------|---------\n")
+    for result in results:
+        stream.write(f"{result['input']} | {result['quantum']:7} | {result['avg_turnaround']:7.2f} | "
+                     f"{result['avg_waiting']:7.2f} | {result['context_switches']:19} | "
+                     f"{result['makespan']}\n")
+    if best is not None:
+        stream.write("\n🏆 Mejor quantum por métrica:\n")
+        for idx, entry in best.items():
+            choices = ', '.join(f"{metric} → {entry[metric]['quantum']}" for metric in METRICS)
+            stream.write(f"   {inputs[idx]}: {choices}\n")
+
+
+def add_cache_arguments(parser):
+    parser.add_argument('--cache', metavar='DIR',
+                        help="Directorio de la caché de resultados en disco (se reutiliza entre ejecuciones)")
+    parser.add_argument('--cache-size', type=positive_number, default=256, metavar='MB',
+                        help="Tamaño máximo de la caché en disco (por defecto: 256 MB)")
+
+
+def add_overhead_arguments(parser):
+    parser.add_argument('--switch-cost', type=non_negative_integer, default=0,
+                        help="Sobrecarga por cambio de contexto, cobrada solo cuando cambia "
+                             "el proceso en ejecución (por defecto: 0)")
+    parser.add_argument('--warmup', type=non_negative_integer, default=0,
+                        help="Calentamiento de caché que se suma a cada cambio de contexto (por defecto: 0)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description="Simulador Round Robin en modo por lotes")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help="Simular una carga de trabajo desde archivo o stdin")
+    run.add_argument('input', help="Archivo CSV/JSON con (llegada, ráfaga); '-' para stdin")
+    run.add_argument('-q', '--quantum', type=positive_integer, default=3,
+                     help="Quantum del Round Robin (por defecto: 3)")
+    run.add_argument('--engine', choices=sorted(ENGINES), default='metrics',
+                     help="Motor de simulación: 'metrics' simula rebanada por rebanada; 'bulk' salta "
+                          "rondas completas y conviene cuando las ráfagas son mucho más largas que el "
+                          "quantum (por defecto: metrics)")
+    run.add_argument('--policy', choices=list(POLICIES), default='rr',
+                     help="Política de planificación; --engine solo aplica a 'rr' (por defecto: rr)")
+    run.add_argument('--cpus', type=positive_integer, default=1,
+                     help="Número de CPUs; con más de una se simula Round Robin multiprocesador (por defecto: 1)")
+    run.add_argument('--queues', choices=QUEUE_MODES, default='global',
+                     help="Con varias CPUs: cola 'global' compartida o 'local' por CPU con robo de trabajo "
+                          "(por defecto: global)")
+    run.add_argument('--pin', type=affinity_argument,
+                     help="Afinidad de procesos a CPUs (de 0 a --cpus menos 1), por ejemplo 'P1=0,P3=1'")
+    add_overhead_arguments(run)
+    run.add_argument('--input-format', choices=INPUT_FORMATS,
+                     help="Formato de entrada (por defecto se deduce)")
+    run.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='table',
+                     help="Formato de salida (por defecto: table)")
+    run.add_argument('-o', '--output', help="Archivo de salida (por defecto: stdout)")
+    run.add_argument('--trace', help="Escribir la traza binaria de eventos (.rrt) durante la simulación")
+    add_cache_arguments(run)
+    run.add_argument('--profile', choices=PROFILE_MODES,
+                     help="Perfilar la simulación e informar en stderr: 'phases' mide cada fase del "
+                          "Round Robin paso a paso, 'cprofile' las funciones más costosas y "
+                          "'tracemalloc' el pico de memoria y dónde se reserva")
+    run.set_defaults(handler=cmd_run, validate=partial(check_pin, run))
+
+    compare = subparsers.add_parser(
+        'compare', help="Comparar políticas de planificación sobre la misma carga")
+    compare.add_argument('input', help="Archivo CSV/JSON de procesos; '-' para stdin")
+    compare.add_argument('-q', '--quantum', type=positive_integer, default=3,
+                         help="Quantum de las políticas que lo usan (por defecto: 3)")
+    compare.add_argument('-P', '--policies', default=','.join(POLICIES),
+                         help=f"Políticas separadas por comas (por defecto: {','.join(POLICIES)})")
+    add_overhead_arguments(compare)
+    compare.add_argument('--input-format', choices=INPUT_FORMATS,
+                         help="Formato de entrada (por defecto se deduce)")
+    compare.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='table',
+                         help="Formato de salida (por defecto: table)")
+    compare.add_argument('-o', '--output', help="Archivo de salida (por defecto: stdout)")
+    compare.set_defaults(handler=cmd_compare)
+
+    sweep = subparsers.add_parser(
+        'sweep', help="Evaluar un rango o lista de quanta sobre una o varias cargas en paralelo")
+    sweep.add_argument('inputs', nargs='+', help="Archivos CSV/JSON de procesos; '-' para stdin")
+    sweep.add_argument('-Q', '--quanta', default='1:10',
+                       help="Rango inclusivo 'inicio:fin[:paso]' o lista '1,2,4,8' (por defecto: 1:10)")
+    sweep.add_argument('-j', '--workers', type=int,
+                       help="Procesos trabajadores (por defecto: uno por núcleo)")
+    sweep.add_argument('--engine', choices=sorted(ENGINES), default='metrics',
+                       help="Motor de simulación (por defecto: metrics)")
+    add_overhead_arguments(sweep)
+    add_cache_arguments(sweep)
+    sweep.add_argument('--best', action='store_true',
+                       help="Informar el mejor quantum de cada carga para cada métrica")
+    sweep.add_argument('--input-format', choices=INPUT_FORMATS,
+                       help="Formato de entrada (por defecto se deduce)")
+    sweep.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='table',
+                       help="Formato de salida (por defecto: table)")
+    sweep.add_argument('-o', '--output', help="Archivo de salida (por defecto: stdout)")
+    sweep.set_defaults(handler=cmd_sweep)
+
+    generate = subparsers.add_parser(
+        'generate', help="Generar una carga de trabajo sintética")
+    generate.add_argument('kind', choices=list(GENERATORS),
+                          help="Distribución: llegadas uniformes, de Poisson, ráfagas de Pareto o por grupos")
+    generate.add_argument('-n', '--count', type=int, default=1000,
+                          help="Número de procesos (por defecto: 1000)")
+    generate.add_argument('--seed', type=int, default=0, help="Semilla (por defecto: 0)")
+    generate.add_argument('--load', type=positive_number, default=0.9,
+                          help="Carga media del procesador (por defecto: 0.9)")
+    generate.add_argument('--mean-burst', type=int, default=10,
+                          help="Ráfaga media (por defecto: 10)")
+    generate.add_argument('-f', '--format', choices=INPUT_FORMATS, default='csv',
+                          help="Formato de salida (por defecto: csv)")
+    generate.add_argument('-o', '--output', help="Archivo de salida (por defecto: stdout)")
+    generate.set_defaults(handler=cmd_generate)
+
+    online = subparsers.add_parser(
+        'open', help="Sistema abierto: llegadas continuas y métricas por ventana de tiempo")
+    source = online.add_mutually_exclusive_group(required=True)
+    source.add_argument('--generate', choices=STREAM_GENERATORS,
+                        help="Llegadas sintéticas sin fin del generador indicado")
+    source.add_argument('--file', metavar='FILE',
+                        help="Llegadas de un CSV en orden de llegada ('-' para stdin)")
+    source.add_argument('--follow', metavar='FILE',
+                        help="Como --file, pero esperando las líneas nuevas (como tail -f)")
+    source.add_argument('--listen', metavar='[HOST:]PORT',
+                        help="Recibir llegadas CSV por TCP, de un cliente tras otro")
+    online.add_argument('-q', '--quantum', type=positive_integer, default=3,
+                        help="Quantum del Round Robin (por defecto: 3)")
+    add_overhead_arguments(online)
+    online.add_argument('-w', '--window', type=positive_number, default=1000,
+                        help="Duración de cada ventana de métricas en tiempo simulado (por defecto: 1000)")
+    online.add_argument('--until', type=positive_number,
+                        help="Detener la simulación en este tiempo simulado")
+    online.add_argument('--windows', type=int,
+                        help="Detener la simulación después de publicar estas ventanas")
+    online.add_argument('--seed', type=int, default=0, help="Semilla de --generate (por defecto: 0)")
+    online.add_argument('--load', type=positive_number, default=0.9,
+                        help="Carga media de --generate (por defecto: 0.9)")
+    online.add_argument('--mean-burst', type=int, default=10,
+                        help="Ráfaga media de --generate (por defecto: 10)")
+    online.add_argument('--poll', type=positive_number, default=0.5,
+                        help="Segundos entre lecturas de --follow sin líneas nuevas (por defecto: 0.5)")
+    online.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='table',
+                        help="Formato de salida; json escribe una línea por ventana (por defecto: table)")
+    online.add_argument('-o', '--output', help="Archivo de salida (por defecto: stdout)")
+    online.set_defaults(handler=cmd_open)
+
+    export = subparsers.add_parser(
+        'export', help="Convertir una traza .rrt a un formato columnar (.npz o .parquet)")
+    export.add_argument('input', help="Archivo de traza .rrt")
+    export.add_argument('-o', '--output',
+                        help="Archivo de salida; el formato se deduce de la extensión (por defecto: .npz)")
+    export.add_argument('--compress', action='store_true', help="Comprimir el .npz")
+    export.set_defaults(handler=cmd_export)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'validate', None) is not None:
+        args.validate(args)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError, KeyError, RuntimeError) as error:
+        print(f"❌ Error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
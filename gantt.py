@@ -0,0 +1,497 @@
+"""Diagrama de Gantt incremental con matplotlib.
+
+En lugar de limpiar la figura y volver a dibujar todas las barras en cada
+paso, ``GanttRenderer`` conserva los ejes y una sola ``PolyCollection`` por
+proceso. Cada evento nuevo agrega sus vértices a la colección de su proceso
+y se pinta con *blitting* sobre el fondo guardado, así que el coste por paso
+no depende de cuántos eventos haya en el historial. Solo se redibuja la
+figura completa cuando cambia la escala: aparece un proceso nuevo (otra
+fila) o el tiempo sobrepasa el límite del eje X, que crece con holgura.
+
+Para líneas de tiempo con millones de rebanadas, ``LodGanttView`` dibuja
+resúmenes de ocupación a varias resoluciones (``GanttSummary``) según la
+ventana visible y el nivel de zoom. La misma vista puede agrupar las filas
+por otro campo del evento, por ejemplo una fila por CPU en la simulación
+con varios procesadores.
+"""
+import numpy as np
+from matplotlib import cm
+from matplotlib.collections import PolyCollection
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+from scheduler import CONTEXT_SWITCH
+
+BAR_HEIGHT = 0.6
+SWITCH_COLOR = '#9e9e9e'  # Segmentos de cambio de contexto
+# Más allá de este número de barras no se agregan etiquetas (serían ilegibles
+# y cada una es un artista más que redibujar)
+LABEL_LIMIT = 300
+
+
+class ProcessBars(PolyCollection):
+    """Barras de un proceso; los vértices nuevos se aplican al dibujar"""
+
+    def __init__(self, color):
+        super().__init__([], facecolors=[color], edgecolors='white', linewidths=1, alpha=0.8)
+        self.bars = []
+        self._pending = False
+
+    def add_bar(self, start, end, row):
+        low, high = row - BAR_HEIGHT / 2, row + BAR_HEIGHT / 2
+        self.bars.append(((start, low), (start, high), (end, high), (end, low)))
+        self._pending = True
+
+    def remove_last(self):
+        self.bars.pop()
+        self._pending = True
+
+    def draw(self, renderer):
+        if self._pending:
+            self.set_verts(self.bars)
+            self._pending = False
+        super().draw(renderer)
+
+
+class GanttRenderer:
+    """Dibuja los eventos ``(pid, inicio, fin, ...)`` de forma incremental"""
+
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.reset()
+
+    def reset(self):
+        """Volver al diagrama vacío"""
+        self.figure.clear()
+        self.ax = self.figure.add_subplot(111, facecolor='#2b2b2b')
+        self.rows = {}  # pid -> fila, en orden de primera aparición
+        self.row_starts = []  # Índice del primer evento de cada fila
+        self.collections = []
+        self.count = 0  # Eventos ya dibujados
+        self.labels = 0
+        self.x_limit = 0
+        self.x_limits = []  # (evento, límite) de cada ampliación del eje X
+        self._background = None
+
+        ax = self.ax
+        ax.set_xlabel('Tiempo (ms)', color='white', fontsize=12)
+        ax.set_ylabel('Procesos', color='white', fontsize=12)
+        ax.tick_params(colors='white')
+        ax.spines['bottom'].set_color('white')
+        ax.spines['left'].set_color('white')
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.xaxis.grid(True, color='gray', linestyle='--', alpha=0.3)
+        ax.set_yticks([])
+        ax.set_xlim(0, 10)
+        # El título cambia en cada paso: se dibuja aparte, fuera del fondo
+        ax.title.set_animated(True)
+        ax.set_title('Diagrama de Gantt - Round Robin (Esperando eventos...)',
+                     color='white', fontsize=14, fontweight='bold')
+
+    def sync(self, events, count, step):
+        """Mostrar los primeros ``count`` eventos de ``events`` en el paso ``step``.
+
+        Solo se dibujan los eventos nuevos desde la última llamada; si
+        ``count`` es menor que lo ya dibujado (retroceso), se quitan las
+        barras sobrantes y se redibuja la figura.
+        """
+        rescale = self._background is None
+        if count < self.count:
+            self._truncate(events, count)
+            rescale = True
+
+        new_events = events[self.count:count]
+        labels_before = len(self.ax.texts)
+        for index, event in enumerate(new_events, self.count):
+            rescale |= self._add_event(event, index)
+        self.count = count
+
+        if count:
+            self.ax.set_title(f'Diagrama de Gantt - Round Robin (Paso {step + 1})',
+                              color='white', fontsize=14, fontweight='bold')
+
+        if rescale:
+            self.redraw()
+        else:
+            self._blit(new_events, self.ax.texts[labels_before:])
+
+    def redraw(self):
+        """Redibujar la figura completa (por ejemplo, tras cambiar la escala)"""
+        self.figure.tight_layout()
+        self.canvas.draw()
+
+    def _add_event(self, event, index):
+        """Agregar un evento; devuelve True si cambia la escala de los ejes"""
+        pid, start, end = event[0], event[1], event[2]
+        rescale = False
+
+        row = self.rows.get(pid)
+        if row is None:
+            row = len(self.rows)
+            self.rows[pid] = row
+            self.row_starts.append(index)
+            collection = ProcessBars(SWITCH_COLOR if pid == CONTEXT_SWITCH else cm.Set3(row % cm.Set3.N))
+            self.ax.add_collection(collection)
+            self.collections.append(collection)
+            self.ax.set_yticks(range(len(self.rows)))
+            self.ax.set_yticklabels(list(self.rows))
+            self.ax.set_ylim(-0.5, len(self.rows) - 0.5)
+            rescale = True
+
+        if end > self.x_limit:
+            # Holgura geométrica: el eje X se reescala pocas veces
+            self.x_limit = max(10, end * 1.5)
+            self.x_limits.append((index, self.x_limit))
+            self.ax.set_xlim(0, self.x_limit)
+            rescale = True
+
+        self.collections[row].add_bar(start, end, row)
+
+        if self.labels < LABEL_LIMIT:
+            self.labels += 1
+            self.ax.text(start + (end - start) / 2, row, f'{pid}',
+                         ha='center', va='center', fontweight='bold', fontsize=10)
+        return rescale
+
+    def _truncate(self, events, count):
+        """Quitar los eventos desde ``count``; el coste depende de los quitados"""
+        if not count:
+            self.reset()
+            return
+        for event in reversed(events[count:self.count]):
+            self.collections[self.rows[event[0]]].remove_last()
+        for text in self.ax.texts[count:]:
+            text.remove()
+        self.labels = min(self.labels, count)
+        self.count = count
+
+        # Filas de procesos que aún no habían aparecido en el paso destino
+        if self.row_starts and self.row_starts[-1] >= count:
+            while self.row_starts and self.row_starts[-1] >= count:
+                self.row_starts.pop()
+                self.collections.pop().remove()
+                self.rows.popitem()
+            self.ax.set_yticks(range(len(self.rows)))
+            self.ax.set_yticklabels(list(self.rows))
+            self.ax.set_ylim(-0.5, len(self.rows) - 0.5)
+
+        # Mismo límite del eje X que tendría el diagrama dibujado desde cero
+        while self.x_limits[-1][0] >= count:
+            self.x_limits.pop()
+        self.x_limit = self.x_limits[-1][1]
+        self.ax.set_xlim(0, self.x_limit)
+
+    def _blit(self, new_events, new_labels):
+        """Pintar solo las barras nuevas sobre el fondo guardado"""
+        canvas = self.canvas
+        canvas.restore_region(self._background)
+        for event in new_events:
+            pid, start, end = event[0], event[1], event[2]
+            row = self.rows[pid]
+            collection = self.collections[row]
+            bar = Rectangle((start, row - BAR_HEIGHT / 2), end - start, BAR_HEIGHT,
+                            facecolor=collection.get_facecolor()[0], edgecolor='white',
+                            linewidth=1)
+            bar.set_transform(self.ax.transData)
+            bar.set_figure(self.figure)
+            bar.set_clip_box(self.ax.bbox)
+            self.ax.draw_artist(bar)
+        for text in new_labels:
+            self.ax.draw_artist(text)
+
+        self._background = canvas.copy_from_bbox(self.figure.bbox)
+        self.ax.draw_artist(self.ax.title)
+        canvas.blit(self.figure.bbox)
+
+    def _on_draw(self, event):
+        # Tras cada dibujo completo se guarda el fondo (sin el título animado)
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.ax.draw_artist(self.ax.title)
+
+
+class GanttSummary:
+    """Resúmenes de ocupación por proceso a varias resoluciones.
+
+    El nivel 0 divide la línea de tiempo en contenedores (bins) de igual
+    ancho y guarda, para cada proceso, la fracción de cada contenedor en la
+    que ocupó la CPU; cada nivel siguiente promedia pares de contenedores
+    del anterior. Una consulta por ventana visible elige el nivel cuyo ancho
+    de contenedor se acerca al ancho de un píxel, así que su coste depende
+    de los píxeles y las filas, no del número de eventos.
+
+    Las filas se agrupan por el campo ``lane`` de cada evento (por defecto
+    el proceso); ``lanes`` fija de antemano el orden de las filas.
+    """
+    MAX_CELLS = 1 << 22  # Límite de celdas (filas x contenedores) del nivel 0
+    MAX_BINS = 1 << 15
+    MIN_BINS = 256
+    DETAIL_LIMIT = 5000  # Eventos máximos para dibujar barras reales al acercar
+
+    def __init__(self, events, lane=0, lanes=()):
+        self.rows = {key: row for row, key in enumerate(lanes)}
+        processes = {}
+        row_of, codes, starts, ends = [], [], [], []
+        for event in events:
+            key = event[lane]
+            row = self.rows.get(key)
+            if row is None:
+                row = self.rows[key] = len(self.rows)
+            code = processes.get(event[0])
+            if code is None:
+                code = processes[event[0]] = len(processes)
+            row_of.append(row)
+            codes.append(code)
+            starts.append(event[1])
+            ends.append(event[2])
+        self._build(np.asarray(row_of, dtype=np.int64), np.asarray(codes, dtype=np.int64),
+                    np.asarray(starts, dtype=float), np.asarray(ends, dtype=float))
+
+    @classmethod
+    def from_columns(cls, pids, starts, ends, names, cpus=None, lanes=()):
+        """Resúmenes a partir de columnas de NumPy, sin recorrer los eventos en Python.
+
+        ``pids`` son índices en ``names`` (como en ``TraceReader.event_columns``);
+        con ``cpus`` las filas son las CPUs, en el orden de ``lanes``.
+        """
+        summary = cls.__new__(cls)
+        # Cada proceso recibe su código en el orden en que aparece por primera vez
+        unique, first = np.unique(pids, return_index=True)
+        order = np.argsort(first, kind='stable')
+        rank = np.empty(len(unique), dtype=np.int64)
+        rank[order] = np.arange(len(unique))
+        codes = rank[np.searchsorted(unique, pids)]
+        if cpus is None:
+            summary.rows = {names[pid]: row for row, pid in enumerate(unique[order])}
+            row_of = codes
+        else:
+            summary.rows = {key: row for row, key in enumerate(lanes)}
+            keys, first = np.unique(cpus, return_index=True)
+            for key in keys[np.argsort(first, kind='stable')].tolist():
+                summary.rows.setdefault(key, len(summary.rows))
+            lookup = np.array([summary.rows[key] for key in keys.tolist()], dtype=np.int64)
+            row_of = lookup[np.searchsorted(keys, cpus)]
+        summary._build(row_of, codes, np.asarray(starts, dtype=float), np.asarray(ends, dtype=float))
+        return summary
+
+    def _build(self, row_of, codes, starts, ends):
+        self.end_time = float(ends.max()) if ends.size else 0.0
+
+        # Eventos ordenados por inicio para el modo detallado
+        order = np.argsort(starts, kind='stable')
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.event_rows = row_of[order]
+        self.event_codes = codes[order]  # Proceso de cada evento (para el color)
+        self.max_duration = float((ends - starts).max()) if ends.size else 0.0
+
+        n_rows = max(1, len(self.rows))
+        bins = min(self.MAX_BINS, max(self.MIN_BINS, self.MAX_CELLS // n_rows))
+        bins = max(1, min(bins, int(np.ceil(self.end_time))))
+        self.bin_width = self.end_time / bins if self.end_time else 1.0
+        self.levels = [self._occupancy(row_of, starts, ends, n_rows, bins)]
+        while self.levels[-1].shape[1] > self.MIN_BINS:
+            level = self.levels[-1]
+            if level.shape[1] % 2:
+                level = np.pad(level, ((0, 0), (0, 1)))
+            self.levels.append((level[:, 0::2] + level[:, 1::2]) / 2)
+
+    def _occupancy(self, row_of, starts, ends, n_rows, bins):
+        # La ocupación de un intervalo [s, e) es la diferencia de dos rampas;
+        # cada rampa se codifica con dos valores que, al acumular, dan la
+        # fracción ocupada de cada contenedor.
+        diff = np.zeros((n_rows, bins + 2), dtype=np.float64)
+        for positions, sign in ((starts, 1.0), (ends, -1.0)):
+            scaled = np.clip(positions / self.bin_width, 0, bins)
+            whole = np.floor(scaled).astype(np.int64)
+            frac = scaled - whole
+            np.add.at(diff, (row_of, whole), sign * (1 - frac))
+            np.add.at(diff, (row_of, whole + 1), sign * frac)
+        occupancy = np.cumsum(diff, axis=1)[:, :bins]
+        # Descartar el residuo de redondeo que deja la suma acumulada
+        occupancy[occupancy < 1e-9] = 0
+        return occupancy.clip(0, 1).astype(np.float32)
+
+    def query(self, t0, t1, pixels):
+        """Ocupación visible en ``[t0, t1]`` con unas ``pixels`` columnas.
+
+        Devuelve ``(matriz, inicio, fin)``: una matriz (filas, columnas) con
+        la ocupación de cada contenedor y el intervalo de tiempo que cubre.
+        """
+        desired = max(t1 - t0, 1e-12) / max(1, pixels)
+        level = int(np.clip(np.floor(np.log2(max(desired / self.bin_width, 1))),
+                            0, len(self.levels) - 1))
+        width = self.bin_width * (1 << level)
+        data = self.levels[level]
+        first = int(np.clip(np.floor(t0 / width), 0, data.shape[1] - 1))
+        last = int(np.clip(np.ceil(t1 / width), first + 1, data.shape[1]))
+        return data[:, first:last], first * width, last * width
+
+    def events_in(self, t0, t1):
+        """Eventos que se solapan con ``[t0, t1]``, o None si son demasiados"""
+        low = np.searchsorted(self.starts, t0 - self.max_duration, side='left')
+        high = np.searchsorted(self.starts, t1, side='right')
+        if high - low > self.DETAIL_LIMIT * 2:
+            return None
+        visible = np.arange(low, high)
+        visible = visible[self.ends[visible] > t0]
+        if visible.size > self.DETAIL_LIMIT:
+            return None
+        return (self.event_rows[visible], self.event_codes[visible],
+                self.starts[visible], self.ends[visible])
+
+
+class LodGanttView:
+    """Gantt con nivel de detalle, desplazamiento y zoom para líneas enormes.
+
+    Lejos, cada proceso se pinta como una franja cuya opacidad es su
+    ocupación en cada contenedor visible (una sola imagen para todas las
+    filas). Al acercarse lo suficiente se dibujan las barras reales de los
+    eventos visibles. La rueda del ratón acerca/aleja alrededor del cursor y
+    arrastrar con el botón izquierdo desplaza; cada cambio de ventana solo
+    vuelve a consultar el rango visible.
+
+    Con ``lane``/``lanes`` las filas son otro campo del evento (por ejemplo,
+    la CPU); las barras detalladas conservan el color de cada proceso.
+    """
+    ZOOM_STEP = 1.25
+
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        self.summary = None
+        self._pan = None
+        self._updating = False
+        canvas.mpl_connect('scroll_event', self._on_scroll)
+        canvas.mpl_connect('button_press_event', self._on_press)
+        canvas.mpl_connect('motion_notify_event', self._on_motion)
+        canvas.mpl_connect('button_release_event', self._on_release)
+        self.set_events([])
+
+    def set_events(self, events, lane=0, lanes=None):
+        """Reconstruir los resúmenes a partir de una lista de eventos.
+
+        ``lanes`` (clave -> nombre) fija el orden y el nombre de las filas
+        cuando se agrupan por el campo ``lane``.
+        """
+        lanes = lanes or {}
+        self._show(GanttSummary(events, lane, lanes), lanes, 'CPUs' if lane else 'Procesos')
+
+    def set_trace(self, reader):
+        """Mostrar una traza de ``tracefile.TraceReader`` (una fila por CPU si la tiene)"""
+        columns = reader.event_columns()
+        cpus = reader.meta.get('cpus')
+        if cpus:
+            lanes = {cpu: f'CPU {cpu}' for cpu in range(cpus)}
+            summary = GanttSummary.from_columns(columns['pid'], columns['start'], columns['end'],
+                                                reader.names, columns['cpu'], lanes)
+        else:
+            lanes = {}
+            summary = GanttSummary.from_columns(columns['pid'], columns['start'], columns['end'],
+                                                reader.names)
+        self._show(summary, lanes, 'CPUs' if cpus else 'Procesos')
+
+    def _show(self, summary, lanes, ylabel):
+        self.summary = summary
+        self.figure.clear()
+        ax = self.ax = self.figure.add_subplot(111, facecolor='#2b2b2b')
+        ax.set_xlabel('Tiempo (ms)', color='white', fontsize=12)
+        ax.set_ylabel(ylabel, color='white', fontsize=12)
+        ax.tick_params(colors='white')
+        ax.spines['bottom'].set_color('white')
+        ax.spines['left'].set_color('white')
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.xaxis.grid(True, color='gray', linestyle='--', alpha=0.3)
+
+        names = [lanes.get(key, key) for key in self.summary.rows]
+        n_rows = max(1, len(names))
+        self.colors = np.array([cm.Set3(row % cm.Set3.N) for row in range(n_rows)])
+        self.palette = np.array([cm.Set3(i) for i in range(cm.Set3.N)])
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=min(n_rows, 20), integer=True))
+        ax.yaxis.set_major_formatter(FuncFormatter(
+            lambda value, _: names[int(value)] if 0 <= value < len(names) and value == int(value) else ''))
+        ax.set_ylim(-0.5, n_rows - 0.5)
+        ax.set_title(f'Diagrama de Gantt - Vista LOD ({len(self.summary.starts):,} eventos)',
+                     color='white', fontsize=14, fontweight='bold')
+
+        self.image = ax.imshow(np.zeros((n_rows, 1, 4)), aspect='auto', origin='lower',
+                               interpolation='nearest', extent=(0, 1, -0.5, n_rows - 0.5))
+        self.bars = PolyCollection([], edgecolors='white', linewidths=0.5)
+        ax.add_collection(self.bars)
+
+        ax.set_xlim(0, max(self.summary.end_time, 1))
+        ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        self.refresh()
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def refresh(self):
+        """Volver a consultar la ventana visible y actualizar los artistas"""
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            t0, t1 = self.ax.get_xlim()
+            pixels = max(1, int(self.ax.bbox.width))
+            detail = None
+            if (t1 - t0) / pixels < self.summary.bin_width:
+                detail = self.summary.events_in(t0, t1)
+
+            if detail is not None:
+                rows, codes, starts, ends = detail
+                low, high = rows - BAR_HEIGHT / 2, rows + BAR_HEIGHT / 2
+                verts = np.stack([np.column_stack([starts, low]), np.column_stack([starts, high]),
+                                  np.column_stack([ends, high]), np.column_stack([ends, low])], axis=1)
+                self.bars.set_verts(verts)
+                self.bars.set_facecolors(self.palette[codes % len(self.palette)] if codes.size else [])
+                self.bars.set_visible(True)
+                self.image.set_visible(False)
+            else:
+                occupancy, start, end = self.summary.query(t0, t1, pixels)
+                rgba = np.empty(occupancy.shape + (4,), dtype=np.float32)
+                rgba[..., :3] = self.colors[:occupancy.shape[0], None, :3]
+                # Cualquier ocupación se ve; la opacidad indica su intensidad relativa
+                peak = float(occupancy.max()) if occupancy.size else 0.0
+                rgba[..., 3] = np.where(occupancy > 0, 0.5 + 0.45 * np.sqrt(occupancy / (peak or 1)), 0)
+                self.image.set_data(rgba)
+                self.image.set_extent((start, end, -0.5, max(1, occupancy.shape[0]) - 0.5))
+                self.image.set_visible(True)
+                self.bars.set_visible(False)
+        finally:
+            self._updating = False
+
+    def _set_xlim(self, t0, t1):
+        total = max(self.summary.end_time, 1)
+        span = min(max(t1 - t0, 1e-6), total)
+        t0 = min(max(t0, 0), total - span)
+        self.ax.set_xlim(t0, t0 + span)
+
+    def _on_xlim_changed(self, ax):
+        self.refresh()
+        self.canvas.draw_idle()
+
+    def _on_scroll(self, event):
+        if event.inaxes is not self.ax:
+            return
+        t0, t1 = self.ax.get_xlim()
+        factor = 1 / self.ZOOM_STEP if event.button == 'up' else self.ZOOM_STEP
+        center = event.xdata
+        self._set_xlim(center - (center - t0) * factor, center + (t1 - center) * factor)
+
+    def _on_press(self, event):
+        if event.inaxes is self.ax and event.button == 1:
+            self._pan = (event.x, self.ax.get_xlim())
+
+    def _on_motion(self, event):
+        if self._pan is None or event.x is None:
+            return
+        press_x, (t0, t1) = self._pan
+        shift = (event.x - press_x) * (t1 - t0) / max(1, self.ax.bbox.width)
+        self._set_xlim(t0 - shift, t1 - shift)
+
+    def _on_release(self, event):
+        self._pan = None
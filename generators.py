@@ -0,0 +1,103 @@
+"""Generadores de cargas de trabajo sintéticas.
+
+Cada generador produce ``count`` procesos (``P1, P2, ...``) con llegadas y
+ráfagas enteras, en orden de llegada, a partir de una semilla. El ritmo de
+llegadas se ajusta para que la carga media del procesador sea ``load``
+(trabajo que llega por unidad de tiempo): con ``load`` cerca de 1 la cola
+crece y las simulaciones se vuelven más costosas.
+
+- ``uniform``: llegadas uniformes en el intervalo y ráfagas uniformes.
+- ``poisson``: llegadas de Poisson (intervalos exponenciales) y ráfagas
+  exponenciales.
+- ``pareto``: llegadas de Poisson y ráfagas de cola pesada (Pareto): casi
+  todas cortas y unas pocas enormes.
+- ``bursty``: ráfagas de llegadas: grupos de procesos que llegan juntos,
+  separados por periodos sin llegadas.
+
+Los generadores devuelven iteradores, así que una carga de 10⁷ procesos
+puede escribirse a disco sin tenerla entera en memoria. Con ``count=None``
+los generadores de llegadas de Poisson (``poisson``, ``pareto``, ``bursty``)
+no terminan: son la fuente de llegadas continua del sistema abierto
+(``opensystem.py``). Este módulo solo usa la biblioteca estándar.
+"""
+import random
+from itertools import count as counter
+
+from scheduler import Process
+
+PARETO_SHAPE = 1.5  # Media finita y varianza infinita
+BURST_GROUP = 50  # Tamaño medio de los grupos de llegadas en ``bursty``
+
+
+def _burst(value):
+    return max(1, int(round(value)))
+
+
+def _indices(count):
+    return counter() if count is None else range(count)
+
+
+def uniform_workload(count, seed=0, load=0.9, mean_burst=10):
+    if count is None:
+        raise ValueError("el generador 'uniform' necesita un número de procesos")
+    rng = random.Random(seed)
+    span = count * mean_burst / load
+    # Estadísticos de orden de la uniforme generados ya ordenados, sin
+    # guardar ni ordenar todas las llegadas
+    left = 1.0  # Fracción del intervalo que queda después de la última llegada
+    for index in range(count):
+        left *= rng.random() ** (1 / (count - index))
+        yield Process(f'P{index + 1}', int(span * (1 - left)), rng.randint(1, 2 * mean_burst - 1))
+
+
+def poisson_workload(count, seed=0, load=0.9, mean_burst=10):
+    rng = random.Random(seed)
+    rate = load / mean_burst  # Llegadas por unidad de tiempo
+    clock = 0.0
+    for index in _indices(count):
+        clock += rng.expovariate(rate)
+        yield Process(f'P{index + 1}', int(clock), _burst(rng.expovariate(1 / mean_burst)))
+
+
+def pareto_workload(count, seed=0, load=0.9, mean_burst=10):
+    rng = random.Random(seed)
+    rate = load / mean_burst
+    # Escala mínima para que la media de la Pareto sea ``mean_burst``
+    scale = mean_burst * (PARETO_SHAPE - 1) / PARETO_SHAPE
+    clock = 0.0
+    for index in _indices(count):
+        clock += rng.expovariate(rate)
+        yield Process(f'P{index + 1}', int(clock), _burst(scale * rng.paretovariate(PARETO_SHAPE)))
+
+
+def bursty_workload(count, seed=0, load=0.9, mean_burst=10):
+    rng = random.Random(seed)
+    # Cada grupo trae en promedio BURST_GROUP procesos de una vez
+    group_rate = load / (mean_burst * BURST_GROUP)
+    clock = 0.0
+    index = 0
+    while count is None or index < count:
+        clock += rng.expovariate(group_rate)
+        size = 1 + int(rng.expovariate(1 / (BURST_GROUP - 1)))
+        if count is not None:
+            size = min(count - index, size)
+        for _ in range(size):
+            index += 1
+            yield Process(f'P{index}', int(clock), rng.randint(1, 2 * mean_burst - 1))
+
+
+GENERATORS = {
+    'uniform': uniform_workload,
+    'poisson': poisson_workload,
+    'pareto': pareto_workload,
+    'bursty': bursty_workload,
+}
+
+
+def generate_workload(kind, count, seed=0, load=0.9, mean_burst=10):
+    """Lista de ``count`` procesos generados con ``GENERATORS[kind]``"""
+    try:
+        generator = GENERATORS[kind]
+    except KeyError:
+        raise ValueError(f"generador desconocido: {kind!r}") from None
+    return list(generator(count, seed, load, mean_burst))
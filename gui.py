@@ -0,0 +1,971 @@
+"""Interfaz gráfica (PyQt5 + matplotlib) del simulador Round Robin"""
+import time
+from contextlib import nullcontext
+
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                             QLabel, QSpinBox, QPushButton, QTableWidget, QTableWidgetItem,
+                             QTableView, QListView, QLineEdit, QSplitter, QGroupBox, QFrame, QScrollArea, QGridLayout,
+                             QProgressBar, QCheckBox, QStackedWidget, QSlider, QDoubleSpinBox, QComboBox,
+                             QFileDialog)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QPalette, QColor
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+from cache import ResultCache, result_key, workload_digest
+from gantt import GanttRenderer, LodGanttView
+from incremental import IncrementalRR
+from log_model import DEFAULT_MAX_LINES, LogModel
+from multicore import simulate_multicpu
+from policies import POLICIES, compare_policies, make_policy, simulate_policy
+from profiling import PhaseProfiler
+from results_model import ResultsModel
+from scheduler import Process, StepHistory, schedule_rr_bulk
+from tracefile import TraceReader, TraceWriter
+from worker import SimulationWorker
+
+# Pasos que el hilo de simulación puede adelantarse a lo que se muestra
+LOOKAHEAD_STEPS = 2000
+# Por debajo de estos eventos la vista LOD se reconstruye en cada paso
+LOD_REBUILD_ALWAYS = 5000
+# Intervalo mínimo entre cuadros de la reproducción automática; a más
+# velocidad se saltan pasos en lugar de dibujarlos todos
+MIN_FRAME_MS = 30
+# Procesos de la cola que se muestran en la barra de estado
+QUEUE_PREVIEW = 12
+# Simulaciones completas que se conservan para repetirlas sin recalcular
+CACHE_ENTRIES = 8
+
+class MainWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle('🚀 Simulador Round Robin - Lista Circular Dinámica')
+        self.setGeometry(100, 100, 1200, 800)
+        self.processes = []
+        self.simulation_steps = StepHistory()
+        self.worker = None  # Hilo de la simulación en curso
+        self.waiting_for_step = False  # Se pidió un paso que aún no llegó
+        self.result_cache = ResultCache(CACHE_ENTRIES)
+        self.pending_cache_key = None  # Clave de la simulación en curso
+        self.incremental = IncrementalRR()  # Reanuda Round Robin al agregar procesos
+        self.profiler = None  # PhaseProfiler de la simulación en curso, si se mide
+        self.current_step = 0
+        self.events = []
+        self.completed_processes = []
+        
+        # Aplicar estilo moderno
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: #2b2b2b;
+                color: #ffffff;
+            }
+            QGroupBox {
+                font-weight: bold;
+                border: 2px solid #555555;
+                border-radius: 8px;
+                margin-top: 10px;
+                padding-top: 15px;
+                background-color: #3c3c3c;
+            }
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                subcontrol-position: top center;
+                padding: 0 10px;
+                color: #4CAF50;
+            }
+            QPushButton {
+                background-color: #4CAF50;
+                border: none;
+                color: white;
+                padding: 10px 20px;
+                text-align: center;
+                font-size: 14px;
+                border-radius: 6px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+            QPushButton:pressed {
+                background-color: #3d8b40;
+            }
+            QPushButton:disabled {
+                background-color: #666666;
+            }
+            QSpinBox, QLineEdit {
+                padding: 8px;
+                border: 2px solid #555555;
+                border-radius: 4px;
+                background-color: #404040;
+                color: white;
+                font-size: 14px;
+            }
+            QTableWidget, QTableView {
+                background-color: #404040;
+                alternate-background-color: #4a4a4a;
+                color: white;
+                gridline-color: #555555;
+                border: 1px solid #555555;
+                border-radius: 4px;
+            }
+            QHeaderView::section {
+                background-color: #4CAF50;
+                color: white;
+                font-weight: bold;
+                padding: 8px;
+                border: none;
+            }
+            QListView {
+                background-color: #1e1e1e;
+                color: #ffffff;
+                border: 1px solid #555555;
+                border-radius: 4px;
+                font-family: 'Consolas', 'Monaco', monospace;
+                font-size: 12px;
+            }
+            QLabel {
+                color: #ffffff;
+                font-size: 14px;
+                font-weight: bold;
+            }
+        """)
+        
+        self.setup_ui()
+
+    def setup_ui(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Grupo de entrada de procesos
+        input_group = QGroupBox("📝 Agregar Procesos")
+        input_layout = QHBoxLayout(input_group)
+        
+        input_layout.addWidget(QLabel('Tiempo de Llegada:'))
+        self.spin_arrival = QSpinBox()
+        self.spin_arrival.setRange(0, 1000)
+        self.spin_arrival.setSuffix(' ms')
+        input_layout.addWidget(self.spin_arrival)
+        
+        input_layout.addWidget(QLabel('Tiempo de Ráfaga:'))
+        self.spin_burst = QSpinBox()
+        self.spin_burst.setRange(1, 1000)
+        self.spin_burst.setSuffix(' ms')
+        self.spin_burst.setValue(5)
+        input_layout.addWidget(self.spin_burst)
+        
+        input_layout.addWidget(QLabel('Prioridad:'))
+        self.spin_priority = QSpinBox()
+        self.spin_priority.setRange(0, 99)
+        self.spin_priority.setToolTip('Menor número, más prioridad (solo la usa la política con prioridades)')
+        input_layout.addWidget(self.spin_priority)
+        
+        btn_add = QPushButton('➕ Agregar Proceso')
+        btn_add.clicked.connect(self.add_process)
+        input_layout.addWidget(btn_add)
+        
+        btn_clear = QPushButton('🗑️ Limpiar Todo')
+        btn_clear.clicked.connect(self.clear_processes)
+        btn_clear.setStyleSheet("QPushButton { background-color: #f44336; } QPushButton:hover { background-color: #da190b; }")
+        input_layout.addWidget(btn_clear)
+        
+        main_layout.addWidget(input_group)
+        
+        # Tabla de procesos
+        process_group = QGroupBox("📋 Lista de Procesos")
+        process_layout = QVBoxLayout(process_group)
+        
+        self.process_table = QTableWidget(0, 5)
+        self.process_table.setHorizontalHeaderLabels(['ID Proceso', 'Llegada (ms)', 'Ráfaga (ms)', 'Prioridad', 'Estado'])
+        self.process_table.horizontalHeader().setStretchLastSection(True)
+        process_layout.addWidget(self.process_table)
+        
+        main_layout.addWidget(process_group)
+        
+        # Grupo de configuración y ejecución
+        exec_group = QGroupBox("⚙️ Configuración y Ejecución")
+        exec_layout = QHBoxLayout(exec_group)
+        
+        exec_layout.addWidget(QLabel('Quantum (ms):'))
+        self.spin_quantum = QSpinBox()
+        self.spin_quantum.setRange(1, 100)
+        self.spin_quantum.setValue(3)
+        self.spin_quantum.setSuffix(' ms')
+        exec_layout.addWidget(self.spin_quantum)
+        
+        exec_layout.addWidget(QLabel('Cambio de contexto:'))
+        self.spin_switch = QSpinBox()
+        self.spin_switch.setRange(0, 100)
+        self.spin_switch.setSuffix(' ms')
+        self.spin_switch.setToolTip('Sobrecarga cobrada cada vez que la CPU pasa de un proceso a otro')
+        exec_layout.addWidget(self.spin_switch)
+        
+        exec_layout.addWidget(QLabel('Calentamiento:'))
+        self.spin_warmup = QSpinBox()
+        self.spin_warmup.setRange(0, 100)
+        self.spin_warmup.setSuffix(' ms')
+        self.spin_warmup.setToolTip('Calentamiento de caché cobrado en cada cambio de contexto, '
+                                    'además de la sobrecarga')
+        exec_layout.addWidget(self.spin_warmup)
+        
+        exec_layout.addWidget(QLabel('Política:'))
+        self.combo_policy = QComboBox()
+        for name, policy in POLICIES.items():
+            self.combo_policy.addItem(policy.label, name)
+        exec_layout.addWidget(self.combo_policy)
+        
+        exec_layout.addWidget(QLabel('CPUs:'))
+        self.spin_cpus = QSpinBox()
+        self.spin_cpus.setRange(1, 256)
+        self.spin_cpus.setToolTip('Con más de una CPU se simula Round Robin completo y se muestra un carril de Gantt por CPU')
+        exec_layout.addWidget(self.spin_cpus)
+        
+        self.combo_queues = QComboBox()
+        self.combo_queues.addItem('Cola global', 'global')
+        self.combo_queues.addItem('Cola por CPU (robo de trabajo)', 'local')
+        exec_layout.addWidget(self.combo_queues)
+        
+        btn_compare = QPushButton('📊 Comparar Políticas')
+        btn_compare.clicked.connect(self.compare_policies)
+        exec_layout.addWidget(btn_compare)
+        
+        btn_save_trace = QPushButton('💾 Guardar Traza')
+        btn_save_trace.setToolTip('Simular con la configuración actual escribiendo los eventos a un archivo .rrt')
+        btn_save_trace.clicked.connect(self.save_trace)
+        exec_layout.addWidget(btn_save_trace)
+        
+        btn_open_trace = QPushButton('📂 Abrir Traza')
+        btn_open_trace.setToolTip('Cargar el Gantt y los resultados de una traza .rrt sin volver a simular')
+        btn_open_trace.clicked.connect(self.open_trace)
+        exec_layout.addWidget(btn_open_trace)
+        
+        btn_execute = QPushButton('🚀 Ejecutar Simulación')
+        btn_execute.clicked.connect(self.run_simulation)
+        exec_layout.addWidget(btn_execute)
+        
+        self.btn_step = QPushButton('▶️ Siguiente Paso')
+        self.btn_step.setEnabled(False)
+        self.btn_step.clicked.connect(self.show_next_log)
+        exec_layout.addWidget(self.btn_step)
+        
+        self.btn_auto = QPushButton('⏩ Reproducción Automática')
+        self.btn_auto.setEnabled(False)
+        self.btn_auto.clicked.connect(self.toggle_auto_play)
+        exec_layout.addWidget(self.btn_auto)
+        
+        self.btn_cancel = QPushButton('⏹️ Cancelar')
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_simulation)
+        self.btn_cancel.setStyleSheet("QPushButton { background-color: #f44336; } QPushButton:hover { background-color: #da190b; }")
+        exec_layout.addWidget(self.btn_cancel)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat('%v/%m procesos')
+        self.progress_bar.setValue(0)
+        exec_layout.addWidget(self.progress_bar)
+        
+        main_layout.addWidget(exec_group)
+        
+        # Navegación: cualquier paso se reconstruye desde el historial
+        nav_group = QGroupBox("🧭 Navegación")
+        nav_layout = QHBoxLayout(nav_group)
+        
+        self.btn_back = QPushButton('⏮️ Paso Anterior')
+        self.btn_back.setEnabled(False)
+        self.btn_back.clicked.connect(self.show_previous_step)
+        nav_layout.addWidget(self.btn_back)
+        
+        self.step_slider = QSlider(Qt.Horizontal)
+        self.step_slider.setRange(0, 0)
+        self.step_slider.valueChanged.connect(self.seek_step)
+        nav_layout.addWidget(self.step_slider, 1)
+        
+        nav_layout.addWidget(QLabel('Tiempo:'))
+        self.spin_time = QSpinBox()
+        self.spin_time.setRange(0, 1_000_000_000)
+        self.spin_time.setSuffix(' ms')
+        nav_layout.addWidget(self.spin_time)
+        btn_time = QPushButton('Ir')
+        btn_time.clicked.connect(self.jump_to_time)
+        nav_layout.addWidget(btn_time)
+        
+        nav_layout.addWidget(QLabel('Velocidad:'))
+        self.spin_speed = QDoubleSpinBox()
+        self.spin_speed.setRange(0.25, 1000)
+        self.spin_speed.setValue(1.25)  # Un paso cada 800 ms
+        self.spin_speed.setSuffix(' pasos/s')
+        self.spin_speed.valueChanged.connect(self.restart_auto_play)
+        nav_layout.addWidget(self.spin_speed)
+        
+        main_layout.addWidget(nav_group)
+        
+        self.step_status = QLabel('')
+        self.step_status.setStyleSheet("QLabel { font-size: 12px; font-weight: normal; }")
+        main_layout.addWidget(self.step_status)
+        
+        # Área principal dividida
+        content_splitter = QSplitter(Qt.Horizontal)
+        
+        # Panel izquierdo - Logs
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        
+        logs_group = QGroupBox("📜 Registro de Ejecución (Lista Circular - Exclusión Mutua)")
+        logs_layout = QVBoxLayout(logs_group)
+        
+        # Filtro por proceso, salto a un paso y límite de líneas conservadas
+        log_tools = QHBoxLayout()
+        self.log_filter = QLineEdit()
+        self.log_filter.setPlaceholderText('Filtrar por proceso (ej. P1)')
+        self.log_filter.textChanged.connect(self.filter_log)
+        log_tools.addWidget(self.log_filter)
+        
+        log_tools.addWidget(QLabel('Paso:'))
+        self.spin_log_step = QSpinBox()
+        self.spin_log_step.setRange(0, 0)
+        log_tools.addWidget(self.spin_log_step)
+        btn_log_jump = QPushButton('Ir')
+        btn_log_jump.clicked.connect(self.jump_to_log_step)
+        log_tools.addWidget(btn_log_jump)
+        
+        log_tools.addWidget(QLabel('Máx. líneas:'))
+        self.spin_log_lines = QSpinBox()
+        self.spin_log_lines.setRange(1000, 10_000_000)
+        self.spin_log_lines.setSingleStep(10_000)
+        self.spin_log_lines.setValue(DEFAULT_MAX_LINES)
+        self.spin_log_lines.valueChanged.connect(self.set_log_retention)
+        log_tools.addWidget(self.spin_log_lines)
+        logs_layout.addLayout(log_tools)
+        
+        # Vista virtualizada: solo se genera el texto de las líneas visibles
+        self.log_model = LogModel(self.simulation_steps)
+        self.log_display = QListView()
+        self.log_display.setModel(self.log_model)
+        self.log_display.setUniformItemSizes(True)
+        logs_layout.addWidget(self.log_display)
+        
+        left_layout.addWidget(logs_group)
+        
+        # Panel derecho - Gantt y Resultados
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        
+        # Diagrama de Gantt
+        gantt_group = QGroupBox("📊 Diagrama de Gantt")
+        gantt_layout = QVBoxLayout(gantt_group)
+        
+        self.chk_lod = QCheckBox('🔭 Vista LOD (rueda: zoom, arrastrar: desplazar)')
+        self.chk_lod.setStyleSheet("QCheckBox { color: white; }")
+        self.chk_lod.toggled.connect(self.toggle_lod_view)
+        gantt_layout.addWidget(self.chk_lod)
+        
+        self.figure = Figure(figsize=(8, 4), facecolor='#2b2b2b')
+        self.canvas = FigureCanvas(self.figure)
+        self.gantt = GanttRenderer(self.figure, self.canvas)
+        
+        # Vista con nivel de detalle para líneas de tiempo enormes
+        self.lod_figure = Figure(figsize=(8, 4), facecolor='#2b2b2b')
+        self.lod_canvas = FigureCanvas(self.lod_figure)
+        self.lod_gantt = LodGanttView(self.lod_figure, self.lod_canvas)
+        self.lod_events = 0  # Eventos incluidos en los resúmenes actuales
+        
+        self.gantt_stack = QStackedWidget()
+        self.gantt_stack.addWidget(self.canvas)
+        self.gantt_stack.addWidget(self.lod_canvas)
+        gantt_layout.addWidget(self.gantt_stack)
+        
+        right_layout.addWidget(gantt_group)
+        
+        # Tabla de resultados
+        results_group = QGroupBox("📈 Resultados Finales")
+        results_layout = QVBoxLayout(results_group)
+        
+        # Modelo incremental: cada paso solo inserta los procesos recién completados
+        self.results_model = ResultsModel()
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setSortingEnabled(True)
+        self.results_table.sortByColumn(0, Qt.AscendingOrder)
+        results_layout.addWidget(self.results_table)
+        
+        self.stats_label = QLabel("Estadísticas aparecerán aquí después de la simulación")
+        self.stats_label.setStyleSheet("QLabel { color: #4CAF50; font-size: 14px; }")
+        results_layout.addWidget(self.stats_label)
+        
+        right_layout.addWidget(results_group)
+        
+        # Rendimiento: tiempo por fase del motor y de la interfaz (opcional)
+        performance_group = QGroupBox("⏱️ Rendimiento")
+        performance_layout = QVBoxLayout(performance_group)
+        
+        self.chk_profile = QCheckBox('Medir fases de la simulación (se aplica en la próxima ejecución)')
+        self.chk_profile.setStyleSheet("QCheckBox { color: white; }")
+        self.chk_profile.toggled.connect(self.toggle_profiling)
+        performance_layout.addWidget(self.chk_profile)
+        
+        self.performance_label = QLabel()
+        self.performance_label.setFont(QFont('Monospace', 9))
+        self.performance_label.setStyleSheet("QLabel { color: #cccccc; }")
+        self.performance_label.setVisible(False)
+        performance_layout.addWidget(self.performance_label)
+        
+        right_layout.addWidget(performance_group)
+        
+        # Configurar splitter
+        content_splitter.addWidget(left_panel)
+        content_splitter.addWidget(right_panel)
+        content_splitter.setSizes([500, 700])
+        
+        main_layout.addWidget(content_splitter)
+        
+        # Timer para reproducción automática
+        self.auto_timer = QTimer()
+        self.auto_timer.timeout.connect(self.auto_play_tick)
+        self.auto_playing = False
+        self.play_clock = 0  # Instante y paso desde los que se mide la reproducción
+        self.play_origin = 0
+        self.seek_time = None  # Tiempo pedido que aún no se ha simulado
+
+    def closeEvent(self, event):
+        self.cancel_simulation(wait=True)
+        super().closeEvent(event)
+
+    def add_process(self):
+        pid = f'P{len(self.processes) + 1}'
+        arrival = self.spin_arrival.value()
+        burst = self.spin_burst.value()
+        priority = self.spin_priority.value()
+        
+        process = Process(pid, arrival, burst, priority)
+        self.processes.append(process)
+        
+        # Agregar a la tabla
+        row = self.process_table.rowCount()
+        self.process_table.insertRow(row)
+        self.process_table.setItem(row, 0, QTableWidgetItem(pid))
+        self.process_table.setItem(row, 1, QTableWidgetItem(str(arrival)))
+        self.process_table.setItem(row, 2, QTableWidgetItem(str(burst)))
+        self.process_table.setItem(row, 3, QTableWidgetItem(str(priority)))
+        self.process_table.setItem(row, 4, QTableWidgetItem("Esperando"))
+        
+        # Limpiar campos
+        self.spin_arrival.setValue(0)
+        self.spin_burst.setValue(5)
+
+    def clear_processes(self):
+        self.cancel_simulation()
+        self.processes.clear()
+        self.process_table.setRowCount(0)
+        self.simulation_steps = StepHistory()
+        self.log_model.set_history(self.simulation_steps)
+        self.results_model.reset()
+        self.stats_label.setText("Estadísticas aparecerán aquí después de la simulación")
+        self.gantt.reset()
+        self.gantt.redraw()
+        self.lod_events = 0
+        self.lod_gantt.set_events([])
+        self.gantt_stack.setCurrentWidget(self.lod_canvas if self.chk_lod.isChecked() else self.canvas)
+        self.btn_step.setEnabled(False)
+        self.btn_auto.setEnabled(False)
+        self.current_step = 0
+        self.progress_bar.setValue(0)
+        self.reset_navigation()
+
+    def run_simulation(self):
+        if not self.processes:
+            self.log_model.clear()
+            self.log_model.append_message("❌ Error: No hay procesos para simular")
+            return
+        
+        quantum = self.spin_quantum.value()
+        # Una nueva ejecución cancela limpiamente la anterior
+        self.cancel_simulation(wait=True)
+        self.profiler = PhaseProfiler() if self.chk_profile.isChecked() else None
+        self.update_performance_panel()
+        if self.spin_cpus.value() > 1:
+            self.run_multicore(quantum, self.spin_cpus.value())
+            return
+        self.gantt_stack.setCurrentWidget(self.lod_canvas if self.chk_lod.isChecked() else self.canvas)
+        self.simulation_steps = StepHistory()
+        
+        self.current_step = -1  # Aún no se muestra ningún paso
+        self.log_model.set_history(self.simulation_steps)
+        self.spin_log_step.setRange(0, 0)
+        self.reset_navigation()
+        self.results_model.reset()
+        self.gantt.reset()
+        self.gantt.redraw()
+        self.lod_events = 0
+        self.lod_gantt.set_events([])
+        self.progress_bar.setRange(0, len(self.processes))
+        self.progress_bar.setValue(0)
+        
+        self.btn_step.setEnabled(True)
+        self.btn_auto.setEnabled(True)
+        self.btn_cancel.setEnabled(True)
+        
+        # Misma carga y configuración que una simulación anterior: se reutiliza
+        key = self.cache_key(quantum)
+        history = self.result_cache.get(key)
+        if history is not None:
+            self.simulation_steps = history
+            self.log_model.set_history(history)
+            self.log_model.append_message("♻️ Misma carga y configuración: resultado recuperado de la caché")
+            self.step_slider.setMaximum(len(history) - 1)
+            self.progress_bar.setValue(len(history.completed))
+            self.btn_cancel.setEnabled(False)
+            self.show_next_log()
+            return
+        
+        # Con Round Robin solo se simula desde el último punto de control
+        # anterior a la llegada de los procesos agregados
+        steps = None
+        policy = self.combo_policy.currentData()
+        if policy == 'rr':
+            self.simulation_steps, steps = self.incremental.start(self.processes, quantum,
+                                                                  self.spin_switch.value(),
+                                                                  self.spin_warmup.value(),
+                                                                  profiler=self.profiler)
+            self.log_model.set_history(self.simulation_steps)
+            checkpoint = self.incremental.resumed_from
+            if checkpoint is not None:
+                self.log_model.append_message(
+                    f"⚡ Reanudando desde t = {checkpoint['time']} ms: se reutilizan "
+                    f"{checkpoint['step']} pasos anteriores a los procesos agregados")
+                self.step_slider.setMaximum(len(self.simulation_steps) - 1)
+        
+        # La simulación corre en otro hilo; el primer paso se muestra al llegar
+        self.pending_cache_key = key
+        self.waiting_for_step = True
+        self.worker = SimulationWorker(self.processes, quantum, policy, self.spin_switch.value(),
+                                       steps=steps, offset=len(self.simulation_steps),
+                                       completed_offset=len(self.simulation_steps.completed),
+                                       profiler=self.profiler, warmup=self.spin_warmup.value())
+        self.worker.steps_ready.connect(self.on_steps_ready)
+        self.worker.progress.connect(self.on_simulation_progress)
+        self.worker.simulation_finished.connect(self.on_simulation_finished)
+        self.worker.request_steps(LOOKAHEAD_STEPS)
+        self.worker.start()
+
+    def run_multicore(self, quantum, cpus):
+        """Simular Round Robin con varias CPUs de una vez (sin modo paso a paso)"""
+        if self.combo_policy.currentData() != 'rr':
+            self.append_log_message("❌ Error: La simulación con varias CPUs solo admite Round Robin")
+            return
+        
+        queues = self.combo_queues.currentData()
+        result = self.result_cache.get_or_compute(
+            self.cache_key(quantum, cpus=cpus, queues=queues),
+            lambda: simulate_multicpu(self.processes, quantum, cpus, queues, record_events=True,
+                                      switch_cost=self.spin_switch.value(),
+                                      warmup=self.spin_warmup.value()))
+        
+        self.simulation_steps = StepHistory()
+        self.current_step = -1
+        self.log_model.set_history(self.simulation_steps)
+        self.spin_log_step.setRange(0, 0)
+        self.reset_navigation()
+        self.btn_step.setEnabled(False)
+        self.btn_auto.setEnabled(False)
+        self.progress_bar.setRange(0, len(self.processes))
+        self.progress_bar.setValue(len(result['completed']))
+        
+        self.append_log_message(f"=== ROUND ROBIN CON {cpus} CPUs ({self.combo_queues.currentText()}) - Quantum = {quantum} ms ===")
+        for cpu, utilization in enumerate(result['utilization']):
+            self.append_log_message(f"   CPU {cpu}: ocupada {result['busy'][cpu]} ms ({utilization:.1%})")
+        self.append_log_message(f"   Migraciones: {result['migrations']}  •  Robos de trabajo: {result['steals']}")
+        switches = f"   Cambios de contexto: {result['switches']}"
+        if result['overhead']:
+            switches += f" (sobrecarga: {result['overhead']} ms)"
+        self.append_log_message(switches)
+        
+        # Un carril por CPU en la vista LOD (las barras conservan el color de cada proceso)
+        self.gantt.reset()
+        self.lod_events = 0
+        self.lod_gantt.set_events(result['events'], lane=5,
+                                  lanes={cpu: f'CPU {cpu}' for cpu in range(cpus)})
+        self.gantt_stack.setCurrentWidget(self.lod_canvas)
+        
+        completed = result['completed']
+        self.results_model.reset()
+        self.results_model.sync(completed, len(completed))
+        if not completed:
+            return
+        model = self.results_model
+        average_utilization = sum(result['utilization']) / cpus
+        self.stats_label.setText(f"""
+        📊 ESTADÍSTICAS ({cpus} CPUs):
+        • Procesos completados: {model.count} de {len(self.processes)}
+        • Tiempo promedio de retorno: {model.average_turnaround():.2f} ms
+        • Tiempo promedio de espera: {model.average_waiting():.2f} ms
+        • Utilización promedio de CPU: {average_utilization:.1%}
+        • Migraciones: {result['migrations']}
+        • Tiempo total de simulación: {result['current_time']} ms""")
+
+    def compare_policies(self):
+        """Simular los procesos con todas las políticas y mostrar las métricas en el log"""
+        if not self.processes:
+            self.append_log_message("❌ Error: No hay procesos para comparar")
+            return
+        
+        rows = compare_policies(self.processes, self.spin_quantum.value(),
+                                switch_cost=self.spin_switch.value(),
+                                warmup=self.spin_warmup.value())
+        self.append_log_message(f"📊 Comparación de políticas (Quantum = {self.spin_quantum.value()} ms):")
+        for row in rows:
+            self.append_log_message(
+                f"   {row['label']}: Tr prom = {row['avg_turnaround']:.2f} ms, "
+                f"Te prom = {row['avg_waiting']:.2f} ms, "
+                f"cambios de contexto = {row['context_switches']}, fin = {row['makespan']} ms")
+        best = min(rows, key=lambda row: row['avg_waiting'])
+        self.append_log_message(f"   ⭐ Menor tiempo de espera promedio: {best['label']}")
+
+    def cache_key(self, quantum, **options):
+        """Clave de la caché para los procesos actuales con la configuración elegida"""
+        return result_key(workload_digest(self.processes), quantum,
+                          policy=self.combo_policy.currentData(),
+                          switch_cost=self.spin_switch.value(), warmup=self.spin_warmup.value(),
+                          **options)
+
+    def save_trace(self):
+        """Simular con la configuración actual y escribir la traza al disco mientras corre"""
+        if not self.processes:
+            self.append_log_message("❌ Error: No hay procesos para simular")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, 'Guardar traza', 'traza.rrt', 'Trazas (*.rrt)')
+        if not path:
+            return
+        
+        quantum = self.spin_quantum.value()
+        cpus = self.spin_cpus.value()
+        policy = self.combo_policy.currentData()
+        overhead = {'switch_cost': self.spin_switch.value(), 'warmup': self.spin_warmup.value()}
+        if cpus > 1 and policy != 'rr':
+            self.append_log_message("❌ Error: La simulación con varias CPUs solo admite Round Robin")
+            return
+        meta = {'quantum': quantum, 'policy': policy, **overhead}
+        if cpus > 1:
+            meta.update(cpus=cpus, queues=self.combo_queues.currentData())
+        with TraceWriter(path, **meta) as trace:
+            if cpus > 1:
+                result = simulate_multicpu(self.processes, quantum, cpus, meta['queues'],
+                                           sink=trace, **overhead)
+            elif policy == 'rr':
+                result = schedule_rr_bulk(self.processes, quantum, sink=trace, **overhead)
+            else:
+                result = simulate_policy(self.processes, make_policy(policy, quantum),
+                                         sink=trace, **overhead)
+            trace.write_results(result['completed'])
+            trace.close(makespan=result['current_time'])
+        self.append_log_message(f"💾 Traza guardada en {path}: {trace.event_count} eventos, "
+                                f"{trace.result_count} procesos completados")
+
+    def open_trace(self):
+        """Mostrar el Gantt (vista LOD) y los resultados de una traza guardada"""
+        path, _ = QFileDialog.getOpenFileName(self, 'Abrir traza', '', 'Trazas (*.rrt)')
+        if not path:
+            return
+        try:
+            reader = TraceReader(path)
+        except (OSError, ValueError) as error:
+            self.append_log_message(f"❌ Error: {error}")
+            return
+        
+        self.cancel_simulation(wait=True)
+        with reader:
+            meta = reader.meta
+            completed = reader.results()
+            self.gantt.reset()
+            self.lod_events = 0
+            self.lod_gantt.set_trace(reader)
+        self.gantt_stack.setCurrentWidget(self.lod_canvas)
+        
+        self.simulation_steps = StepHistory()
+        self.current_step = -1
+        self.log_model.set_history(self.simulation_steps)
+        self.spin_log_step.setRange(0, 0)
+        self.reset_navigation()
+        self.btn_step.setEnabled(False)
+        self.btn_auto.setEnabled(False)
+        self.progress_bar.setRange(0, max(1, len(completed)))
+        self.progress_bar.setValue(len(completed))
+        
+        policy = POLICIES[meta['policy']].label if meta.get('policy') in POLICIES else 'Round Robin'
+        self.append_log_message(f"📂 Traza {path}: {policy}, Quantum = {meta.get('quantum')} ms, "
+                                f"{reader.event_count} eventos")
+        
+        self.results_model.reset()
+        self.results_model.sync(completed, len(completed))
+        if not completed:
+            return
+        model = self.results_model
+        self.stats_label.setText(f"""
+        📊 ESTADÍSTICAS (traza guardada):
+        • Procesos completados: {model.count}
+        • Tiempo promedio de retorno: {model.average_turnaround():.2f} ms
+        • Tiempo promedio de espera: {model.average_waiting():.2f} ms
+        • Tiempo total de simulación: {meta.get('makespan', model.current_time())} ms""")
+
+    def cancel_simulation(self, wait=False):
+        """Cancelar la simulación en segundo plano, si hay una en curso"""
+        worker = self.worker
+        if worker is None:
+            return
+        self.worker = None
+        self.pending_cache_key = None
+        worker.steps_ready.disconnect(self.on_steps_ready)
+        worker.progress.disconnect(self.on_simulation_progress)
+        worker.simulation_finished.disconnect(self.on_simulation_finished)
+        worker.cancel()
+        if wait:
+            worker.wait()
+        else:
+            worker.finished.connect(worker.deleteLater)
+        self.btn_cancel.setEnabled(False)
+        self.append_log_message("⏹️ Simulación cancelada")
+        if self.waiting_for_step:
+            self.waiting_for_step = False
+            self.btn_step.setEnabled(False)
+            if self.auto_playing:
+                self.toggle_auto_play()
+
+    def on_steps_ready(self, steps):
+        with self.measure('record'):
+            for step in steps:
+                self.simulation_steps.append(**step)
+        self.step_slider.setMaximum(len(self.simulation_steps) - 1)
+        if self.seek_time is not None:
+            self.jump_to_time()
+        if self.waiting_for_step:
+            self.waiting_for_step = False
+            self.show_next_log()
+
+    def on_simulation_progress(self, produced, completed, total):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(completed)
+        self.update_performance_panel()
+
+    def on_simulation_finished(self, cancelled):
+        self.worker = None
+        self.btn_cancel.setEnabled(False)
+        self.update_performance_panel()
+        if not cancelled and self.pending_cache_key is not None:
+            self.result_cache.put(self.pending_cache_key, self.simulation_steps)
+        self.pending_cache_key = None
+        if self.seek_time is not None:
+            self.jump_to_time()
+        if self.waiting_for_step:
+            # Se pidió un paso que ya no llegará: la simulación terminó
+            self.waiting_for_step = False
+            self.show_next_log()
+
+    def fetch_step(self, index):
+        """Indicar si el paso ``index`` ya está disponible y pedir los siguientes"""
+        if self.worker is not None:
+            self.worker.request_steps(index + LOOKAHEAD_STEPS)
+        return index < len(self.simulation_steps)
+
+    def show_next_log(self):
+        if self.fetch_step(self.current_step + 1):
+            self.current_step += 1
+            self.show_current_step()
+        elif self.worker is not None:
+            # El paso aún se está calculando: se mostrará cuando llegue
+            self.waiting_for_step = True
+        else:
+            self.btn_step.setEnabled(False)
+            if self.auto_playing:
+                self.toggle_auto_play()
+
+    def show_previous_step(self):
+        self.seek_step(self.current_step - 1)
+
+    def seek_step(self, step):
+        """Mostrar un paso cualquiera ya simulado, hacia adelante o hacia atrás"""
+        step = min(step, len(self.simulation_steps) - 1)
+        if step < 0 or step == self.current_step:
+            return
+        self.waiting_for_step = False
+        self.current_step = step
+        self.show_current_step()
+        self.btn_step.setEnabled(step < len(self.simulation_steps) - 1 or self.worker is not None)
+
+    def jump_to_time(self):
+        target = self.spin_time.value()
+        step = self.simulation_steps.step_at_time(target)
+        if step is None and self.worker is not None:
+            # Ese tiempo aún no se simula: se salta al llegar los pasos
+            self.seek_time = target
+            self.fetch_step(len(self.simulation_steps))
+            return
+        self.seek_time = None
+        self.seek_step(len(self.simulation_steps) - 1 if step is None else step)
+
+    def reset_navigation(self):
+        self.seek_time = None
+        self.step_slider.blockSignals(True)
+        self.step_slider.setRange(0, 0)
+        self.step_slider.blockSignals(False)
+        self.btn_back.setEnabled(False)
+        self.step_status.setText('')
+
+    def show_current_step(self):
+        if self.current_step >= 0 and self.fetch_step(self.current_step):
+            history = self.simulation_steps
+            
+            # Mostrar logs hasta el paso actual (el texto se genera al verse)
+            with self.measure('logging'):
+                self.show_log_until(self.current_step)
+            
+            # Actualizar diagrama de Gantt: solo se dibujan los eventos nuevos
+            n_events, n_completed = history.counts(self.current_step)
+            with self.measure('gantt'):
+                if self.chk_lod.isChecked():
+                    self.update_lod_view(n_events)
+                else:
+                    self.gantt.sync(history.events, n_events, self.current_step)
+            
+            # Actualizar tabla de resultados paso a paso
+            with self.measure('results'):
+                self.update_results_table(n_completed)
+            with self.measure('display'):
+                self.update_step_status()
+            if self.worker is None:
+                self.update_performance_panel()
+
+    def update_step_status(self):
+        step = self.current_step
+        history = self.simulation_steps
+        self.step_slider.blockSignals(True)
+        self.step_slider.setValue(step)
+        self.step_slider.blockSignals(False)
+        self.btn_back.setEnabled(step > 0)
+        
+        queue = history.queue_status(step)
+        preview = ' → '.join(str(pid) for pid in queue[:QUEUE_PREVIEW])
+        if len(queue) > QUEUE_PREVIEW:
+            preview += f' … (+{len(queue) - QUEUE_PREVIEW})'
+        self.step_status.setText(f"Paso {step + 1}/{len(history)} · Tiempo {history.current_time(step)} ms · "
+                                 f"Cola ({len(queue)}): {preview or 'vacía'}")
+
+    def measure(self, phase):
+        """Contexto que mide ``phase`` si el panel de rendimiento está activo"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.measure(phase)
+
+    def toggle_profiling(self, enabled):
+        self.performance_label.setVisible(enabled)
+        self.update_performance_panel()
+
+    def update_performance_panel(self):
+        if not self.chk_profile.isChecked():
+            return
+        if self.profiler is None:
+            self.performance_label.setText("Se medirá la próxima simulación paso a paso")
+            return
+        self.performance_label.setText(
+            f"{self.profiler.format_report()}\n"
+            f"Reloj desde el inicio: {self.profiler.wall_time():.2f} s")
+
+    def show_log_until(self, step):
+        scrollbar = self.log_display.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.log_model.show_until(step)
+        self.spin_log_step.setMaximum(step)
+        if at_bottom:
+            self.log_display.scrollToBottom()
+
+    def append_log_message(self, text):
+        self.log_model.append_message(text)
+        self.log_display.scrollToBottom()
+
+    def filter_log(self, text):
+        self.log_model.set_filter(text.strip())
+        self.log_display.scrollToBottom()
+
+    def jump_to_log_step(self):
+        row = self.log_model.row_for_step(self.spin_log_step.value())
+        if row >= 0:
+            index = self.log_model.index(row)
+            self.log_display.scrollTo(index, QListView.PositionAtTop)
+            self.log_display.setCurrentIndex(index)
+
+    def set_log_retention(self, max_lines):
+        self.log_model.set_max_lines(max_lines)
+
+    def toggle_lod_view(self, enabled):
+        self.gantt_stack.setCurrentWidget(self.lod_canvas if enabled else self.canvas)
+        n_events = 0
+        if self.current_step >= 0 and self.current_step < len(self.simulation_steps):
+            n_events, _ = self.simulation_steps.counts(self.current_step)
+        if enabled:
+            self.update_lod_view(n_events, force=True)
+        else:
+            self.gantt.reset()
+            self.gantt.sync(self.simulation_steps.events, n_events, self.current_step)
+
+    def update_lod_view(self, n_events, force=False):
+        # Reconstruir los resúmenes cuesta O(eventos): con historiales grandes
+        # solo se hace al crecer un 10 %, así el coste por paso es O(1) amortizado
+        if n_events == self.lod_events and not force:
+            return
+        if force or n_events < max(self.lod_events, LOD_REBUILD_ALWAYS) or n_events > self.lod_events * 1.1:
+            self.lod_events = n_events
+            self.lod_gantt.set_events(self.simulation_steps.events[:n_events])
+
+    def toggle_auto_play(self):
+        if self.auto_playing:
+            self.auto_timer.stop()
+            self.btn_auto.setText('⏩ Reproducción Automática')
+            self.auto_playing = False
+        else:
+            self.btn_auto.setText('⏸️ Pausar')
+            self.auto_playing = True
+            self.restart_auto_play()
+
+    def restart_auto_play(self):
+        """Medir la reproducción desde el paso actual con la velocidad elegida"""
+        if not self.auto_playing:
+            return
+        speed = self.spin_speed.value()
+        self.play_clock = time.monotonic()
+        self.play_origin = max(self.current_step, 0)
+        self.auto_timer.start(max(MIN_FRAME_MS, int(1000 / speed)))
+
+    def auto_play_tick(self):
+        # El paso que toca depende del tiempo transcurrido: si dibujar se
+        # atrasa, se saltan los pasos intermedios en lugar de acumular retraso
+        elapsed = time.monotonic() - self.play_clock
+        target = self.play_origin + max(1, round(elapsed * self.spin_speed.value()))
+        if target <= self.current_step:
+            return
+        if target > self.current_step + 1 and self.fetch_step(target):
+            self.seek_step(target)
+        else:
+            self.show_next_log()
+
+    def update_results_table(self, n_completed):
+        model = self.results_model
+        model.sync(self.simulation_steps.completed, n_completed)
+        
+        if not model.count:
+            self.stats_label.setText("📊 Procesos completados: 0 - Esperando finalización...")
+            return
+        
+        # Las sumas se mantienen en el modelo: no se recorre la tabla
+        stats_text = f"""
+        📊 ESTADÍSTICAS PARCIALES:
+        • Procesos completados: {model.count} de {len(self.processes)}
+        • Tiempo promedio de retorno: {model.average_turnaround():.2f} ms
+        • Tiempo promedio de espera: {model.average_waiting():.2f} ms
+        """
+        stats_text += f"• Tiempo actual de simulación: {model.current_time()} ms"
+        history = self.simulation_steps
+        if self.current_step >= 0:
+            switches = history.switch_count(self.current_step)
+            stats_text += f"\n        • Cambios de contexto: {switches}"
+            if history.overhead:
+                stats_text += f" (sobrecarga: {switches * history.overhead} ms)"
+        
+        self.stats_label.setText(stats_text)
@@ -0,0 +1,81 @@
+"""Re-simulación incremental al agregar procesos a una carga.
+
+Si un proceso nuevo llega en el instante t, todo lo que la simulación hizo
+antes de t no cambia. ``IncrementalRR`` recuerda la última simulación Round
+Robin (su carga, su configuración, su ``StepHistory`` y los puntos de
+control de ``iter_rr_steps``) y, cuando la carga nueva es la anterior más
+procesos agregados al final, reanuda desde el último punto de control
+anterior a la llegada más temprana de los procesos nuevos: el coste es el
+del tramo afectado, no el de la simulación completa. En cualquier otro caso
+(carga editada, otro quantum u otra sobrecarga) simula desde cero.
+
+Sirve también con una simulación que aún no terminó (la interfaz la genera
+bajo demanda): solo se usan puntos de control cuyos pasos ya están en el
+historial.
+"""
+from scheduler import StepHistory, iter_rr_steps, resume_rr_steps
+
+
+class IncrementalRR:
+    """Simulaciones Round Robin paso a paso que se reanudan al agregar procesos"""
+
+    def __init__(self):
+        self.resumed_from = None  # Punto de control usado por la última llamada a ``start``
+        self._rows = None
+        self._config = None
+        self._history = None
+        self._checkpoints = []
+
+    def start(self, processes, quantum, switch_cost=0, warmup=0, profiler=None):
+        """Preparar la simulación de ``processes``.
+
+        Devuelve ``(historial, pasos)``: un ``StepHistory`` con los pasos que
+        se reutilizan (vacío si se simula desde cero) y un iterador con los
+        pasos siguientes, que hay que agregar a ese historial con
+        ``StepHistory.append``. ``profiler`` se pasa al motor (ver
+        ``iter_rr_steps``).
+        """
+        rows = [(p.id, p.arrival, p.burst, p.priority) for p in processes]
+        config = (quantum, switch_cost, warmup)
+        index = self._resume_point(rows, config)
+        checkpoint = None if index is None else self._checkpoints[index]
+
+        if checkpoint is None:
+            history = StepHistory()
+            self._checkpoints = []
+            steps = iter_rr_steps(processes, quantum, switch_cost, warmup, self._checkpoints,
+                                  profiler)
+        else:
+            history = self._history.prefix(checkpoint['step'])
+            del self._checkpoints[index + 1:]
+            steps = resume_rr_steps(checkpoint, processes, quantum, switch_cost, warmup,
+                                    self._checkpoints, profiler)
+
+        self.resumed_from = checkpoint
+        self._rows = rows
+        self._config = config
+        self._history = history
+        return history, steps
+
+    def simulate(self, processes, quantum, switch_cost=0, warmup=0):
+        """Simular completo (reanudando si se puede) y devolver el ``StepHistory``"""
+        history, steps = self.start(processes, quantum, switch_cost, warmup)
+        for step in steps:
+            history.append(**step)
+        return history
+
+    def _resume_point(self, rows, config):
+        if self._rows is None or config != self._config:
+            return None
+        previous = len(self._rows)
+        if len(rows) <= previous or rows[:previous] != self._rows:
+            return None
+        first_arrival = min(row[1] for row in rows[previous:])
+        available = len(self._history)
+        # Los puntos de control están en orden de tiempo: el último válido
+        # es anterior a la primera llegada nueva y ya está en el historial
+        for index in range(len(self._checkpoints) - 1, -1, -1):
+            checkpoint = self._checkpoints[index]
+            if checkpoint['time'] < first_arrival and checkpoint['step'] <= available:
+                return index
+        return None
@@ -0,0 +1,273 @@
+"""Modelo virtualizado del registro de ejecución.
+
+``LogModel`` presenta las líneas de los logs a una ``QListView`` sin
+guardarlas como texto: cada entrada es el índice de un paso de
+``StepHistory`` (o un mensaje suelto de la interfaz) y el texto de un paso
+solo se genera cuando la vista pide alguna de sus líneas visibles. Las
+líneas se ubican con búsqueda binaria sobre la línea inicial de cada entrada,
+así que el coste de mostrar una línea no depende del tamaño del historial.
+"""
+from bisect import bisect_right
+from collections import OrderedDict, deque
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+# Líneas que se conservan por defecto; las más antiguas se descartan
+DEFAULT_MAX_LINES = 100_000
+# Pasos ya formateados que se guardan para no regenerar su texto al desplazarse
+FORMAT_CACHE_SIZE = 256
+
+
+class LogModel(QAbstractListModel):
+    """Líneas del registro de ejecución, generadas bajo demanda.
+
+    ``set_filter`` muestra solo los pasos en los que participa un proceso
+    (ejecuta, llega o termina); los pasos de inicio y resumen y los mensajes
+    se muestran siempre. Cuando el total de líneas conservadas supera
+    ``max_lines`` se descartan los pasos más antiguos.
+    """
+
+    def __init__(self, history=None, max_lines=DEFAULT_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self.max_lines = max_lines
+        self.pid = None  # Filtro por proceso activo
+        self.last_step = -1  # Último paso agregado
+        self._entries = deque()  # Entradas conservadas: paso (int) o mensaje (str)
+        self._retained_lines = 0
+        self._visible = []  # Entradas que pasan el filtro, en orden
+        self._starts = []  # Línea absoluta donde empieza cada entrada visible
+        self._first = 0  # Primera entrada visible aún conservada
+        self._total = 0  # Línea absoluta donde terminará la próxima entrada
+        self._step_rows = {}  # Paso -> posición absoluta en _visible
+        self._offset = 0  # Entradas visibles eliminadas al compactar
+        self._cache = OrderedDict()
+
+    # --- Interfaz de QAbstractListModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self._first >= len(self._visible):
+            return 0
+        return self._total - self._starts[self._first]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        line = index.row() + self._starts[self._first]
+        k = bisect_right(self._starts, line, self._first) - 1
+        entry = self._visible[k]
+        if isinstance(entry, str):
+            return entry
+        return self._lines(entry)[line - self._starts[k]]
+
+    # --- Operaciones del registro ---
+
+    def set_history(self, history):
+        """Vaciar el registro y asociarlo a otro historial"""
+        self.beginResetModel()
+        self.history = history
+        self._entries.clear()
+        self._retained_lines = 0
+        self.last_step = -1
+        self._cache.clear()
+        self._reset_visible()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_history(self.history)
+
+    def append_step(self, step):
+        """Agregar las líneas del paso ``step`` del historial"""
+        self.last_step = step
+        self._append(step, self.history.log_line_count(step))
+
+    def show_until(self, step):
+        """Mostrar los pasos hasta ``step`` (inclusive), avanzando o retrocediendo.
+
+        El coste depende de las líneas que cambian, acotadas por
+        ``max_lines``, y no del número de pasos saltados: si el salto no cabe
+        en el límite, solo se agregan los últimos pasos que caben.
+        """
+        if step < self.last_step:
+            self._truncate(step)
+            first = next((entry for entry in self._entries if not isinstance(entry, str)), None)
+            if first != 0 and self._retained_lines < self.max_lines:
+                # Se descartaron pasos anteriores que ahora vuelven a caber
+                # (o el paso pedido es anterior a todos los conservados)
+                self._rebuild(self._last_steps(step, -1))
+                self._trim()
+            return
+        steps = self._last_steps(step, self.last_step)
+        if steps and steps[0] > self.last_step + 1:
+            # Salto más grande que el límite: se empieza de nuevo
+            self._rebuild(steps)
+        elif steps:
+            accepted = [entry for entry in steps if self._accepts(entry)]
+            if accepted:
+                row = self.rowCount()
+                n_lines = sum(self.history.log_line_count(entry) for entry in accepted)
+                self.beginInsertRows(QModelIndex(), row, row + n_lines - 1)
+                self._extend(steps)
+                self.endInsertRows()
+            else:
+                self._extend(steps)
+        self._trim()
+
+    def append_message(self, text):
+        """Agregar una línea suelta (errores, cancelaciones)"""
+        self._append(text, 1)
+
+    def set_filter(self, pid):
+        """Mostrar solo los pasos del proceso ``pid`` (vacío o None: todos)"""
+        pid = pid or None
+        if pid == self.pid:
+            return
+        self.beginResetModel()
+        self.pid = pid
+        self._reset_visible()
+        for entry in self._entries:
+            if self._accepts(entry):
+                self._push_visible(entry)
+        self.endResetModel()
+
+    def set_max_lines(self, max_lines):
+        """Cambiar el límite de líneas conservadas"""
+        self.max_lines = max_lines
+        self._trim()
+
+    def row_for_step(self, step):
+        """Primera fila del paso dado, o -1 si no está visible"""
+        k = self._step_rows.get(step)
+        if k is None or k - self._offset < self._first:
+            return -1
+        return self._starts[k - self._offset] - self._starts[self._first]
+
+    def step_for_row(self, row):
+        """Paso al que pertenece la fila dada, o None si es un mensaje"""
+        line = row + self._starts[self._first]
+        entry = self._visible[bisect_right(self._starts, line, self._first) - 1]
+        return None if isinstance(entry, str) else entry
+
+    # --- Detalles internos ---
+
+    def _lines(self, step):
+        lines = self._cache.get(step)
+        if lines is None:
+            lines = self._cache[step] = self.history.logs(step)
+            if len(self._cache) > FORMAT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(step)
+        return lines
+
+    def _line_count(self, entry):
+        return 1 if isinstance(entry, str) else self.history.log_line_count(entry)
+
+    def _accepts(self, entry):
+        if self.pid is None or isinstance(entry, str):
+            return True
+        # Los pasos de inicio y resumen no tienen evento: se muestran siempre
+        return self.history.step_event(entry) is None or self.history.involves(entry, self.pid)
+
+    def _reset_visible(self):
+        self._visible = []
+        self._starts = []
+        self._first = 0
+        self._total = 0
+        self._step_rows = {}
+        self._offset = 0
+
+    def _push_visible(self, entry):
+        if not isinstance(entry, str):
+            self._step_rows[entry] = len(self._visible) + self._offset
+        self._visible.append(entry)
+        self._starts.append(self._total)
+        self._total += self._line_count(entry)
+
+    def _last_steps(self, step, after):
+        """Últimos pasos hasta ``step`` posteriores a ``after`` que caben en ``max_lines``"""
+        steps = []
+        lines = 0
+        while step > after and lines < self.max_lines:
+            steps.append(step)
+            lines += self.history.log_line_count(step)
+            step -= 1
+        steps.reverse()
+        return steps
+
+    def _rebuild(self, steps):
+        self.beginResetModel()
+        self._entries.clear()
+        self._retained_lines = 0
+        self._reset_visible()
+        self._extend(steps)
+        self.last_step = steps[-1] if steps else -1
+        self.endResetModel()
+
+    def _extend(self, steps):
+        for entry in steps:
+            self._entries.append(entry)
+            self._retained_lines += self.history.log_line_count(entry)
+            if self._accepts(entry):
+                self._push_visible(entry)
+        if steps:
+            self.last_step = steps[-1]
+
+    def _truncate(self, step):
+        # Quitar desde el final los pasos posteriores a ``step`` y los
+        # mensajes que los siguen
+        removed = 0
+        while self._entries and (isinstance(self._entries[-1], str) or self._entries[-1] > step):
+            entry = self._entries.pop()
+            self._retained_lines -= self._line_count(entry)
+            if self._accepts(entry):
+                removed += 1
+        self.last_step = min(step, self.last_step)
+        if removed:
+            k = len(self._visible) - removed
+            first_row = self._starts[k] - self._starts[self._first]
+            self.beginRemoveRows(QModelIndex(), first_row, self.rowCount() - 1)
+            for entry in self._visible[k:]:
+                if not isinstance(entry, str):
+                    del self._step_rows[entry]
+            self._total = self._starts[k]
+            del self._visible[k:]
+            del self._starts[k:]
+            self.endRemoveRows()
+
+    def _append(self, entry, n_lines):
+        self._entries.append(entry)
+        self._retained_lines += n_lines
+        if self._accepts(entry):
+            row = self.rowCount()
+            self.beginInsertRows(QModelIndex(), row, row + n_lines - 1)
+            self._push_visible(entry)
+            self.endInsertRows()
+        self._trim()
+
+    def _trim(self):
+        # Se conserva siempre al menos la última entrada
+        dropped = 0
+        while self._retained_lines > self.max_lines and len(self._entries) > 1:
+            entry = self._entries.popleft()
+            self._retained_lines -= self._line_count(entry)
+            k = self._first + dropped
+            if k < len(self._visible) and self._visible[k] == entry:
+                if not isinstance(entry, str):
+                    del self._step_rows[entry]
+                dropped += 1
+        if dropped:
+            first_line = self._starts[self._first]
+            last_line = self._starts[self._first + dropped] if self._first + dropped < len(self._visible) else self._total
+            self.beginRemoveRows(QModelIndex(), 0, last_line - first_line - 1)
+            self._first += dropped
+            self.endRemoveRows()
+            self._compact()
+
+    def _compact(self):
+        # Liberar las entradas descartadas cuando son más de la mitad
+        if self._first > len(self._visible) // 2:
+            del self._visible[:self._first]
+            del self._starts[:self._first]
+            self._offset += self._first
+            self._first = 0
@@ -0,0 +1,229 @@
+"""Simulación Round Robin con varias CPUs.
+
+La cola de listos puede organizarse de dos formas (``queues``):
+
+- ``'global'``: una sola cola FIFO compartida; cada CPU que queda libre
+  toma el primer proceso de la cola.
+- ``'local'``: una cola por CPU. Los procesos nuevos se reparten por turnos
+  entre las CPUs y quien no termina vuelve a la cola de la CPU donde
+  ejecutó. Una CPU sin trabajo propio roba el último proceso de la cola de
+  otra CPU (robo de trabajo).
+
+Con ``affinity`` (pid -> CPU) un proceso queda fijado a una CPU: solo
+ejecuta en ella y nunca se roba. Cada CPU atiende su cola de fijados y su
+cola normal en el orden en que entraron los procesos.
+
+Con una sola CPU el resultado es idéntico al de ``schedule_rr_metrics``:
+mismo orden de llegadas, desempates y reencolado. Cada rebanada cuesta
+O(log N) para N CPUs (el montículo de rebanadas en curso) y O(1) respecto
+del número de procesos. Este módulo solo usa la biblioteca estándar.
+"""
+import heapq
+from collections import deque
+from itertools import count
+
+from scheduler import CONTEXT_SWITCH
+
+QUEUE_MODES = ('global', 'local')
+
+
+def simulate_multicpu(processes, quantum, cpus=2, queues='global', affinity=None,
+                      record_events=False, switch_cost=0, warmup=0, sink=None):
+    """Simular Round Robin con ``cpus`` procesadores.
+
+    Devuelve un diccionario con ``completed`` (en orden de finalización, con
+    Tf/Tr/Te calculados), ``current_time``, ``event_count``, ``busy`` y
+    ``utilization`` por CPU, ``migrations`` (rebanadas que un proceso
+    ejecutó en una CPU distinta de la anterior) y ``steals``. Con
+    ``record_events`` incluye ``events``: tuplas
+    ``(pid, inicio, fin, restante_antes, restante_después, cpu)``.
+
+    ``switch_cost`` y ``warmup`` se cobran cuando una CPU pasa a un proceso
+    distinto del último que ejecutó; ``busy`` solo cuenta el trabajo útil y
+    ``switches``/``overhead`` resumen los cambios de contexto.
+
+    ``sink`` (un objeto con ``append``, como ``tracefile.TraceWriter``)
+    recibe los eventos en lugar de la lista de ``record_events``.
+    """
+    if cpus < 1:
+        raise ValueError(f"el número de CPUs debe ser positivo: {cpus}")
+    if queues not in QUEUE_MODES:
+        raise ValueError(f"organización de colas desconocida: {queues!r}")
+    affinity = affinity or {}
+    for pid, cpu in affinity.items():
+        if not 0 <= cpu < cpus:
+            raise ValueError(f"CPU fuera de rango para {pid}: {cpu}")
+
+    pending = deque(sorted((p.copy() for p in processes), key=lambda x: x.arrival))
+    overhead = switch_cost + warmup
+    shared = queues == 'global'
+    # Colas de (orden de entrada, proceso); en modo global solo se usa la 0
+    local = [deque() for _ in range(1 if shared else cpus)]
+    pinned = [deque() for _ in range(cpus)]
+    stealable = set()  # CPUs con procesos en su cola local (modo local)
+    order = count()
+
+    idle = set(range(cpus))
+    wake = []  # CPUs libres que pueden tener trabajo propio
+    running = []  # Montículo de (fin de la rebanada, CPU)
+    slot_process = [None] * cpus
+    slot_start = [0] * cpus
+    slot_switch = [0] * cpus  # Sobrecarga cobrada al empezar la rebanada
+    cpu_last = [None] * cpus  # Último proceso que ejecutó cada CPU
+    busy = [0] * cpus
+    last_cpu = {}  # proceso -> CPU de su última rebanada
+    completed = []
+    events = sink if sink is not None else ([] if record_events else None)
+    event_count = 0
+    migrations = 0
+    steals = 0
+    switches = 0
+    next_home = 0  # Reparto por turnos de las llegadas en modo local
+
+    def enqueue(process, home):
+        pin = affinity.get(process.id)
+        if pin is not None:
+            pinned[pin].append((next(order), process))
+            if pin in idle:
+                wake.append(pin)
+        elif shared:
+            local[0].append((next(order), process))
+        else:
+            local[home].append((next(order), process))
+            stealable.add(home)
+            if home in idle:
+                wake.append(home)
+
+    def take(cpu):
+        nonlocal steals
+        own_pinned = pinned[cpu]
+        own = local[0 if shared else cpu]
+        if own_pinned and (not own or own_pinned[0][0] < own[0][0]):
+            return own_pinned.popleft()[1]
+        if own:
+            process = own.popleft()[1]
+            if not own and not shared:
+                stealable.discard(cpu)
+            return process
+        if stealable:
+            victim = next(iter(stealable))
+            queue = local[victim]
+            process = queue.pop()[1]
+            if not queue:
+                stealable.discard(victim)
+            steals += 1
+            return process
+        return None
+
+    def start(cpu, time):
+        nonlocal migrations, switches
+        process = take(cpu)
+        if process is None:
+            return
+        idle.discard(cpu)
+        switch = 0
+        if cpu_last[cpu] is not None and cpu_last[cpu] is not process:
+            switches += 1
+            switch = overhead
+        cpu_last[cpu] = process
+        slot_switch[cpu] = switch
+        if process.start_time == -1:
+            process.start_time = time + switch
+        previous = last_cpu.get(process)
+        if previous is not None and previous != cpu:
+            migrations += 1
+        last_cpu[process] = cpu
+        slot_process[cpu] = process
+        slot_start[cpu] = time
+        heapq.heappush(running, (time + switch + min(quantum, process.remaining), cpu))
+
+    def dispatch(time):
+        while wake:
+            cpu = wake.pop()
+            if cpu in idle:
+                start(cpu, time)
+        while idle and (local[0] if shared else stealable):
+            start(idle.pop(), time)
+
+    time = 0
+    while True:
+        while pending and pending[0].arrival <= time:
+            enqueue(pending.popleft(), next_home)
+            next_home = (next_home + 1) % len(local)
+        dispatch(time)
+
+        if not running:
+            if not pending:
+                break
+            time = pending[0].arrival
+            continue
+
+        end = running[0][0]
+        # Una llegada antes del fin de la rebanada solo cambia algo si hay CPUs libres
+        if idle and pending and pending[0].arrival < end:
+            time = pending[0].arrival
+            continue
+
+        time = end
+        # Los que llegan durante la rebanada quedan antes del proceso que la ejecutó
+        while pending and pending[0].arrival <= time:
+            enqueue(pending.popleft(), next_home)
+            next_home = (next_home + 1) % len(local)
+
+        while running and running[0][0] == time:
+            _, cpu = heapq.heappop(running)
+            process = slot_process[cpu]
+            slot_process[cpu] = None
+            start_time = slot_start[cpu] + slot_switch[cpu]
+            ran = time - start_time
+            remaining_before = process.remaining
+            process.remaining -= ran
+            busy[cpu] += ran
+            event_count += 1
+            if events is not None:
+                if slot_switch[cpu]:
+                    events.append((CONTEXT_SWITCH, slot_start[cpu], start_time, 0, 0, cpu))
+                events.append((process.id, start_time, time,
+                               remaining_before, process.remaining, cpu))
+            idle.add(cpu)
+            wake.append(cpu)
+            if process.remaining == 0:
+                process.finish_time = time
+                process.turnaround = process.finish_time - process.arrival
+                process.waiting = process.turnaround - process.original_burst
+                completed.append(process)
+                del last_cpu[process]
+            else:
+                enqueue(process, cpu)
+
+    result = {
+        'completed': completed,
+        'current_time': time,
+        'event_count': event_count,
+        'busy': busy,
+        'utilization': [b / time if time else 0.0 for b in busy],
+        'migrations': migrations,
+        'steals': steals,
+        'switches': switches,
+        'overhead': switches * overhead,
+    }
+    if events is not None:
+        result['events'] = events
+    return result
+
+
+def parse_affinity(text):
+    """Convertir ``'P1=0,P3=1'`` en ``{'P1': 0, 'P3': 1}``"""
+    affinity = {}
+    for item in text.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        pid, sep, cpu = item.partition('=')
+        if not sep:
+            raise ValueError(f"afinidad inválida (se espera ID=CPU): {item!r}")
+        try:
+            affinity[pid.strip()] = int(cpu)
+        except ValueError:
+            raise ValueError(f"CPU inválida para {pid.strip()}: {cpu.strip()!r}") from None
+    return affinity
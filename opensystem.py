@@ -0,0 +1,238 @@
+"""Sistema abierto: Round Robin con llegadas continuas y métricas por ventana.
+
+En un sistema real los procesos no dejan de llegar. ``iter_open_rr``
+consume un flujo de llegadas que puede no terminar nunca (un generador de
+``generators.py`` con ``count=None``, un archivo que sigue creciendo o un
+socket) y simula Round Robin con la misma semántica que
+``schedule_rr_metrics``, pero sin ordenar la carga de antemano: el flujo
+debe venir en orden de llegada y se lee de a un proceso, solo cuando hace
+falta saber si llega antes del fin de la rebanada en curso. Un registro que
+llega con un tiempo anterior al reloj de la simulación se cuenta como
+llegado en ese instante (``late``).
+
+La memoria no depende de cuántos procesos pasaron: los procesos completados
+se retiran y solo quedan sus Tr/Te hasta que cierra la ventana. Lo que
+ocupa memoria son los procesos en el sistema (que crecen sin límite si la
+carga supera 1) y los completados de la ventana en curso.
+
+Cada ``window`` unidades de tiempo simulado se publica un diccionario con
+las métricas de la ventana ``[start, end)``: llegadas, completados,
+throughput, media y percentiles 50/95/99 de retorno y espera, y procesos en
+el sistema (media ponderada por tiempo, máximo y valor al cierre). Si el
+flujo se agota, la última ventana queda parcial (``end`` es el tiempo
+final). Fuentes de prueba locales: ``follow_lines`` (como ``tail -f``) y
+``socket_lines`` (por ejemplo, ``nc localhost 9000 < carga.csv``). Este
+módulo solo usa la biblioteca estándar.
+"""
+import math
+import socket
+import time as clock
+from collections import deque
+
+PERCENTILES = (50, 95, 99)
+WINDOW_FIELDS = (
+    ['start', 'end', 'arrivals', 'completed', 'late', 'throughput']
+    + [f'{metric}_{name}' for metric in ('turnaround', 'waiting')
+       for name in ['mean'] + [f'p{p}' for p in PERCENTILES]]
+    + ['queue_mean', 'queue_max', 'queue_end']
+)
+
+
+def percentile(sorted_values, p):
+    """Percentil ``p`` por rango más cercano de una lista ordenada (``None`` si está vacía)"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RollingWindows:
+    """Métricas de ventanas fijas de tiempo simulado.
+
+    Hay que informar los sucesos en orden de tiempo (``arrive``,
+    ``complete``); las ventanas que cierran se acumulan en ``closed``
+    hasta que quien simula las publica.
+    """
+
+    def __init__(self, window, origin=0):
+        if window <= 0:
+            raise ValueError(f"la ventana debe ser positiva: {window}")
+        self.window = window
+        self.origin = origin
+        self.in_system = 0
+        self.closed = []
+        self._index = 0
+        self._open(origin)
+
+    def _open(self, start):
+        self.start = start
+        self.end = self.origin + (self._index + 1) * self.window
+        self.clock = start
+        self.area = 0  # Integral de procesos en el sistema en la ventana
+        self.peak = self.in_system
+        self.arrivals = 0
+        self.late = 0
+        self.turnarounds = []
+        self.waitings = []
+
+    def advance(self, time):
+        """Llevar el reloj hasta ``time`` cerrando las ventanas que terminan antes"""
+        while time >= self.end:
+            self.area += self.in_system * (self.end - self.clock)
+            self.closed.append(self._summary(self.end))
+            self._index += 1
+            self._open(self.end)
+        self.area += self.in_system * (time - self.clock)
+        self.clock = time
+
+    def arrive(self, time, late=False):
+        self.advance(time)
+        self.in_system += 1
+        self.arrivals += 1
+        if late:
+            self.late += 1
+        if self.in_system > self.peak:
+            self.peak = self.in_system
+
+    def complete(self, time, turnaround, waiting):
+        self.advance(time)
+        self.in_system -= 1
+        self.turnarounds.append(turnaround)
+        self.waitings.append(waiting)
+
+    def finish(self, time):
+        """Cerrar en ``time`` la ventana en curso aunque no haya terminado"""
+        self.advance(time)
+        if time > self.start or self.arrivals or self.turnarounds:
+            self.closed.append(self._summary(time))
+        self._index += 1
+        self._open(time)
+
+    def _summary(self, end):
+        span = end - self.start
+        summary = {
+            'start': self.start,
+            'end': end,
+            'arrivals': self.arrivals,
+            'completed': len(self.turnarounds),
+            'late': self.late,
+            'throughput': len(self.turnarounds) / span if span else 0.0,
+        }
+        for metric, values in (('turnaround', self.turnarounds), ('waiting', self.waitings)):
+            values.sort()
+            summary[f'{metric}_mean'] = sum(values) / len(values) if values else None
+            for p in PERCENTILES:
+                summary[f'{metric}_p{p}'] = percentile(values, p)
+        summary['queue_mean'] = self.area / span if span else float(self.in_system)
+        summary['queue_max'] = self.peak
+        summary['queue_end'] = self.in_system
+        return summary
+
+
+def iter_open_rr(arrivals, quantum, window, switch_cost=0, warmup=0, until=None):
+    """Simular Round Robin sobre el flujo ``arrivals`` y generar las ventanas al cerrarse.
+
+    ``arrivals`` es un iterable de ``Process`` en orden de llegada; los
+    procesos se modifican (no se copian) y se descartan al terminar. Con
+    ``until`` no se empiezan rebanadas a partir de ese tiempo: se publica
+    la ventana parcial y la simulación termina aunque el flujo no se haya
+    agotado. Sin ``until`` y con un flujo infinito la simulación no
+    termina: quien consume las ventanas decide cuándo dejar de pedirlas.
+    """
+    source = iter(arrivals)
+    stats = RollingWindows(window)
+    closed = stats.closed
+    overhead = switch_cost + warmup
+    ready = deque()
+    last = None
+    time = 0
+
+    def read():
+        """Siguiente llegada y si llegó tarde (antes del reloj de la simulación)"""
+        process = next(source, None)
+        if process is not None and process.arrival < stats.clock:
+            process.arrival = stats.clock
+            return process, True
+        return process, False
+
+    upcoming, late = read()
+    while True:
+        if closed:
+            yield from closed
+            closed.clear()
+        while upcoming is not None and upcoming.arrival <= time:
+            stats.arrive(upcoming.arrival, late)
+            ready.append(upcoming)
+            if closed:  # Publicar antes de esperar la próxima llegada
+                yield from closed
+                closed.clear()
+            upcoming, late = read()
+
+        if until is not None and time >= until:
+            break
+        if not ready:
+            if upcoming is None:
+                break
+            time = upcoming.arrival if until is None else min(upcoming.arrival, until)
+            continue
+
+        current = ready[0]
+        if last is not None and current is not last:
+            time += overhead
+        last = current
+
+        exec_time = min(quantum, current.remaining)
+        time += exec_time
+        current.remaining -= exec_time
+
+        # Los que llegan durante la ejecución quedan detrás del proceso actual
+        while upcoming is not None and upcoming.arrival <= time:
+            stats.arrive(upcoming.arrival, late)
+            ready.append(upcoming)
+            if closed:  # Publicar antes de esperar la próxima llegada
+                yield from closed
+                closed.clear()
+            upcoming, late = read()
+
+        ready.popleft()
+        if current.remaining == 0:
+            turnaround = time - current.arrival
+            stats.complete(time, turnaround, turnaround - current.original_burst)
+        else:
+            ready.append(current)
+
+    stats.finish(time)  # La ventana parcial, con lo que cerró en la última rebanada
+    yield from closed
+    closed.clear()
+
+
+def follow_lines(path, poll=0.5):
+    """Líneas de ``path`` desde el principio, esperando las nuevas como ``tail -f``"""
+    with open(path, encoding='utf-8', newline='') as stream:
+        partial = ''
+        while True:
+            line = stream.readline()
+            if not line:
+                clock.sleep(poll)
+                continue
+            partial += line
+            if partial.endswith('\n'):
+                yield partial
+                partial = ''
+
+
+def socket_lines(host, port):
+    """Líneas recibidas por TCP en ``host:port``, de un cliente tras otro"""
+    with socket.create_server((host, port)) as server:
+        while True:
+            connection, _ = server.accept()
+            with connection, connection.makefile('r', encoding='utf-8', newline='') as stream:
+                yield from stream
+
+
+def parse_address(text):
+    """Convertir ``'[HOST:]PORT'`` en ``(host, puerto)`` (por defecto ``localhost``)"""
+    host, sep, port = text.rpartition(':')
+    if not port.isdigit():
+        raise ValueError(f"dirección inválida (se espera [HOST:]PUERTO): {text!r}")
+    return (host if sep and host else 'localhost'), int(port)
@@ -0,0 +1,436 @@
+"""Políticas de planificación intercambiables para comparar con Round Robin.
+
+Todas las políticas comparten el mismo motor (``iter_policy_steps`` para la
+simulación paso a paso y ``simulate_policy`` para solo métricas), que produce
+los mismos eventos, pasos y métricas que la simulación Round Robin original.
+Cada política solo decide con su propia cola de listos:
+
+- ``add``: llega un proceso (o se agrega uno nuevo durante una rebanada).
+- ``select``: sacar el siguiente proceso que usará la CPU.
+- ``slice_length``: cuánto tiempo puede ejecutar antes de volver a decidir.
+- ``requeue``: devolver a la cola un proceso que no terminó.
+- ``complete``: un proceso terminó (para olvidar lo que se guardó de él).
+
+Como en la simulación original, los procesos que llegan durante una rebanada
+se agregan antes de devolver a la cola al proceso que la ejecutó.
+Este módulo solo usa la biblioteca estándar.
+"""
+import heapq
+from collections import deque
+from itertools import count
+
+from scheduler import CONTEXT_SWITCH
+
+
+class Policy:
+    """Interfaz común de las políticas de planificación"""
+    name = None  # Clave para la línea de comandos y la interfaz
+    label = None  # Nombre para mostrar
+
+    def __init__(self, quantum):
+        self.quantum = quantum
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def add(self, process, time):
+        raise NotImplementedError
+
+    def select(self, time):
+        raise NotImplementedError
+
+    def slice_length(self, process, time, pending):
+        """Tiempo de CPU de la rebanada; ``pending`` son las llegadas futuras, en orden"""
+        return min(self.quantum, process.remaining)
+
+    def requeue(self, process, time, ran):
+        raise NotImplementedError
+
+    def complete(self, process, time):
+        """El proceso terminó y no volverá a la cola"""
+
+    def status(self):
+        """IDs de la cola de listos en el orden en que se atenderían"""
+        raise NotImplementedError
+
+
+class RoundRobin(Policy):
+    """Round Robin clásico con una cola FIFO"""
+    name = 'rr'
+    label = 'Round Robin'
+
+    def __init__(self, quantum):
+        super().__init__(quantum)
+        self.ready = deque()
+
+    def __len__(self):
+        return len(self.ready)
+
+    def add(self, process, time):
+        self.ready.append(process)
+
+    def select(self, time):
+        return self.ready.popleft()
+
+    def requeue(self, process, time, ran):
+        self.ready.append(process)
+
+    def status(self):
+        return [p.id for p in self.ready]
+
+
+class FCFS(RoundRobin):
+    """Primero en llegar, primero en ser atendido (sin expropiación)"""
+    name = 'fcfs'
+    label = 'FCFS'
+
+    def slice_length(self, process, time, pending):
+        return process.remaining
+
+
+class SJF(Policy):
+    """Trabajo más corto primero (sin expropiación), con un montículo"""
+    name = 'sjf'
+    label = 'SJF'
+
+    def __init__(self, quantum):
+        super().__init__(quantum)
+        self.heap = []  # (clave, orden de llegada a la cola, proceso)
+        self._order = count()
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _key(self, process):
+        return process.original_burst
+
+    def add(self, process, time):
+        heapq.heappush(self.heap, (self._key(process), next(self._order), process))
+
+    def select(self, time):
+        return heapq.heappop(self.heap)[2]
+
+    def slice_length(self, process, time, pending):
+        return process.remaining
+
+    def requeue(self, process, time, ran):
+        self.add(process, time)
+
+    def status(self):
+        return [entry[2].id for entry in sorted(self.heap)]
+
+
+class SRTF(SJF):
+    """Menor tiempo restante primero: se vuelve a decidir en cada llegada"""
+    name = 'srtf'
+    label = 'SRTF'
+
+    def _key(self, process):
+        return process.remaining
+
+    def slice_length(self, process, time, pending):
+        # Ejecutar hasta terminar o hasta la primera llegada más corta que lo
+        # que le quedará al proceso en ese momento (expropiación). Las llegadas
+        # revisadas que no expropian entran antes de la siguiente decisión,
+        # así que cada una se revisa O(1) veces en total.
+        finish = time + process.remaining
+        for arriving in pending:
+            if arriving.arrival >= finish:
+                break
+            if arriving.remaining < finish - arriving.arrival:
+                return arriving.arrival - time
+        return process.remaining
+
+
+class PriorityRR(Policy):
+    """Round Robin por niveles de prioridad (menor número, más prioridad).
+
+    Cada prioridad tiene su cola FIFO; un montículo guarda las prioridades
+    con procesos en espera, así que elegir el siguiente cuesta O(log k)
+    para k prioridades distintas.
+    """
+    name = 'priority'
+    label = 'Round Robin con prioridades'
+
+    def __init__(self, quantum):
+        super().__init__(quantum)
+        self.levels = {}  # prioridad -> cola FIFO
+        self.active = []  # Montículo de prioridades con procesos en espera
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, process, time):
+        queue = self.levels.get(process.priority)
+        if queue is None:
+            queue = self.levels[process.priority] = deque()
+        if not queue:
+            heapq.heappush(self.active, process.priority)
+        queue.append(process)
+        self.size += 1
+
+    def select(self, time):
+        queue = self.levels[self.active[0]]
+        process = queue.popleft()
+        if not queue:
+            heapq.heappop(self.active)
+        self.size -= 1
+        return process
+
+    def requeue(self, process, time, ran):
+        self.add(process, time)
+
+    def status(self):
+        return [p.id for priority in sorted(self.active) for p in self.levels[priority]]
+
+
+class MLFQ(Policy):
+    """Colas multinivel con retroalimentación.
+
+    Los procesos nuevos entran al nivel 0; quien agota su quantum baja un
+    nivel, donde el quantum se duplica. Siempre se atiende el nivel más alto
+    con procesos en espera.
+    """
+    name = 'mlfq'
+    label = 'MLFQ'
+    LEVELS = 3
+
+    def __init__(self, quantum, levels=LEVELS):
+        super().__init__(quantum)
+        self.queues = [deque() for _ in range(levels)]
+        self.quanta = [quantum * 2 ** level for level in range(levels)]
+        self.level = {}  # proceso -> nivel actual
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, process, time):
+        self.level[process] = 0
+        self.queues[0].append(process)
+        self.size += 1
+
+    def select(self, time):
+        for queue in self.queues:
+            if queue:
+                self.size -= 1
+                return queue.popleft()
+
+    def slice_length(self, process, time, pending):
+        return min(self.quanta[self.level[process]], process.remaining)
+
+    def requeue(self, process, time, ran):
+        level = self.level[process]
+        if ran >= self.quanta[level] and level + 1 < len(self.queues):
+            level = self.level[process] = level + 1
+        self.queues[level].append(process)
+        self.size += 1
+
+    def complete(self, process, time):
+        del self.level[process]
+
+    def status(self):
+        return [p.id for queue in self.queues for p in queue]
+
+
+class VariableQuantumRR(RoundRobin):
+    """Round Robin con quantum recalculado en cada ronda.
+
+    Al empezar cada ronda (tantas rebanadas como procesos en la cola) el
+    quantum pasa a ser el promedio redondeado hacia arriba de los tiempos
+    restantes, con el quantum configurado como mínimo. La suma de restantes
+    se mantiene al agregar y sacar procesos, así que el cálculo es O(1).
+    """
+    name = 'vrr'
+    label = 'Round Robin de quantum variable'
+
+    def __init__(self, quantum):
+        super().__init__(quantum)
+        self.minimum = quantum
+        self.pending = 0  # Suma de los tiempos restantes en la cola
+        self.round_left = 0
+
+    def add(self, process, time):
+        super().add(process, time)
+        self.pending += process.remaining
+
+    def select(self, time):
+        if self.round_left == 0:
+            self.round_left = len(self.ready)
+            self.quantum = max(self.minimum, -(-self.pending // len(self.ready)))
+        self.round_left -= 1
+        process = super().select(time)
+        self.pending -= process.remaining
+        return process
+
+    def requeue(self, process, time, ran):
+        self.add(process, time)
+
+
+POLICIES = {policy.name: policy for policy in
+            (RoundRobin, FCFS, SJF, SRTF, PriorityRR, MLFQ, VariableQuantumRR)}
+
+
+def make_policy(name, quantum):
+    """Crear la política ``name`` (clave de ``POLICIES``)"""
+    try:
+        return POLICIES[name](quantum)
+    except KeyError:
+        raise ValueError(f"política desconocida: {name!r}") from None
+
+
+def iter_policy_steps(processes, policy, switch_cost=0, warmup=0):
+    """Generar los pasos de la simulación con una política cualquiera.
+
+    Los pasos tienen la misma forma que los de ``iter_rr_steps`` y se
+    guardan igual con ``StepHistory.append(**paso)``; el texto de los logs
+    usa el nombre de la política en lugar de la lista circular. La
+    sobrecarga por cambio de contexto se cobra igual que en ``iter_rr_steps``.
+    """
+    pending = deque(sorted((p.copy() for p in processes), key=lambda x: x.arrival))
+    overhead = switch_cost + warmup
+    time = 0
+    last = None
+
+    yield {'kind': 'start', 'quantum': policy.quantum, 'policy': policy.label, 'overhead': overhead,
+           'current_time': time, 'queue_status': [], 'event': None, 'completed': None}
+
+    while pending or len(policy):
+        arrivals = []
+        while pending and pending[0].arrival <= time:
+            arriving_process = pending.popleft()
+            policy.add(arriving_process, time)
+            arrivals.append((arriving_process.id, len(policy)))
+
+        if not len(policy):
+            time = pending[0].arrival
+            continue
+
+        current = policy.select(time)
+        switched = last is not None and current is not last
+        switch_event = None
+        if switched and overhead:
+            switch_event = (CONTEXT_SWITCH, time, time + overhead, 0, 0)
+            time += overhead
+        last = current
+        start_time = time
+        if current.start_time == -1:
+            current.start_time = start_time
+
+        exec_time = policy.slice_length(current, time, pending)
+        remaining_before = current.remaining
+        time += exec_time
+        current.remaining -= exec_time
+        current_event = (current.id, start_time, time, remaining_before, current.remaining)
+
+        arrived_during = []
+        while pending and pending[0].arrival <= time:
+            arriving_process = pending.popleft()
+            policy.add(arriving_process, time)
+            arrived_during.append(arriving_process.id)
+
+        completed_process = None
+        if current.remaining == 0:
+            current.finish_time = time
+            current.turnaround = current.finish_time - current.arrival
+            current.waiting = current.turnaround - current.original_burst
+            completed_process = current
+            policy.complete(current, time)
+        else:
+            policy.requeue(current, time, exec_time)
+
+        yield {'kind': 'slice', 'current_time': time, 'queue_status': policy.status(),
+               'event': current_event, 'completed': completed_process,
+               'arrivals': arrivals, 'arrived_during': arrived_during,
+               'switch': switch_event, 'switched': switched}
+
+    yield {'kind': 'summary', 'current_time': time, 'queue_status': [],
+           'event': None, 'completed': None}
+
+
+def simulate_policy(processes, policy, switch_cost=0, warmup=0, sink=None):
+    """Simular con una política y devolver solo las métricas finales.
+
+    Devuelve lo mismo que ``schedule_rr_metrics``: los procesos completados
+    en orden de finalización, el tiempo final, el número de eventos y los
+    cambios de contexto con su sobrecarga. Si se pasa ``sink`` (un objeto
+    con ``append``, como ``tracefile.TraceWriter``), recibe cada evento del
+    diagrama de Gantt a medida que ocurre.
+    """
+    pending = deque(sorted((p.copy() for p in processes), key=lambda x: x.arrival))
+    overhead = switch_cost + warmup
+    time = 0
+    completed = []
+    event_count = 0
+    switches = 0
+    last = None
+
+    while pending or len(policy):
+        while pending and pending[0].arrival <= time:
+            policy.add(pending.popleft(), time)
+
+        if not len(policy):
+            time = pending[0].arrival
+            continue
+
+        current = policy.select(time)
+        if last is not None and current is not last:
+            switches += 1
+            if overhead and sink is not None:
+                sink.append((CONTEXT_SWITCH, time, time + overhead, 0, 0))
+            time += overhead
+        last = current
+        if current.start_time == -1:
+            current.start_time = time
+        exec_time = policy.slice_length(current, time, pending)
+        if sink is not None:
+            sink.append((current.id, time, time + exec_time,
+                         current.remaining, current.remaining - exec_time))
+        time += exec_time
+        current.remaining -= exec_time
+        event_count += 1
+
+        while pending and pending[0].arrival <= time:
+            policy.add(pending.popleft(), time)
+
+        if current.remaining == 0:
+            current.finish_time = time
+            current.turnaround = current.finish_time - current.arrival
+            current.waiting = current.turnaround - current.original_burst
+            completed.append(current)
+            policy.complete(current, time)
+        else:
+            policy.requeue(current, time, exec_time)
+
+    return {
+        'completed': completed,
+        'current_time': time,
+        'event_count': event_count,
+        'switches': switches,
+        'overhead': switches * overhead
+    }
+
+
+def compare_policies(processes, quantum, names=None, switch_cost=0, warmup=0):
+    """Simular la misma carga con varias políticas.
+
+    Devuelve una fila por política con ``policy``, ``label``,
+    ``avg_turnaround``, ``avg_waiting``, ``context_switches`` (cambios de la
+    CPU a otro proceso, como ``switches`` en todos los motores) y ``makespan``.
+    """
+    rows = []
+    for name in names or POLICIES:
+        policy = make_policy(name, quantum)
+        result = simulate_policy(processes, policy, switch_cost, warmup)
+        completed = result['completed']
+        finished = len(completed)
+        rows.append({
+            'policy': name,
+            'label': policy.label,
+            'avg_turnaround': sum(p.turnaround for p in completed) / finished if finished else 0.0,
+            'avg_waiting': sum(p.waiting for p in completed) / finished if finished else 0.0,
+            'context_switches': result['switches'],
+            'makespan': result['current_time'],
+        })
+    return rows
@@ -0,0 +1,167 @@
+"""Instrumentación del bucle de planificación.
+
+``PhaseProfiler`` acumula tiempo y número de pasadas por fase del bucle
+Round Robin paso a paso (``iter_rr_steps(..., profiler=...)``):
+
+- ``checkpoint``: copia de la cola para los puntos de control.
+- ``admission``: admisión de las llegadas antes de la rebanada.
+- ``dispatch``: elección del proceso, cambio de contexto y ejecución.
+- ``completion``: llegadas durante la rebanada, finalización o reencolado.
+- ``snapshot``: vista del estado de la cola que lleva el paso.
+
+Quien consume los pasos mide sus propias fases con ``measure`` (la interfaz
+y ``profile_rr_steps``): ``record`` (guardar el paso en el historial),
+``logging`` (generar el texto del log) y las de la interfaz (``gantt``,
+``results``, ``display``). El tiempo entre pasos que gasta el consumidor no
+se atribuye al motor: el generador vuelve a tomar la marca al reanudarse.
+
+Sin perfilador el motor solo paga una comparación con ``None`` por fase, y
+el resto de los motores no tiene instrumentación. ``run_with_cprofile`` y
+``run_with_tracemalloc`` envuelven cualquier simulación (``run --profile``
+en la línea de comandos). Este módulo solo usa la biblioteca estándar.
+"""
+import cProfile
+import linecache
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+
+from scheduler import StepHistory, iter_rr_steps
+
+PHASE_LABELS = {
+    'checkpoint': 'Puntos de control',
+    'admission': 'Admisión de llegadas',
+    'dispatch': 'Despacho y ejecución',
+    'completion': 'Finalización y reencolado',
+    'snapshot': 'Estado de la cola',
+    'record': 'Registro en el historial',
+    'logging': 'Generación del log',
+    'gantt': 'Diagrama de Gantt',
+    'results': 'Tabla de resultados',
+    'display': 'Presentación del paso',
+}
+ENGINE_PHASES = ('checkpoint', 'admission', 'dispatch', 'completion', 'snapshot')
+
+
+class PhaseProfiler:
+    """Tiempos y contadores por fase del bucle de simulación"""
+
+    def __init__(self):
+        # Con todas las fases conocidas ya presentes los diccionarios no
+        # cambian de tamaño: la interfaz los lee mientras el hilo de la
+        # simulación los actualiza
+        self.times = dict.fromkeys(PHASE_LABELS, 0.0)
+        self.counts = dict.fromkeys(PHASE_LABELS, 0)
+        self.slices = 0
+        self.started = perf_counter()
+        self._last = self.started
+
+    def mark(self):
+        """Empezar a medir desde ahora (la próxima ``lap`` cuenta desde aquí)"""
+        self._last = perf_counter()
+
+    def lap(self, phase):
+        """Sumar a ``phase`` el tiempo desde la última marca y volver a marcar"""
+        now = perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + now - self._last
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+        self._last = now
+
+    @contextmanager
+    def measure(self, phase):
+        """Medir un bloque ``with`` como una pasada de ``phase``"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.times[phase] = self.times.get(phase, 0.0) + elapsed
+            self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def reset(self):
+        self.__init__()
+
+    def engine_time(self):
+        """Tiempo dentro del motor (sin las fases del consumidor)"""
+        return sum(self.times.get(phase, 0.0) for phase in ENGINE_PHASES)
+
+    def wall_time(self):
+        return perf_counter() - self.started
+
+    def slices_per_second(self):
+        """Rebanadas por segundo de tiempo dentro del motor"""
+        elapsed = self.engine_time()
+        return self.slices / elapsed if elapsed else 0.0
+
+    def report(self):
+        """Filas ``(fase, segundos, pasadas, fracción del total medido)`` de mayor a menor"""
+        times = list(self.times.items())
+        total = sum(seconds for _, seconds in times)
+        rows = [(phase, seconds, self.counts[phase], seconds / total if total else 0.0)
+                for phase, seconds in times if self.counts[phase]]
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows
+
+    def format_report(self):
+        lines = []
+        for phase, seconds, count, share in self.report():
+            label = PHASE_LABELS.get(phase, phase)
+            per_call = seconds / count * 1e6 if count else 0.0
+            lines.append(f"{label:<26} {seconds * 1000:10.2f} ms {share:6.1%} "
+                         f"{count:>10,} × {per_call:7.2f} µs")
+        lines.append(f"Rebanadas: {self.slices:,} ({self.slices_per_second():,.0f} rebanadas/s "
+                     f"en el motor)")
+        return '\n'.join(lines)
+
+
+def profile_rr_steps(processes, quantum, switch_cost=0, warmup=0, profiler=None,
+                     render_logs=True):
+    """``schedule_rr_step_by_step`` con todas las fases medidas.
+
+    Además de las fases del motor mide ``record`` (``StepHistory.append``)
+    y, con ``render_logs``, ``logging``: el texto de cada paso, como al
+    recorrer la simulación en la interfaz. Devuelve ``(historial, perfilador)``.
+    """
+    if profiler is None:
+        profiler = PhaseProfiler()
+    history = StepHistory()
+    for step in iter_rr_steps(processes, quantum, switch_cost, warmup, profiler=profiler):
+        with profiler.measure('record'):
+            history.append(**step)
+    if render_logs:
+        for index in range(len(history)):
+            with profiler.measure('logging'):
+                history.logs(index)
+    return history, profiler
+
+
+def run_with_cprofile(function, stream, limit=25):
+    """Ejecutar ``function()`` con cProfile y escribir en ``stream`` las funciones más costosas"""
+    profile = cProfile.Profile()
+    result = profile.runcall(function)
+    stats = pstats.Stats(profile, stream=stream)
+    stats.strip_dirs().sort_stats('cumulative').print_stats(limit)
+    return result
+
+
+def run_with_tracemalloc(function, stream, limit=10):
+    """Ejecutar ``function()`` con tracemalloc y escribir en ``stream`` el pico y las líneas que más reservan"""
+    tracemalloc.start()
+    try:
+        result = function()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, linecache.__file__),
+    ))
+    print(f"Memoria: pico {peak / 2 ** 20:.1f} MiB, retenida {current / 2 ** 20:.1f} MiB",
+          file=stream)
+    for statistic in snapshot.statistics('lineno')[:limit]:
+        frame = statistic.traceback[0]
+        print(f"{statistic.size / 2 ** 20:9.2f} MiB {statistic.count:>10,} bloques  "
+              f"{frame.filename}:{frame.lineno}", file=stream)
+    return result
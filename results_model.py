@@ -0,0 +1,148 @@
+"""Modelo incremental de la tabla de resultados.
+
+``ResultsModel`` mantiene los procesos completados ordenados por la columna
+elegida e inserta cada proceso nuevo en su posición con búsqueda binaria, en
+lugar de vaciar la tabla y crear de nuevo todas las celdas en cada paso. Las
+sumas para los promedios se actualizan al agregar o quitar procesos.
+"""
+from bisect import bisect_left
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# (encabezado, atributo de Process)
+COLUMNS = (
+    ('Proceso', 'id'),
+    ('Llegada', 'arrival'),
+    ('Ráfaga', 'original_burst'),
+    ('Tf', 'finish_time'),
+    ('Tr', 'turnaround'),
+    ('Te', 'waiting'),
+)
+# Por debajo de este número de cambios siempre se inserta uno por uno
+BULK_MIN = 64
+
+
+class ResultsModel(QAbstractTableModel):
+    """Procesos completados hasta el paso mostrado.
+
+    Las filas se guardan siempre en orden ascendente según
+    ``sort_column`` (el orden de finalización desempata); el orden
+    descendente solo invierte el índice de las filas.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sort_column = 0
+        self.sort_order = Qt.AscendingOrder
+        self.completed = []  # Lista compartida de completados (orden de finalización)
+        self.count = 0  # Procesos de ``completed`` incluidos en la tabla
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self._keys = []  # (valor de la columna, orden de finalización), ascendente
+
+    # --- Interfaz de QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        process = self.completed[self._keys[self._position(index.row())][1]]
+        return str(getattr(process, COLUMNS[index.column()][1]))
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return COLUMNS[section][0]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        if column != self.sort_column:
+            self.sort_column = column
+            self._keys = sorted(self._key(i) for i in range(self.count))
+        self.sort_order = order
+        self.layoutChanged.emit()
+
+    # --- Operaciones ---
+
+    def reset(self):
+        self.beginResetModel()
+        self.completed = []
+        self.count = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self._keys = []
+        self.endResetModel()
+
+    def sync(self, completed, count):
+        """Mostrar los primeros ``count`` procesos de la lista ``completed``.
+
+        Solo se insertan (o quitan, al retroceder) los procesos que cambiaron
+        desde la última llamada.
+        """
+        if completed is not self.completed:
+            self.reset()
+            self.completed = completed
+        if abs(count - self.count) > max(BULK_MIN, self.count, count) // 2:
+            # Salto grande (al buscar un paso lejano): reordenar de una vez
+            self.beginResetModel()
+            self.count = count
+            self._keys = sorted(self._key(i) for i in range(count))
+            self.total_turnaround = sum(p.turnaround for p in completed[:count])
+            self.total_waiting = sum(p.waiting for p in completed[:count])
+            self.endResetModel()
+        while self.count < count:
+            self._insert(self.count)
+            self.count += 1
+        while self.count > count:
+            self.count -= 1
+            self._remove(self.count)
+
+    def average_turnaround(self):
+        return self.total_turnaround / self.count
+
+    def average_waiting(self):
+        return self.total_waiting / self.count
+
+    def current_time(self):
+        """Tiempo de finalización del último proceso completado"""
+        return self.completed[self.count - 1].finish_time
+
+    # --- Detalles internos ---
+
+    def _key(self, i):
+        return getattr(self.completed[i], COLUMNS[self.sort_column][1]), i
+
+    def _position(self, row):
+        if self.sort_order == Qt.DescendingOrder:
+            return len(self._keys) - 1 - row
+        return row
+
+    def _insert(self, i):
+        key = self._key(i)
+        position = bisect_left(self._keys, key)
+        # En orden descendente la fila nueva queda contando desde el final
+        row = len(self._keys) - position if self.sort_order == Qt.DescendingOrder else position
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._keys.insert(position, key)
+        self.endInsertRows()
+        process = self.completed[i]
+        self.total_turnaround += process.turnaround
+        self.total_waiting += process.waiting
+
+    def _remove(self, i):
+        key = self._key(i)
+        position = bisect_left(self._keys, key)
+        row = self._position(position)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._keys[position]
+        self.endRemoveRows()
+        process = self.completed[i]
+        self.total_turnaround -= process.turnaround
+        self.total_waiting -= process.waiting
@@ -0,0 +1,1186 @@
+"""Núcleo de planificación Round Robin sin dependencias de interfaz gráfica.
+
+Este módulo solo usa la biblioteca estándar, de modo que puede importarse
+desde procesos por lotes o scripts sin cargar PyQt5 ni matplotlib.
+"""
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Sequence
+from operator import le
+
+# Identificador de los segmentos de cambio de contexto en la lista de eventos:
+# ``(CONTEXT_SWITCH, inicio, fin, 0, 0)`` (no avanza ningún proceso)
+CONTEXT_SWITCH = '⇄'
+# Pasos máximos entre puntos de control de ``iter_rr_steps`` sin llegadas
+CHECKPOINT_STEPS = 64
+
+
+class ProcessNode:
+    """Nodo para la lista circular de procesos.
+
+    ``CircularQueue`` ya no crea un objeto por nodo (enlaza índices); la
+    clase se conserva para el código que la importa.
+    """
+    __slots__ = ('process', 'next', 'prev')
+
+    def __init__(self, process):
+        self.process = process
+        self.next = None
+        self.prev = None
+
+class QueueView(Sequence):
+    """Estado de la cola circular en un momento dado, sin copiarlo.
+
+    Es una ventana ``[inicio, fin)`` sobre el registro de IDs de la cola,
+    que solo crece por el final: lo ya escrito no cambia, así que la vista
+    sigue siendo válida aunque la cola avance. Se compara, se recorre y se
+    muestra igual que la lista de IDs equivalente.
+    """
+    __slots__ = ('_log', '_start', '_stop')
+
+    def __init__(self, log, start, stop):
+        self._log = log
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            offsets = range(self._start, self._stop)[index]
+            if offsets.step == 1:
+                return self._log[offsets.start:offsets.stop]
+            return [self._log[offset] for offset in offsets]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice fuera de la cola")
+        return self._log[self._start + index]
+
+    def __iter__(self):
+        log = self._log
+        for index in range(self._start, self._stop):
+            yield log[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (QueueView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self._log[self._start:self._stop])
+
+
+class CircularQueue:
+    """Lista circular dinámica para el algoritmo Round Robin.
+
+    Los nodos son posiciones en arreglos paralelos: ``_items`` guarda el
+    proceso y ``_next``/``_prev`` los índices de sus vecinos. Las posiciones
+    de los procesos eliminados se reutilizan, así que cada proceso en la cola
+    ocupa unos pocos bytes en lugar de un objeto nodo propio.
+
+    Además se lleva el registro ``_order`` de los IDs en el orden en que
+    pasan al final de la cola (al llegar o al rotar). La cola siempre es la
+    ventana ``_order[_head:]``, por lo que ``status_view`` obtiene su estado
+    en O(1) sin recorrer los nodos.
+    """
+    def __init__(self):
+        self.current = -1  # Posición del nodo actual (-1: cola vacía)
+        self.size = 0
+        self._items = []
+        self._next = array('q')
+        self._prev = array('q')
+        self._free = []  # Posiciones libres para reutilizar
+        self._order = []  # IDs en orden de llegada al final de la cola
+        self._head = 0  # Inicio de la cola dentro de ``_order``
+    
+    def is_empty(self):
+        return self.size == 0
+    
+    def add_process(self, process):
+        """Agregar proceso al final de la cola circular; devuelve su posición"""
+        if self._free:
+            node = self._free.pop()
+            self._items[node] = process
+        else:
+            node = len(self._items)
+            self._items.append(process)
+            self._next.append(node)
+            self._prev.append(node)
+        
+        if self.is_empty():
+            self.current = node
+            self._next[node] = node
+            self._prev[node] = node
+        else:
+            # Insertar antes del nodo actual (al final de la cola)
+            last_node = self._prev[self.current]
+            self._next[node] = self.current
+            self._prev[node] = last_node
+            self._next[last_node] = node
+            self._prev[self.current] = node
+        
+        self._order.append(process.id)
+        self.size += 1
+        return node
+    
+    def get_next_process(self):
+        """Obtener el siguiente proceso y mover el puntero"""
+        if self.is_empty():
+            return None
+        
+        current_process = self._items[self.current]
+        self.current = self._next[self.current]
+        # El proceso actual pasa al final: la ventana avanza una posición
+        self._order.append(current_process.id)
+        self._advance()
+        return current_process
+    
+    def remove_current_process(self):
+        """Eliminar el proceso actual de la cola"""
+        if self.is_empty():
+            return None
+        
+        node = self.current
+        removed_process = self._items[node]
+        self._items[node] = None
+        self._free.append(node)
+        self._advance()
+        
+        if self.size == 1:
+            self.current = -1
+            self.size = 0
+            return removed_process
+        
+        # Más de un proceso
+        prev_node = self._prev[node]
+        next_node = self._next[node]
+        
+        self._next[prev_node] = next_node
+        self._prev[next_node] = prev_node
+        self.current = next_node
+        self.size -= 1
+        
+        return removed_process
+    
+    def peek_current(self):
+        """Ver el proceso actual sin moverlo"""
+        if self.is_empty():
+            return None
+        return self._items[self.current]
+    
+    def processes(self):
+        """Procesos de la cola en orden, empezando por el actual"""
+        node = self.current
+        for _ in range(self.size):
+            yield self._items[node]
+            node = self._next[node]
+    
+    def get_queue_status(self):
+        """Obtener el estado actual de la cola como lista de IDs"""
+        return self._order[self._head:]
+    
+    def status_view(self):
+        """Estado actual de la cola en O(1), como ``QueueView``"""
+        return QueueView(self._order, self._head, len(self._order))
+    
+    def _advance(self):
+        self._head += 1
+        # Cuando la parte consumida supera a la cola, se empieza un registro
+        # nuevo (coste amortizado O(1)); las vistas ya creadas conservan el
+        # anterior, que no se modifica
+        if self._head > max(self.size, 64):
+            self._order = self._order[self._head:]
+            self._head = 0
+    
+    def get_size(self):
+        return self.size
+
+class Process:
+    # Sin __dict__ por instancia; para cargas de millones de procesos la
+    # representación compacta es ``ProcessTable``
+    __slots__ = ('id', 'arrival', 'burst', 'original_burst', 'remaining',
+                 'finish_time', 'turnaround', 'waiting', 'start_time', 'priority')
+
+    def __init__(self, pid, arrival, burst, priority=0):
+        self.id = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority  # Menor número = más prioridad (solo algunas políticas)
+        self.original_burst = burst
+        self.remaining = burst
+        self.finish_time = 0
+        self.turnaround = 0
+        self.waiting = 0
+        self.start_time = -1
+
+    def copy(self):
+        """Copia independiente del proceso (mucho más barata que ``deepcopy``)"""
+        clone = Process(self.id, self.arrival, self.burst, self.priority)
+        clone.original_burst = self.original_burst
+        clone.remaining = self.remaining
+        clone.finish_time = self.finish_time
+        clone.turnaround = self.turnaround
+        clone.waiting = self.waiting
+        clone.start_time = self.start_time
+        return clone
+
+
+class ProcessView:
+    """Vista de solo lectura de una fila de ``ProcessTable`` con los atributos de ``Process``"""
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    id = property(lambda self: self.table.ids[self.index])
+    arrival = property(lambda self: self.table.arrival[self.index])
+    burst = property(lambda self: self.table.burst[self.index])
+    original_burst = burst
+    priority = property(lambda self: self.table.priority[self.index])
+    remaining = property(lambda self: self.table.remaining[self.index])
+    finish_time = property(lambda self: self.table.finish_time[self.index])
+    start_time = property(lambda self: self.table.start_time[self.index])
+
+    @property
+    def turnaround(self):
+        finish = self.finish_time
+        return finish - self.arrival if finish else 0
+
+    @property
+    def waiting(self):
+        finish = self.finish_time
+        return finish - self.arrival - self.burst if finish else 0
+
+    def copy(self):
+        """``Process`` independiente con los valores de la fila"""
+        clone = Process(self.id, self.arrival, self.burst, self.priority)
+        clone.remaining = self.remaining
+        clone.finish_time = self.finish_time
+        clone.turnaround = self.turnaround
+        clone.waiting = self.waiting
+        clone.start_time = self.start_time
+        return clone
+
+
+class ProcessRows(Sequence):
+    """Filas de una ``ProcessTable`` en el orden de ``order``, sin copiarlas"""
+    __slots__ = ('table', 'order')
+
+    def __init__(self, table, order):
+        self.table = table
+        self.order = order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProcessRows(self.table, self.order[index])
+        return ProcessView(self.table, self.order[index])
+
+    def __iter__(self):
+        table = self.table
+        return (ProcessView(table, index) for index in self.order)
+
+
+class ProcessTable(Sequence):
+    """Tabla de procesos como estructura de arreglos.
+
+    Cada campo numérico de ``Process`` es una columna ``array``: ``'q'``
+    mientras todos sus valores sean enteros y ``'d'`` desde que aparece uno
+    fraccionario. Los IDs van en una lista (las cadenas se comparten con
+    quien las creó). Un proceso ocupa 56 bytes más su ID, en lugar de un
+    objeto con un entero por atributo, y copiar la tabla es copiar siete
+    bloques de memoria.
+
+    Los elementos son ``ProcessView``, así que la tabla sirve de entrada a
+    cualquier motor (los que trabajan con objetos copian cada fila con
+    ``copy``). ``schedule_rr_metrics`` trabaja directamente sobre las
+    columnas y devuelve los completados como ``ProcessRows`` de su tabla.
+    """
+    COLUMNS = ('arrival', 'burst', 'priority', 'remaining', 'finish_time', 'start_time')
+
+    def __init__(self):
+        self.ids = []
+        for name in self.COLUMNS:
+            setattr(self, name, array('q'))
+        self._columns = [getattr(self, name) for name in self.COLUMNS]
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Tabla con los procesos de ``processes`` (cualquier iterable, se recorre una vez)"""
+        if isinstance(processes, ProcessTable):
+            return processes.copy()
+        table = cls()
+        if not isinstance(processes, Sequence):
+            # Un iterador se consume fila por fila, sin tener los objetos en memoria
+            append = table.append
+            for p in processes:
+                append(p.id, p.arrival, p.burst, p.priority, p.remaining, p.finish_time,
+                       p.start_time)
+            return table
+        table.ids = [p.id for p in processes]
+        for name in cls.COLUMNS:
+            values = [getattr(p, name) for p in processes]
+            try:
+                setattr(table, name, array('q', values))
+            except TypeError:
+                setattr(table, name, array('d', values))
+        table._columns = [getattr(table, name) for name in cls.COLUMNS]
+        return table
+
+    def append(self, pid, arrival, burst, priority=0, remaining=None, finish_time=0,
+               start_time=-1):
+        values = (arrival, burst, priority, burst if remaining is None else remaining,
+                  finish_time, start_time)
+        try:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+        except TypeError:  # Un valor fraccionario en una columna entera
+            for name, value in zip(self.COLUMNS, values):
+                if len(getattr(self, name)) == len(self.ids):
+                    if not isinstance(value, int):
+                        self.widen(name)
+                    getattr(self, name).append(value)
+        self.ids.append(pid)
+
+    def widen(self, *names):
+        """Pasar las columnas ``names`` a ``'d'`` para que admitan tiempos fraccionarios"""
+        for name in names:
+            column = getattr(self, name)
+            if column.typecode != 'd':
+                setattr(self, name, array('d', column))
+        self._columns = [getattr(self, name) for name in self.COLUMNS]
+
+    def copy(self):
+        clone = ProcessTable()
+        clone.ids = list(self.ids)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(clone, name, array(column.typecode, column))
+        clone._columns = [getattr(clone, name) for name in self.COLUMNS]
+        return clone
+
+    def rows(self, order):
+        """Las filas de los índices ``order`` en ese orden"""
+        return ProcessRows(self, order)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProcessRows(self, range(len(self.ids))[index])
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError('índice de proceso fuera de rango')
+        return ProcessView(self, index)
+
+    def __iter__(self):
+        return (ProcessView(self, index) for index in range(len(self.ids)))
+
+
+class StepHistory:
+    """Historial de pasos de la simulación codificado por deltas.
+
+    Cada paso guarda solo los datos estructurados de lo que cambió en él (el
+    evento nuevo, el proceso completado y las llegadas, si las hay); el texto
+    de los logs se genera bajo demanda con ``logs(paso)``. Los eventos y
+    procesos completados se acumulan una sola vez en listas compartidas y
+    cada ``checkpoint_interval`` pasos se guarda un punto de control con los
+    totales acumulados, de modo que el estado completo de cualquier paso se
+    reconstruye bajo demanda sin recorrer todo el historial.
+
+    Si la simulación cobra sobrecarga por cambio de contexto, el paso que la
+    paga agrega a ``events`` el segmento del cambio justo antes del evento
+    de su rebanada.
+    """
+
+    EVENT = 1
+    COMPLETED = 2
+    START = 4
+    SUMMARY = 8
+    SWITCH = 16
+    CONTEXT = 32
+
+    KINDS = {'start': START, 'slice': 0, 'summary': SUMMARY}
+
+    def __init__(self, checkpoint_interval=64):
+        self.checkpoint_interval = checkpoint_interval
+        self.quantum = None
+        self.policy = None  # Nombre de la política si no es la lista circular
+        self.overhead = 0  # Sobrecarga por cambio de contexto (ms)
+        self.events = []  # Todos los eventos, en orden
+        self.completed = []  # Todos los procesos completados, en orden
+        self._arrivals = []  # None o ((pid, posición), ...), (pid, ...)
+        self._times = []
+        self._queues = []
+        # Bits EVENT / COMPLETED / START / SUMMARY, SWITCH (segmento de sobrecarga en
+        # ``events``) y CONTEXT (cambio de contexto, cueste o no)
+        self._deltas = bytearray()
+        self._checkpoints = []  # (eventos, completados, cambios) antes de cada bloque
+        self._switches = 0
+
+    def append(self, current_time, queue_status, event=None, completed=None,
+               kind='slice', arrivals=(), arrived_during=(), quantum=None, policy=None,
+               switch=None, overhead=None, switched=False):
+        """Registrar un paso con solo los cambios que produjo"""
+        if len(self._deltas) % self.checkpoint_interval == 0:
+            self._checkpoints.append((len(self.events), len(self.completed), self._switches))
+
+        delta = self.KINDS[kind]
+        if quantum is not None:
+            self.quantum = quantum
+        if policy is not None:
+            self.policy = policy
+        if overhead is not None:
+            self.overhead = overhead
+        if switch is not None:
+            self.events.append(switch)
+            delta |= self.SWITCH
+        if switched or switch is not None:
+            self._switches += 1
+            delta |= self.CONTEXT
+        if event is not None:
+            self.events.append(event)
+            delta |= self.EVENT
+        if completed is not None:
+            self.completed.append(completed)
+            delta |= self.COMPLETED
+
+        self._deltas.append(delta)
+        self._arrivals.append((tuple(arrivals), tuple(arrived_during))
+                              if arrivals or arrived_during else None)
+        self._times.append(current_time)
+        self._queues.append(queue_status)
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def prefix(self, steps):
+        """Historial nuevo con solo los primeros ``steps`` pasos (este no cambia)"""
+        history = StepHistory(self.checkpoint_interval)
+        history.quantum = self.quantum
+        history.policy = self.policy
+        history.overhead = self.overhead
+        if steps:
+            n_events, n_completed = self.counts(steps - 1)
+            history._switches = self.switch_count(steps - 1)
+            history.events = self.events[:n_events]
+            history.completed = self.completed[:n_completed]
+        history._arrivals = self._arrivals[:steps]
+        history._times = self._times[:steps]
+        history._queues = self._queues[:steps]
+        history._deltas = self._deltas[:steps]
+        history._checkpoints = self._checkpoints[:-(-steps // self.checkpoint_interval)]
+        return history
+
+    def _index(self, step):
+        if step < 0:
+            step += len(self)
+        if not 0 <= step < len(self):
+            raise IndexError("paso fuera del historial")
+        return step
+
+    def counts(self, step):
+        """Cantidad de eventos y de procesos completados hasta el paso dado"""
+        step = self._index(step)
+        block = step // self.checkpoint_interval
+        n_events, n_completed, _ = self._checkpoints[block]
+        for delta in self._deltas[block * self.checkpoint_interval:step + 1]:
+            n_events += (delta & self.EVENT) + ((delta & self.SWITCH) >> 4)
+            n_completed += (delta & self.COMPLETED) >> 1
+        return n_events, n_completed
+
+    def switch_count(self, step):
+        """Cambios de contexto hasta el paso dado, tengan o no sobrecarga"""
+        step = self._index(step)
+        block = step // self.checkpoint_interval
+        switches = self._checkpoints[block][2]
+        for delta in self._deltas[block * self.checkpoint_interval:step + 1]:
+            switches += (delta & self.CONTEXT) >> 5
+        return switches
+
+    def slice_count(self, step):
+        """Rebanadas ejecutadas hasta el paso dado (eventos sin los segmentos de sobrecarga)"""
+        n_events = self.counts(step)[0]
+        return n_events - self.switch_count(step) if self.overhead else n_events
+
+    def step_event(self, step):
+        """Evento nuevo del paso dado, o None"""
+        step = self._index(step)
+        if not self._deltas[step] & self.EVENT:
+            return None
+        return self.events[self.counts(step)[0] - 1]
+
+    def step_completed(self, step):
+        """Proceso completado en el paso dado, o None"""
+        step = self._index(step)
+        if not self._deltas[step] & self.COMPLETED:
+            return None
+        return self.completed[self.counts(step)[1] - 1]
+
+    def step_arrivals(self, step):
+        """Llegadas del paso: ((pid, posición), ...) antes y (pid, ...) durante"""
+        return self._arrivals[self._index(step)] or ((), ())
+
+    def involves(self, step, pid):
+        """Indicar si el proceso ``pid`` ejecuta, llega o termina en el paso dado"""
+        event = self.step_event(step)
+        if event is not None and event[0] == pid:
+            return True
+        before, during = self.step_arrivals(step)
+        return pid in during or any(arrival[0] == pid for arrival in before)
+
+    def logs(self, step):
+        """Texto de los logs del paso dado, generado a partir de sus datos"""
+        step = self._index(step)
+        delta = self._deltas[step]
+        if delta & self.START:
+            return _start_logs(self.quantum, self.policy, self.overhead)
+        n_events, n_completed = self.counts(step)
+        if delta & self.SUMMARY:
+            return _summary_logs(self.completed[:n_completed], self.slice_count(step), self.policy,
+                                 self.switch_count(step), self.overhead, self._times[step])
+        before, during = self.step_arrivals(step)
+        return _slice_logs(self.events[n_events - 1], before, during,
+                           self.completed[n_completed - 1] if delta & self.COMPLETED else None,
+                           self._queues[step], self.policy,
+                           self.events[n_events - 2] if delta & self.SWITCH else None)
+
+    def log_line_count(self, step):
+        """Cantidad de líneas de ``logs(paso)`` sin generar el texto"""
+        step = self._index(step)
+        delta = self._deltas[step]
+        if delta & self.START:
+            return 4
+        if delta & self.SUMMARY:
+            n_completed = self.counts(step)[1]
+            if not n_completed:
+                return 2
+            return 9 + n_completed + (2 if self.overhead else 0)
+        before, during = self.step_arrivals(step)
+        return (11 + 2 * (len(before) + len(during)) + (3 if delta & self.COMPLETED else 0)
+                + (2 if delta & self.SWITCH else 0))
+
+    def current_time(self, step):
+        return self._times[self._index(step)]
+
+    def queue_status(self, step):
+        return self._queues[self._index(step)]
+
+    def step_at_time(self, time):
+        """Primer paso cuyo tiempo actual es ``time`` o mayor (None si aún no llega)"""
+        step = bisect_left(self._times, time)
+        return step if step < len(self._times) else None
+
+    def events_until(self, step):
+        """Eventos ocurridos hasta el paso dado (inclusive)"""
+        return self.events[:self.counts(step)[0]]
+
+    def completed_until(self, step):
+        """Procesos completados hasta el paso dado (inclusive)"""
+        return self.completed[:self.counts(step)[1]]
+
+    def __getitem__(self, step):
+        step = self._index(step)
+        n_events, n_completed = self.counts(step)
+        return {
+            'logs': self.logs(step),
+            'events': self.events[:n_events],
+            'completed': self.completed[:n_completed],
+            'current_time': self._times[step],
+            'queue_status': self._queues[step]
+        }
+
+
+def _start_logs(quantum, policy=None, overhead=0):
+    settings = f"Quantum: {quantum}"
+    if overhead:
+        settings += f" • Cambio de contexto: {overhead} ms"
+    if policy is not None:
+        return [
+            f"=== INICIO DE SIMULACIÓN: {policy} ===",
+            settings,
+            "📋 Usando la cola de listos de la política",
+            "",
+        ]
+    return [
+        "=== INICIO DE SIMULACIÓN ROUND ROBIN CON LISTA CIRCULAR ===",
+        settings,
+        "🔄 Usando lista circular dinámica de nodos",
+        "",
+    ]
+
+
+def _slice_logs(event, arrivals, arrived_during, completed, queue_status, policy=None,
+                switch=None):
+    # Las demás políticas usan textos genéricos con el mismo número de líneas
+    circular = policy is None
+    pid, start_time, time, remaining_before, remaining_after = event
+    # Las llegadas se admiten al despachar, antes del cambio de contexto
+    arrival_time = switch[1] if switch is not None else start_time
+    step_logs = []
+    for arriving_id, position in arrivals:
+        if circular:
+            step_logs.append(f"⏰ Tiempo {arrival_time}: Proceso {arriving_id} llega a la cola circular")
+            step_logs.append(f"   🔗 Nodo creado y enlazado en posición {position}")
+        else:
+            step_logs.append(f"⏰ Tiempo {arrival_time}: Proceso {arriving_id} llega a la cola de listos")
+            step_logs.append(f"   🔗 Procesos en la cola: {position}")
+
+    if switch is not None:
+        step_logs.append(f"⇄ Tiempo {switch[1]}: Cambio de contexto hacia {pid}")
+        step_logs.append(f"   ⏳ Sobrecarga: {switch[2] - switch[1]} ms")
+
+    step_logs.append(f"🔒 Tiempo {start_time}: Procesador ENTRA en sección crítica")
+    if circular:
+        step_logs.append(f"   🎯 Nodo actual en cola circular: {pid}")
+    else:
+        step_logs.append(f"   🎯 Proceso elegido por la política: {pid}")
+    step_logs.append(f"   ⏱️ Tiempo restante antes: {remaining_before}")
+    step_logs.append(f"   🚀 Tiempo a ejecutar: {remaining_before - remaining_after}")
+    step_logs.append(f"🔓 Tiempo {time}: Procesador SALE de sección crítica")
+    step_logs.append(f"   ⏱️ Tiempo restante después: {remaining_after}")
+
+    for arriving_id in arrived_during:
+        step_logs.append(f"⏰ Tiempo {time}: Proceso {arriving_id} llega durante ejecución")
+        if circular:
+            step_logs.append(f"   🔗 Enlazado al final de la cola circular")
+        else:
+            step_logs.append(f"   🔗 Agregado a la cola de listos")
+
+    if completed is not None:
+        step_logs.append(f"✅ Proceso {pid} COMPLETADO")
+        if circular:
+            step_logs.append(f"   🗑️ Nodo eliminado de la cola circular")
+        else:
+            step_logs.append(f"   🗑️ Sale del sistema")
+        step_logs.append(f"   → Tf = {completed.finish_time} (tiempo final)")
+        step_logs.append(f"   → Tr = {completed.turnaround} (Tf - llegada = {completed.finish_time} - {completed.arrival})")
+        step_logs.append(f"   → Te = {completed.waiting} (Tr - ráfaga = {completed.turnaround} - {completed.original_burst})")
+    elif circular:
+        step_logs.append(f"🔄 Proceso {pid} continúa en cola circular")
+        step_logs.append(f"   ➡️ Puntero movido al siguiente nodo")
+    else:
+        step_logs.append(f"🔄 Proceso {pid} vuelve a la cola de listos")
+        step_logs.append(f"   ➡️ La política elige el siguiente proceso")
+
+    if circular:
+        step_logs.append(f"� Cola circular actual: {queue_status}")
+        step_logs.append(f"   📏 Tamaño: {len(queue_status)} nodos")
+    else:
+        step_logs.append(f"📋 Cola de listos: {queue_status}")
+        step_logs.append(f"   📏 Tamaño: {len(queue_status)} procesos")
+    step_logs.append("")
+    return step_logs
+
+
+def _summary_logs(completed, event_count, policy=None, switches=0, overhead=0, makespan=0):
+    final_logs = []
+    if policy is None:
+        final_logs.append("=== RESUMEN FINAL - LISTA CIRCULAR COMPLETADA ===")
+        final_logs.append("🔄 Todos los nodos han sido procesados y eliminados")
+    else:
+        final_logs.append(f"=== RESUMEN FINAL - {policy} ===")
+        final_logs.append("🔄 Todos los procesos han sido atendidos")
+
+    if completed:
+        total_turnaround = sum(p.turnaround for p in completed)
+        total_waiting = sum(p.waiting for p in completed)
+        avg_turnaround = total_turnaround / len(completed)
+        avg_waiting = total_waiting / len(completed)
+
+        final_logs.append("")
+        final_logs.append("Proceso | Llegada | Ráfaga | Tf | Tr | Te")
+        final_logs.append("--------|---------|--------|----|----|----")
+        for p in sorted(completed, key=lambda x: x.id):
+            final_logs.append(f"{p.id:7} | {p.arrival:7} | {p.original_burst:6} | {p.finish_time:2} | {p.turnaround:2} | {p.waiting:2}")
+
+        final_logs.append("")
+        final_logs.append(f"⏱️ Tiempo promedio de retorno: {avg_turnaround:.2f}")
+        final_logs.append(f"⏰ Tiempo promedio de espera: {avg_waiting:.2f}")
+        if policy is None:
+            final_logs.append(f"🔄 Total de rotaciones en cola circular: {event_count}")
+        else:
+            final_logs.append(f"🔄 Total de rebanadas ejecutadas: {event_count}")
+        if overhead:
+            metrics = overhead_metrics(completed, makespan, switches, overhead)
+            final_logs.append(f"⇄ Cambios de contexto: {switches} (sobrecarga total: {metrics['overhead']} ms)")
+            final_logs.append(f"⚙️ Eficiencia de CPU: {metrics['efficiency']:.1%} • "
+                              f"Throughput: {metrics['throughput']:.4f} procesos/ms")
+    return final_logs
+
+
+def overhead_metrics(completed, makespan, switches, overhead):
+    """Sobrecarga total, eficiencia de CPU y throughput efectivo.
+
+    La eficiencia es la fracción del tiempo ocupado de la CPU dedicada a
+    ejecutar procesos (sin cambios de contexto); el throughput, los
+    procesos completados por ms de simulación.
+    """
+    total = switches * overhead
+    useful = sum(p.original_burst for p in completed)
+    return {
+        'switches': switches,
+        'overhead': total,
+        'efficiency': useful / (useful + total) if useful + total else 1.0,
+        'throughput': len(completed) / makespan if makespan else 0.0,
+    }
+
+
+def iter_rr_steps(processes, quantum, switch_cost=0, warmup=0, checkpoints=None, profiler=None):
+    """Generar los pasos de la simulación Round Robin a medida que ocurren.
+
+    Cada paso es un diccionario con solo los datos estructurados de lo que
+    cambió en él, listo para ``StepHistory.append(**paso)``: ``kind``
+    (``'start'``, ``'slice'`` o ``'summary'``), ``current_time``,
+    ``queue_status``, ``event`` (el evento nuevo del diagrama de Gantt o
+    ``None``), ``completed`` (el proceso que terminó o ``None``),
+    ``arrivals`` (pares ``(pid, posición)`` de los que llegan antes de la
+    rebanada) y ``arrived_during`` (los que llegan durante ella). No se
+    genera texto: ``StepHistory.logs`` lo produce al mostrarlo. Como los
+    pasos se producen bajo demanda, quien los consume puede mostrar el
+    primero de inmediato sin esperar a que termine toda la simulación.
+
+    ``switch_cost`` y ``warmup`` (calentamiento de caché) se cobran cada vez
+    que la CPU pasa de un proceso a otro distinto; el paso lleva entonces
+    en ``switch`` el segmento ``(CONTEXT_SWITCH, inicio, fin, 0, 0)``.
+
+    Si se pasa la lista ``checkpoints``, se le agregan puntos de control
+    para reanudar la simulación con ``resume_rr_steps`` (ver allí).
+    ``profiler`` (un ``profiling.PhaseProfiler``) mide el tiempo de cada
+    fase del bucle; sin él no se mide nada.
+    """
+    # Copiar los procesos para no modificar los originales
+    proc_copies = [p.copy() for p in processes]
+    waiting_processes = sorted(proc_copies, key=lambda x: x.arrival)  # Procesos esperando llegar
+    
+    # Primer paso
+    yield {'kind': 'start', 'quantum': quantum, 'overhead': switch_cost + warmup,
+           'current_time': 0, 'queue_status': [], 'event': None, 'completed': None}
+    
+    yield from _rr_loop(waiting_processes, 0, CircularQueue(), None, 0, quantum,
+                        switch_cost + warmup, 1, checkpoints, profiler)
+
+
+def resume_rr_steps(checkpoint, processes, quantum, switch_cost=0, warmup=0, checkpoints=None,
+                    profiler=None):
+    """Continuar una simulación desde un punto de control de ``iter_rr_steps``.
+
+    Un punto de control es el estado al comienzo de una iteración, justo
+    antes de admitir llegadas: reloj, posición en la lista de llegadas,
+    orden de la cola con lo que le resta a cada proceso y el último proceso
+    que usó la CPU. Se toman en los límites de llegada (después de que llegó
+    algún proceso) y cada ``CHECKPOINT_STEPS`` pasos sin llegadas, espaciados
+    para que copiar la cola no cueste más que las rebanadas simuladas desde
+    el anterior.
+
+    ``processes`` puede ser la carga original más procesos nuevos agregados
+    al final, siempre que todos lleguen después de ``checkpoint['time']``:
+    hasta ese instante la simulación es idéntica, así que los pasos
+    generados continúan exactamente los ``checkpoint['step']`` primeros de
+    la simulación anterior (``StepHistory.prefix``) y solo se simula lo que
+    sigue. Los procesos de la simulación anterior no se modifican.
+    """
+    waiting_processes = sorted(processes, key=lambda x: x.arrival)
+    arrival_idx = checkpoint['arrival_idx']
+    # Las llegadas ya admitidas no se vuelven a leer
+    waiting_processes = [None] * arrival_idx + [p.copy() for p in waiting_processes[arrival_idx:]]
+    
+    circular_queue = CircularQueue()
+    restored = {}
+    for process, remaining, start_time in checkpoint['queue']:
+        clone = Process(process.id, process.arrival, process.burst, process.priority)
+        clone.remaining = remaining
+        clone.start_time = start_time
+        circular_queue.add_process(clone)
+        restored[process] = clone
+    last = restored.get(checkpoint['last'], checkpoint['last'])
+    
+    yield from _rr_loop(waiting_processes, arrival_idx, circular_queue, last, checkpoint['time'],
+                        quantum, switch_cost + warmup, checkpoint['step'], checkpoints, profiler)
+
+
+def _rr_loop(waiting_processes, arrival_idx, circular_queue, last, time, quantum, overhead,
+             step, checkpoints, profiler):
+    """Bucle de ``iter_rr_steps`` desde un estado dado (``step``: pasos ya generados)"""
+    checkpoint_step = None  # Paso del último punto de control
+    checkpoint_arrivals = arrival_idx  # Llegadas admitidas en ese punto
+    
+    while arrival_idx < len(waiting_processes) or not circular_queue.is_empty():
+        if profiler is not None:
+            profiler.mark()  # El tiempo del consumidor entre pasos no cuenta
+        
+        # Puntos de control en los límites de llegada (alguien llegó desde el
+        # anterior) o cada CHECKPOINT_STEPS pasos sin llegadas, siempre que
+        # copiar la cola no cueste más que lo simulado desde el anterior
+        if checkpoints is not None and (checkpoint_step is None or (
+                step - checkpoint_step >= circular_queue.size
+                and (arrival_idx != checkpoint_arrivals or step - checkpoint_step >= CHECKPOINT_STEPS))):
+            checkpoint_step = step
+            checkpoint_arrivals = arrival_idx
+            checkpoints.append({
+                'step': step, 'time': time, 'arrival_idx': arrival_idx, 'last': last,
+                'queue': [(p, p.remaining, p.start_time) for p in circular_queue.processes()],
+            })
+            if profiler is not None:
+                profiler.lap('checkpoint')
+        
+        arrivals = []
+        
+        # Agregar procesos que han llegado a la cola circular
+        while arrival_idx < len(waiting_processes) and waiting_processes[arrival_idx].arrival <= time:
+            arriving_process = waiting_processes[arrival_idx]
+            circular_queue.add_process(arriving_process)
+            arrivals.append((arriving_process.id, circular_queue.get_size()))
+            arrival_idx += 1
+        if profiler is not None:
+            profiler.lap('admission')
+        
+        # Si no hay procesos en cola, avanzar al siguiente proceso
+        if circular_queue.is_empty():
+            if arrival_idx < len(waiting_processes):
+                time = waiting_processes[arrival_idx].arrival
+                continue
+            else:
+                break
+        
+        # Obtener el proceso actual de la cola circular
+        current = circular_queue.peek_current()
+        
+        # Cambio de contexto: solo si la CPU pasa a otro proceso; se cuenta
+        # aunque no cueste, pero solo con sobrecarga ocupa un segmento del Gantt
+        switched = last is not None and current is not last
+        switch_event = None
+        if switched and overhead:
+            switch_event = (CONTEXT_SWITCH, time, time + overhead, 0, 0)
+            time += overhead
+        last = current
+        start_time = time
+        
+        # Establecer tiempo de inicio si es la primera vez
+        if current.start_time == -1:
+            current.start_time = start_time
+        
+        # Calcular tiempo de ejecución
+        exec_time = min(quantum, current.remaining)
+        remaining_before = current.remaining
+        
+        # Ejecutar el proceso
+        time += exec_time
+        current.remaining -= exec_time
+        
+        # Agregar evento para el diagrama de Gantt
+        current_event = (current.id, start_time, time, remaining_before, current.remaining)
+        completed_process = None
+        if profiler is not None:
+            profiler.lap('dispatch')
+        
+        # Agregar procesos que llegaron durante la ejecución
+        arrived_during = []
+        while arrival_idx < len(waiting_processes) and waiting_processes[arrival_idx].arrival <= time:
+            arriving_process = waiting_processes[arrival_idx]
+            circular_queue.add_process(arriving_process)
+            arrived_during.append(arriving_process.id)
+            arrival_idx += 1
+        
+        # Verificar si el proceso terminó
+        if current.remaining == 0:
+            current.finish_time = time
+            current.turnaround = current.finish_time - current.arrival
+            current.waiting = current.turnaround - current.original_burst
+            completed_process = current
+            
+            # Remover de la cola circular
+            circular_queue.remove_current_process()
+        else:
+            # Mover al siguiente nodo en la cola circular
+            circular_queue.get_next_process()  # Esto mueve el puntero al siguiente
+        if profiler is not None:
+            profiler.lap('completion')
+            profiler.slices += 1
+        
+        queue_status = circular_queue.status_view()
+        if profiler is not None:
+            profiler.lap('snapshot')
+        
+        # Paso actual (solo el evento, el proceso completado y las llegadas nuevos)
+        step += 1
+        yield {'kind': 'slice', 'current_time': time,
+               'queue_status': queue_status,
+               'event': current_event, 'completed': completed_process,
+               'arrivals': arrivals, 'arrived_during': arrived_during,
+               'switch': switch_event, 'switched': switched}
+    
+    # Paso final con resumen
+    yield {'kind': 'summary', 'current_time': time, 'queue_status': [],
+           'event': None, 'completed': None}
+
+
+def schedule_rr_step_by_step(processes, quantum, switch_cost=0, warmup=0):
+    """Simular Round Robin completo y devolver su ``StepHistory``"""
+    steps = StepHistory()  # Cada paso guarda solo sus cambios
+    for step in iter_rr_steps(processes, quantum, switch_cost, warmup):
+        steps.append(**step)
+    return steps
+
+
+def schedule_rr_metrics(processes, quantum, switch_cost=0, warmup=0):
+    """Round Robin que solo calcula las métricas finales.
+
+    Sigue exactamente la misma semántica que ``schedule_rr_step_by_step``
+    (mismo orden de llegadas, desempates y reencolado), pero sin logs, sin
+    pasos ni recorridos de la cola: cada rebanada de quantum cuesta O(1).
+    Trabaja sobre las columnas de una ``ProcessTable`` (copia de
+    ``processes``, que puede ser una tabla o cualquier iterable de
+    procesos) y la cola guarda índices de filas, así que no crea un objeto
+    por proceso. Devuelve un diccionario con los procesos completados (en
+    orden de finalización, como ``ProcessRows`` con Tf/Tr/Te calculados),
+    el tiempo final, el número de eventos (rebanadas) que habría tenido el
+    diagrama de Gantt, los cambios de contexto (``switches``) y su
+    sobrecarga total (``overhead``).
+    """
+    table = ProcessTable.from_processes(processes)
+    overhead = switch_cost + warmup
+    if not (isinstance(quantum, int) and isinstance(overhead, int)
+            and table.arrival.typecode == table.remaining.typecode == 'q'):
+        table.widen('remaining', 'finish_time', 'start_time')
+    arrival = table.arrival
+    remaining = table.remaining
+    finish = table.finish_time
+    start = table.start_time
+    total = len(table)
+    # Orden de llegada estable; las cargas generadas o leídas suelen venir ya ordenadas
+    if all(map(le, arrival, arrival[1:])):
+        order = range(total)
+    else:
+        order = array('q', sorted(range(total), key=arrival.__getitem__))
+
+    time = 0
+    arrival_idx = 0
+    ready = deque()  # Índices de filas; el proceso actual siempre está a la izquierda
+    completed = array('q')
+    event_count = 0
+    switches = 0
+    last = -1
+
+    while arrival_idx < total or ready:
+        while arrival_idx < total and arrival[order[arrival_idx]] <= time:
+            ready.append(order[arrival_idx])
+            arrival_idx += 1
+
+        if not ready:
+            time = arrival[order[arrival_idx]]
+            continue
+
+        current = ready[0]
+        if current != last and last >= 0:
+            switches += 1
+            time += overhead
+        last = current
+        if start[current] == -1:
+            start[current] = time
+
+        exec_time = min(quantum, remaining[current])
+        time += exec_time
+        remaining[current] -= exec_time
+        event_count += 1
+
+        # Los que llegan durante la ejecución quedan detrás del proceso actual
+        while arrival_idx < total and arrival[order[arrival_idx]] <= time:
+            ready.append(order[arrival_idx])
+            arrival_idx += 1
+
+        ready.popleft()
+        if remaining[current] == 0:
+            finish[current] = time
+            completed.append(current)
+        else:
+            ready.append(current)
+
+    return {
+        'completed': table.rows(completed),
+        'current_time': time,
+        'event_count': event_count,
+        'switches': switches,
+        'overhead': switches * overhead
+    }
+
+
+GANTT_MODES = (None, 'full', 'compressed')
+# Rondas mínimas para que ``schedule_rr_bulk`` salte un bloque: saltar menos
+# no compensa recorrer la cola para calcularlo
+BULK_MIN_ROUNDS = 2
+
+
+def schedule_rr_bulk(processes, quantum, gantt=None, switch_cost=0, warmup=0, sink=None):
+    """Round Robin que avanza rondas completas de golpe.
+
+    Mientras la cola de listos es estable (ninguna llegada pendiente antes
+    de cierto tiempo T y ningún proceso termina en la ronda), el
+    comportamiento es totalmente predecible: cada proceso recibe ``quantum``
+    por ronda. En lugar de simular rebanada por rebanada, se calcula cuántas
+    rondas completas caben antes de la próxima finalización o llegada y se
+    saltan todas juntas; la ronda en la que ocurre el cambio se simula
+    normalmente. Con tiempos enteros (llegadas, ráfagas, quantum y
+    sobrecarga) los Tf/Tr/Te, el tiempo final y el número de eventos son
+    idénticos a los de ``schedule_rr_step_by_step``.
+
+    Cada bloque cuesta O(n) para n procesos en la cola, así que solo se
+    salta cuando caben al menos ``BULK_MIN_ROUNDS`` rondas. Con colas
+    cortas y ráfagas de pocos quanta (lo habitual) ``schedule_rr_metrics``
+    es más rápido; este motor gana cuando las ráfagas son mucho más largas
+    que el quantum.
+
+    ``gantt`` controla la lista de eventos devuelta en ``'events'``:
+
+    - ``None``: no se generan eventos (solo métricas).
+    - ``'full'``: la misma lista de eventos que la simulación paso a paso.
+    - ``'compressed'``: cada bloque de rondas saltadas se resume en un evento
+      por proceso ``(pid, inicio_primera, fin_ultima, restante_antes,
+      restante_despues)``, que abarca rebanadas intercaladas con las de los
+      demás procesos del bloque.
+
+    Con ``switch_cost``/``warmup`` cada cambio de proceso cuesta esa
+    sobrecarga, como en ``schedule_rr_metrics``. En una ronda con dos o
+    más procesos todas las rebanadas cambian de proceso, así que la ronda
+    sigue siendo predecible; los segmentos de cambio aparecen en
+    ``'events'`` (en modo ``'compressed'``, uno por bloque).
+
+    ``sink`` es un objeto con ``append`` (por ejemplo un
+    ``tracefile.TraceWriter``) que recibe los eventos en lugar de la lista,
+    para no tenerlos en memoria; sin ``gantt`` se usa ``'full'``.
+    """
+    if sink is not None and gantt is None:
+        gantt = 'full'
+    if gantt not in GANTT_MODES:
+        raise ValueError(f"modo de Gantt no válido: {gantt!r}")
+
+    proc_copies = [p.copy() for p in processes]
+    waiting_processes = sorted(proc_copies, key=lambda x: x.arrival)
+    total = len(waiting_processes)
+    overhead = switch_cost + warmup
+
+    time = 0
+    arrival_idx = 0
+    ready = deque()  # El proceso actual siempre está a la izquierda
+    completed = []
+    events = (sink if sink is not None else []) if gantt else None
+    event_count = 0
+    switches = 0
+    last = None  # Último proceso que usó la CPU
+
+    while arrival_idx < total or ready:
+        while arrival_idx < total and waiting_processes[arrival_idx].arrival <= time:
+            ready.append(waiting_processes[arrival_idx])
+            arrival_idx += 1
+
+        if not ready:
+            time = waiting_processes[arrival_idx].arrival
+            continue
+
+        # Rondas completas que se pueden saltar: nadie termina en ellas y
+        # ninguna rebanada acaba en o después de la próxima llegada. Con dos
+        # o más procesos cada rebanada es un cambio de contexto; la primera
+        # del bloque también lo es salvo al comienzo (sin proceso anterior)
+        size = len(ready)
+        switch = overhead if size > 1 else 0
+        slot = quantum + switch  # Cambio de contexto + rebanada
+        round_time = size * slot
+        # Solo se salta si la primera rebanada cambia de proceso igual que las demás
+        steady = last is not None if size > 1 else last is ready[0]
+        rounds = 0
+        if steady:
+            # Primero el límite de la próxima llegada, que cuesta O(1): si no
+            # deja saltar BULK_MIN_ROUNDS rondas no vale la pena recorrer la
+            # cola buscando la ráfaga mínima
+            rounds = -(-(waiting_processes[arrival_idx].arrival - time) // round_time) - 1 \
+                if arrival_idx < total else BULK_MIN_ROUNDS
+            if rounds >= BULK_MIN_ROUNDS:
+                rounds = min(rounds, -(-min(p.remaining for p in ready) // quantum) - 1)
+            rounds = int(rounds) if rounds >= BULK_MIN_ROUNDS else 0
+
+        if rounds > 0:
+            for position, process in enumerate(ready):
+                start = time + position * slot + switch
+                if process.start_time == -1:
+                    process.start_time = start
+                remaining_before = process.remaining
+                process.remaining -= rounds * quantum
+                if gantt == 'compressed':
+                    end = start + (rounds - 1) * round_time + quantum
+                    events.append((process.id, start, end, remaining_before, process.remaining))
+            if gantt == 'compressed' and switch:
+                events.append((CONTEXT_SWITCH, time, time + rounds * round_time - quantum, 0, 0))
+            if gantt == 'full':
+                for round_index in range(rounds):
+                    round_start = time + round_index * round_time
+                    for position, process in enumerate(ready):
+                        start = round_start + position * slot + switch
+                        after = process.remaining + (rounds - round_index - 1) * quantum
+                        if switch:
+                            events.append((CONTEXT_SWITCH, start - switch, start, 0, 0))
+                        events.append((process.id, start, start + quantum, after + quantum, after))
+            time += rounds * round_time
+            event_count += rounds * size
+            if size > 1:
+                switches += rounds * size
+                last = ready[-1]
+
+        # Simular una ronda rebanada por rebanada (aquí ocurre el cambio)
+        for _ in range(size):
+            if not ready:
+                break
+            current = ready[0]
+            if last is not None and current is not last:
+                switches += 1
+                if overhead and events is not None:
+                    events.append((CONTEXT_SWITCH, time, time + overhead, 0, 0))
+                time += overhead
+            last = current
+            if current.start_time == -1:
+                current.start_time = time
+
+            exec_time = min(quantum, current.remaining)
+            start_time = time
+            remaining_before = current.remaining
+            time += exec_time
+            current.remaining -= exec_time
+            event_count += 1
+            if events is not None:
+                events.append((current.id, start_time, time, remaining_before, current.remaining))
+
+            while arrival_idx < total and waiting_processes[arrival_idx].arrival <= time:
+                ready.append(waiting_processes[arrival_idx])
+                arrival_idx += 1
+
+            ready.popleft()
+            if current.remaining == 0:
+                current.finish_time = time
+                current.turnaround = current.finish_time - current.arrival
+                current.waiting = current.turnaround - current.original_burst
+                completed.append(current)
+            else:
+                ready.append(current)
+
+    return {
+        'completed': completed,
+        'current_time': time,
+        'event_count': event_count,
+        'switches': switches,
+        'overhead': switches * overhead,
+        'events': events
+    }
+
+
+# Motores de solo-métricas disponibles para el modo por lotes
+ENGINES = {
+    'bulk': schedule_rr_bulk,
+    'metrics': schedule_rr_metrics,
+}
@@ -0,0 +1,142 @@
+"""Barrido de quantum: evaluar muchos quanta sobre una o varias cargas.
+
+Cada combinación (carga, quantum) es independiente, así que se reparten
+entre núcleos con ``concurrent.futures.ProcessPoolExecutor``. Las cargas se
+envían una sola vez a cada proceso trabajador (en su inicializador) y las
+tareas solo llevan índices, de modo que el coste de serialización no crece
+con el número de quanta evaluados.
+
+Con ``cache_dir`` los resultados de cada (carga, quantum, motor,
+sobrecarga) se guardan en una ``cache.ResultCache`` en disco compartida por
+todos los trabajadores: repetir un barrido solo simula las combinaciones
+nuevas.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from cache import DEFAULT_MAX_BYTES, ResultCache, result_key, workload_digest
+from scheduler import ENGINES, Process
+
+# Métricas que se minimizan al elegir el mejor quantum
+METRICS = ('avg_turnaround', 'avg_waiting', 'context_switches', 'makespan')
+
+_worker_workloads = None
+_worker_engine = None
+_worker_overhead = 0
+_worker_cache = None
+_worker_digests = None
+
+
+def parse_quanta(text):
+    """Interpretar ``'1:20'``, ``'1:20:2'`` (inclusive) o ``'1,2,4,8'``"""
+    quanta = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if ':' in part:
+            bounds = [int(value) for value in part.split(':')]
+            start, stop = bounds[0], bounds[1]
+            step = bounds[2] if len(bounds) > 2 else 1
+            if step <= 0:
+                raise ValueError(f"paso de quantum no válido: {part}")
+            quanta.extend(range(start, stop + 1, step))
+        else:
+            value = float(part)
+            if not value.is_integer():
+                raise ValueError(f"el quantum debe ser entero: {part}")
+            quanta.append(int(value))
+    if not quanta or any(q <= 0 for q in quanta):
+        raise ValueError(f"lista de quanta no válida: {text}")
+    return quanta
+
+
+def _as_rows(processes):
+    return [(p.id, p.arrival, p.burst) for p in processes]
+
+
+def evaluate(rows, quantum, engine='metrics', overhead=0):
+    """Simular una carga (filas ``(id, llegada, ráfaga)``) con un quantum.
+
+    ``overhead`` es la sobrecarga por cambio de contexto.
+    """
+    processes = [Process(pid, arrival, burst) for pid, arrival, burst in rows]
+    result = ENGINES[engine](processes, quantum, switch_cost=overhead)
+    completed = result['completed']
+    count = len(completed)
+    return {
+        'quantum': quantum,
+        'processes': count,
+        'avg_turnaround': sum(p.turnaround for p in completed) / count if count else 0.0,
+        'avg_waiting': sum(p.waiting for p in completed) / count if count else 0.0,
+        'context_switches': result['switches'],
+        'makespan': result['current_time'],
+    }
+
+
+def _init_worker(workloads, engine, overhead, cache_dir=None, digests=None,
+                 cache_bytes=DEFAULT_MAX_BYTES):
+    global _worker_workloads, _worker_engine, _worker_overhead, _worker_cache, _worker_digests
+    _worker_workloads = workloads
+    _worker_engine = engine
+    _worker_overhead = overhead
+    _worker_cache = ResultCache(directory=cache_dir, max_bytes=cache_bytes) if cache_dir else None
+    _worker_digests = digests
+
+
+def _run_task(task):
+    workload_idx, quantum = task
+    rows = _worker_workloads[workload_idx]
+    if _worker_cache is None:
+        result = evaluate(rows, quantum, _worker_engine, _worker_overhead)
+    else:
+        key = result_key(_worker_digests[workload_idx], quantum, kind='sweep',
+                         engine=_worker_engine, overhead=_worker_overhead)
+        result = dict(_worker_cache.get_or_compute(
+            key, lambda: evaluate(rows, quantum, _worker_engine, _worker_overhead)))
+    result['workload'] = workload_idx
+    return result
+
+
+def sweep_quanta(workloads, quanta, workers=None, engine='metrics', overhead=0, cache_dir=None,
+                 cache_bytes=DEFAULT_MAX_BYTES):
+    """Evaluar cada quantum sobre cada carga (listas de ``Process``).
+
+    Devuelve una lista de diccionarios (uno por combinación, ordenados por
+    carga y quantum) con ``workload``, ``quantum``, ``avg_turnaround``,
+    ``avg_waiting``, ``context_switches`` y ``makespan``. Con ``workers=1``
+    todo se ejecuta en el proceso actual. ``overhead`` es la sobrecarga por
+    cambio de contexto, con la que un quantum pequeño deja de ser gratis.
+    ``cache_dir`` activa la caché en disco de resultados (hasta ``cache_bytes``).
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"motor desconocido: {engine!r}")
+    rows = [_as_rows(processes) for processes in workloads]
+    digests = [workload_digest(processes) for processes in workloads] if cache_dir else None
+    tasks = [(workload_idx, quantum)
+             for workload_idx in range(len(rows)) for quantum in quanta]
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(tasks)) or 1
+
+    if workers == 1:
+        _init_worker(rows, engine, overhead, cache_dir, digests, cache_bytes)
+        return [_run_task(task) for task in tasks]
+
+    # Trozos pequeños para repartir bien cargas de coste muy desigual
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(rows, engine, overhead, cache_dir, digests,
+                                       cache_bytes)) as executor:
+        return list(executor.map(_run_task, tasks, chunksize=chunksize))
+
+
+def best_quanta(results):
+    """Mejor quantum de cada carga para cada métrica (el menor valor gana)"""
+    best = {}
+    for result in results:
+        entry = best.setdefault(result['workload'], {})
+        for metric in METRICS:
+            current = entry.get(metric)
+            if current is None or result[metric] < current[metric]:
+                entry[metric] = {'quantum': result['quantum'], metric: result[metric]}
+    return best
@@ -0,0 +1,123 @@
+"""Equivalencia de los modos rápidos con la simulación paso a paso.
+
+``schedule_rr_metrics`` y ``schedule_rr_bulk`` deben dar exactamente los
+mismos Tf/Tr/Te por proceso, el mismo orden de finalización, el mismo
+tiempo final y el mismo número de eventos que ``schedule_rr_step_by_step``
+sobre cargas aleatorias con semilla fija.
+
+Uso:
+    python -m pytest tests
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import (Process, ProcessTable, schedule_rr_bulk, schedule_rr_metrics,  # noqa: E402
+                       schedule_rr_step_by_step)
+
+TRIALS = 150
+
+
+def random_workload(rng, count, max_arrival, max_burst):
+    return [Process(f'P{i + 1}', rng.randint(0, max_arrival), rng.randint(1, max_burst))
+            for i in range(count)]
+
+
+def idle_gaps_workload(rng, count, quantum):
+    """Procesos que llegan después de que la CPU quedó ociosa"""
+    processes = []
+    time = rng.randint(0, 5)
+    for i in range(count):
+        burst = rng.randint(1, 3 * quantum)
+        processes.append(Process(f'P{i + 1}', time, burst))
+        time += burst + rng.randint(1, 10)
+    return processes
+
+
+def equal_arrivals_workload(rng, count, quantum):
+    """Grupos de procesos que llegan en el mismo instante"""
+    instants = [rng.randint(0, 4 * quantum) for _ in range(rng.randint(1, 3))]
+    return [Process(f'P{i + 1}', rng.choice(instants), rng.randint(1, 4 * quantum))
+            for i in range(count)]
+
+
+def quantum_multiples_workload(rng, count, quantum):
+    """Ráfagas múltiplos exactos del quantum (terminan justo al fin de una rebanada)"""
+    return [Process(f'P{i + 1}', rng.randint(0, 3 * quantum), quantum * rng.randint(1, 6))
+            for i in range(count)]
+
+
+WORKLOADS = {
+    'random': lambda rng, count, quantum: random_workload(
+        rng, count, rng.randint(0, 60), rng.randint(1, 25)),
+    'idle_gaps': idle_gaps_workload,
+    'equal_arrivals': equal_arrivals_workload,
+    'quantum_multiples': quantum_multiples_workload,
+}
+
+
+def results_of(completed):
+    return [(p.id, p.finish_time, p.turnaround, p.waiting) for p in completed]
+
+
+def workloads(kind, seed):
+    rng = random.Random(seed)
+    for _ in range(TRIALS):
+        quantum = rng.randint(1, 8)
+        yield WORKLOADS[kind](rng, rng.randint(1, 40), quantum), quantum
+
+
+@pytest.mark.parametrize('kind', sorted(WORKLOADS))
+def test_metrics_matches_step_by_step(kind):
+    for trial, (processes, quantum) in enumerate(workloads(kind, seed=1)):
+        history = schedule_rr_step_by_step(processes, quantum)
+        fast = schedule_rr_metrics(processes, quantum)
+        assert results_of(fast['completed']) == results_of(history.completed), trial
+        assert fast['current_time'] == history.current_time(-1), trial
+        assert fast['event_count'] == len(history.events), trial
+
+
+@pytest.mark.parametrize('kind', sorted(WORKLOADS))
+def test_bulk_matches_step_by_step(kind):
+    for trial, (processes, quantum) in enumerate(workloads(kind, seed=2)):
+        history = schedule_rr_step_by_step(processes, quantum)
+        bulk = schedule_rr_bulk(processes, quantum, gantt='full')
+        assert results_of(bulk['completed']) == results_of(history.completed), trial
+        assert bulk['current_time'] == history.current_time(-1), trial
+        assert bulk['event_count'] == len(history.events), trial
+        assert bulk['events'] == history.events, trial
+
+
+@pytest.mark.parametrize('kind', sorted(WORKLOADS))
+def test_fast_paths_match_with_overhead(kind):
+    for trial, (processes, quantum) in enumerate(workloads(kind, seed=3)):
+        history = schedule_rr_step_by_step(processes, quantum, switch_cost=1, warmup=2)
+        expected = results_of(history.completed)
+        for engine in (schedule_rr_metrics, schedule_rr_bulk):
+            result = engine(processes, quantum, switch_cost=1, warmup=2)
+            assert results_of(result['completed']) == expected, (engine.__name__, trial)
+            assert result['current_time'] == history.current_time(-1), (engine.__name__, trial)
+
+
+def test_input_processes_are_not_modified():
+    processes = random_workload(random.Random(4), 20, 30, 12)
+    before = [(p.id, p.arrival, p.burst, p.remaining) for p in processes]
+    schedule_rr_metrics(processes, 3)
+    schedule_rr_bulk(processes, 3)
+    assert [(p.id, p.arrival, p.burst, p.remaining) for p in processes] == before
+
+
+def test_metrics_on_process_table():
+    rng = random.Random(5)
+    processes = random_workload(rng, 30, 40, 15)
+    processes.append(Process('F', 2.5, 3))  # Una llegada fraccionaria pasa la columna a 'd'
+    table = ProcessTable.from_processes(processes)
+    assert table.arrival.typecode == 'd'
+    expected = results_of(schedule_rr_step_by_step(processes, 4).completed)
+    assert results_of(schedule_rr_metrics(table, 4)['completed']) == expected
+    assert results_of(schedule_rr_metrics(iter(processes), 4)['completed']) == expected
+    assert [p.remaining for p in table] == [p.burst for p in processes]
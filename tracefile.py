@@ -0,0 +1,316 @@
+"""Trazas binarias de la simulación: escritura en streaming y lectura mapeada.
+
+Un archivo de traza (``.rrt``) guarda los eventos del diagrama de Gantt y
+los resultados por proceso en registros de ancho fijo, en lugar de los logs
+de texto:
+
+- Cabecera: ``MAGIC`` (8 bytes).
+- Eventos: un registro ``EVENT_RECORD`` por evento, en el orden en que se
+  generaron: índice del proceso (en ``names``), CPU (-1 con una sola CPU),
+  inicio, fin, restante antes y restante después.
+- Resultados: un registro ``RESULT_RECORD`` por proceso completado, en orden
+  de finalización: índice, prioridad, llegada, ráfaga, inicio, Tf, Tr y Te.
+- Pie: JSON con los metadatos (quantum, política, makespan, ``names``, las
+  posiciones de cada sección...), su longitud (8 bytes) y ``MAGIC`` otra vez.
+
+``TraceWriter`` escribe los eventos a medida que el motor los genera (tiene
+``append``, así que sirve como ``sink`` de ``schedule_rr_bulk``,
+``simulate_policy`` y ``simulate_multicpu``): la traza nunca tiene que caber
+en memoria. ``TraceReader`` mapea el archivo con ``mmap`` y lee los eventos
+por tramos; con NumPy, ``event_columns`` devuelve las columnas como un
+arreglo mapeado en memoria sin copiarlas.
+
+Los tiempos se guardan como ``float64``; si todos eran enteros (sin
+sobrecarga fraccionaria) el lector los devuelve como enteros.
+``export_npz`` y ``export_parquet`` convierten una traza a formatos
+columnares estándar (requieren NumPy y pyarrow respectivamente). El
+resto del módulo solo usa la biblioteca estándar.
+"""
+import json
+import mmap
+import os
+import struct
+
+from scheduler import Process
+
+MAGIC = b'RRTRACE\x01'
+EVENT_RECORD = struct.Struct('<Ihdddd')  # 38 bytes
+RESULT_RECORD = struct.Struct('<Iidddddd')  # 56 bytes
+FOOTER_LENGTH = struct.Struct('<Q')
+EVENT_FIELDS = ('pid', 'cpu', 'start', 'end', 'remaining_before', 'remaining_after')
+RESULT_FIELDS = ('pid', 'priority', 'arrival', 'burst', 'start_time', 'finish_time',
+                 'turnaround', 'waiting')
+FLUSH_RECORDS = 1 << 14  # Registros acumulados antes de escribir al archivo
+READ_RECORDS = 1 << 16  # Registros por tramo al leer
+
+
+class TraceWriter:
+    """Escribir una traza ``.rrt`` evento por evento.
+
+    Uso típico::
+
+        with TraceWriter('traza.rrt', quantum=4) as trace:
+            result = schedule_rr_bulk(processes, 4, sink=trace)
+            trace.write_results(result['completed'])
+
+    ``meta`` (y los argumentos de ``close``) se guardan en el pie. Si el
+    bloque termina con una excepción, el archivo queda sin pie y
+    ``TraceReader`` lo rechaza como incompleto.
+    """
+
+    def __init__(self, path, **meta):
+        self.path = path
+        self.meta = meta
+        self.names = []
+        self._index = {}
+        self._buffer = []
+        self.event_count = 0
+        self.result_count = 0
+        self._results_offset = None
+        self._integer_times = True
+        self._pack = EVENT_RECORD.pack
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+
+    def _pid_index(self, pid):
+        index = self._index.get(pid)
+        if index is None:
+            index = self._index[pid] = len(self.names)
+            self.names.append(pid)
+        return index
+
+    def append(self, event):
+        """Agregar un evento ``(pid, inicio, fin, antes, después[, cpu])``"""
+        index = self._index.get(event[0])
+        if index is None:
+            index = self._pid_index(event[0])
+        end = event[2]
+        if type(end) is float:
+            self._integer_times = False
+        buffer = self._buffer
+        buffer.append(self._pack(index, event[5] if len(event) > 5 else -1,
+                                 event[1], end, event[3], event[4]))
+        if len(buffer) >= FLUSH_RECORDS:
+            self.flush()
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+
+    def flush(self):
+        if self._buffer:
+            if self._results_offset is not None:
+                raise ValueError("no se pueden agregar eventos después de los resultados")
+            self._file.write(b''.join(self._buffer))
+            self.event_count += len(self._buffer)
+            self._buffer = []
+
+    def write_results(self, completed):
+        """Escribir los procesos completados (en orden de finalización)"""
+        self.flush()
+        if self._results_offset is None:
+            self._results_offset = self._file.tell()
+        buffer = []
+        for process in completed:
+            if self._integer_times and type(process.finish_time) is float:
+                self._integer_times = False
+            buffer.append(RESULT_RECORD.pack(
+                self._pid_index(process.id), process.priority, process.arrival,
+                process.original_burst, process.start_time, process.finish_time,
+                process.turnaround, process.waiting))
+            if len(buffer) >= FLUSH_RECORDS:
+                self._file.write(b''.join(buffer))
+                buffer = []
+        self._file.write(b''.join(buffer))
+        self.result_count += len(completed)
+
+    def close(self, **meta):
+        """Terminar la traza escribiendo el pie con los metadatos"""
+        if self._file.closed:
+            return
+        if self._results_offset is None:
+            self.write_results([])
+        footer = dict(self.meta, **meta)
+        footer.update({
+            'version': 1,
+            'event_count': self.event_count,
+            'events_offset': len(MAGIC),
+            'result_count': self.result_count,
+            'results_offset': self._results_offset,
+            'integer_times': self._integer_times,
+            'names': self.names,
+        })
+        data = json.dumps(footer, ensure_ascii=False).encode('utf-8')
+        self._file.write(data)
+        self._file.write(FOOTER_LENGTH.pack(len(data)))
+        self._file.write(MAGIC)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.flush()
+            self._file.close()
+
+
+class TraceReader:
+    """Leer una traza ``.rrt`` mapeada en memoria.
+
+    ``meta`` tiene los metadatos del pie y ``names`` los identificadores de
+    los procesos. Los eventos se leen por tramos con ``events`` y los
+    resultados con ``results``; nada se carga entero salvo que se pida.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            tail = len(MAGIC) + FOOTER_LENGTH.size
+            if size < len(MAGIC) + tail:
+                raise ValueError(f"no es una traza válida: {path}")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"no es una traza válida: {path}")
+        if self._map[-len(MAGIC):] != MAGIC:
+            self.close()
+            raise ValueError(f"traza incompleta (la simulación no terminó): {path}")
+        length, = FOOTER_LENGTH.unpack_from(self._map, size - tail)
+        self.meta = json.loads(self._map[size - tail - length:size - tail].decode('utf-8'))
+        self.names = self.meta.pop('names')
+        self.event_count = self.meta['event_count']
+        self.result_count = self.meta['result_count']
+        self._convert = int if self.meta['integer_times'] else float
+
+    def __len__(self):
+        return self.event_count
+
+    def events(self, start=0, stop=None):
+        """Iterar los eventos ``[start, stop)`` como tuplas de la simulación.
+
+        Los eventos con CPU (simulación con varias CPUs) tienen un sexto
+        campo, como los de ``simulate_multicpu``.
+        """
+        stop = self.event_count if stop is None else min(stop, self.event_count)
+        names = self.names
+        convert = self._convert
+        base = self.meta['events_offset']
+        for first in range(start, stop, READ_RECORDS):
+            last = min(stop, first + READ_RECORDS)
+            chunk = self._map[base + first * EVENT_RECORD.size:base + last * EVENT_RECORD.size]
+            for index, cpu, begin, end, before, after in EVENT_RECORD.iter_unpack(chunk):
+                event = (names[index], convert(begin), convert(end), convert(before), convert(after))
+                yield event if cpu < 0 else event + (cpu,)
+
+    def results(self):
+        """Lista de procesos completados (en orden de finalización) con Tf/Tr/Te"""
+        names = self.names
+        convert = self._convert
+        base = self.meta['results_offset']
+        data = self._map[base:base + self.result_count * RESULT_RECORD.size]
+        completed = []
+        for (index, priority, arrival, burst, start,
+             finish, turnaround, waiting) in RESULT_RECORD.iter_unpack(data):
+            process = Process(names[index], convert(arrival), convert(burst), priority)
+            process.remaining = 0
+            process.start_time = convert(start)
+            process.finish_time = convert(finish)
+            process.turnaround = convert(turnaround)
+            process.waiting = convert(waiting)
+            completed.append(process)
+        return completed
+
+    def event_columns(self):
+        """Eventos como arreglo estructurado de NumPy mapeado en memoria (sin copia)"""
+        import numpy as np
+        return np.memmap(self.path, dtype=record_dtype(EVENT_RECORD, EVENT_FIELDS), mode='r',
+                         offset=self.meta['events_offset'], shape=(self.event_count,))
+
+    def result_columns(self):
+        """Resultados como arreglo estructurado de NumPy mapeado en memoria"""
+        import numpy as np
+        return np.memmap(self.path, dtype=record_dtype(RESULT_RECORD, RESULT_FIELDS), mode='r',
+                         offset=self.meta['results_offset'], shape=(self.result_count,))
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def record_dtype(record, fields):
+    """Tipo estructurado de NumPy equivalente a un ``struct.Struct`` de la traza"""
+    import numpy as np
+    codes = {'I': '<u4', 'h': '<i2', 'i': '<i4', 'd': '<f8'}
+    return np.dtype([(name, codes[code]) for name, code in zip(fields, record.format[1:])])
+
+
+def export_npz(reader, path, compress=False):
+    """Guardar una traza como ``.npz``: una columna por campo, más ``names`` y ``meta``"""
+    import numpy as np
+    arrays = {'names': np.array(reader.names, dtype=str),
+              'meta': np.array(json.dumps(reader.meta, ensure_ascii=False))}
+    events = reader.event_columns()
+    results = reader.result_columns()
+    for name in EVENT_FIELDS:
+        arrays[f'event_{name}'] = events[name]
+    for name in RESULT_FIELDS:
+        arrays[f'result_{name}'] = results[name]
+    (np.savez_compressed if compress else np.savez)(path, **arrays)
+
+
+def export_parquet(reader, path):
+    """Guardar los eventos en ``path`` y los resultados en ``<nombre>.results.parquet``.
+
+    Los identificadores se guardan como columna de diccionario. Requiere
+    pyarrow; los eventos se escriben por tramos.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("exportar a Parquet requiere pyarrow (pip install pyarrow)") from None
+    import numpy as np
+
+    names = pa.array(reader.names, type=pa.string())
+
+    def table(columns, fields, start, stop):
+        # Los campos de un arreglo estructurado no son contiguos: se copian por tramos
+        indices = np.ascontiguousarray(columns['pid'][start:stop], dtype=np.int32)
+        arrays = [pa.DictionaryArray.from_arrays(pa.array(indices), names)]
+        arrays += [pa.array(np.ascontiguousarray(columns[name][start:stop])) for name in fields[1:]]
+        return pa.Table.from_arrays(arrays, names=list(fields))
+
+    root, ext = os.path.splitext(path)
+    for target, columns, fields in ((path, reader.event_columns(), EVENT_FIELDS),
+                                    (f'{root}.results{ext or ".parquet"}',
+                                     reader.result_columns(), RESULT_FIELDS)):
+        writer = None
+        try:
+            for start in range(0, max(len(columns), 1), READ_RECORDS * 16):
+                chunk = table(columns, fields, start, start + READ_RECORDS * 16)
+                if writer is None:
+                    writer = pq.ParquetWriter(target, chunk.schema)
+                writer.write_table(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+EXPORT_FORMATS = {
+    '.npz': export_npz,
+    '.parquet': export_parquet,
+}
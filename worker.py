@@ -0,0 +1,112 @@
+"""Simulación en segundo plano para que el bucle de eventos de Qt no se bloquee"""
+import threading
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from policies import iter_policy_steps, make_policy
+from scheduler import iter_rr_steps
+
+
+class SimulationWorker(QThread):
+    """Hilo que ejecuta ``iter_rr_steps`` y envía los pasos por lotes.
+
+    Con ``policy`` distinto de ``'rr'`` se usa ``iter_policy_steps`` con esa
+    política de ``policies.POLICIES``. ``switch_cost`` y ``warmup``
+    (calentamiento de caché) son la sobrecarga por cambio de contexto que se
+    cobra al pasar de un proceso a otro.
+
+    ``steps`` permite pasar un iterador de pasos ya preparado (por ejemplo
+    la continuación de ``IncrementalRR.start``); ``offset`` y
+    ``completed_offset`` son los pasos y procesos completados que el
+    historial ya tiene, para que la demanda y el progreso se cuenten desde
+    ahí. ``profiler`` (``profiling.PhaseProfiler``) mide las fases del
+    motor Round Robin.
+
+    Los pasos se envían con la señal ``steps_ready`` cada ``batch_size``
+    pasos o cada ``batch_interval`` segundos, lo que ocurra primero (el
+    primero se envía de inmediato). Para que la memoria no crezca sin límite,
+    el hilo no se adelanta más allá de los pasos pedidos con
+    ``request_steps``: la interfaz pide más a medida que los muestra.
+    """
+    steps_ready = pyqtSignal(list)
+    progress = pyqtSignal(int, int, int)  # pasos generados, completados, total
+    simulation_finished = pyqtSignal(bool)  # True si se canceló
+
+    def __init__(self, processes, quantum, policy='rr', switch_cost=0, batch_size=200,
+                 batch_interval=0.05, parent=None, steps=None, offset=0, completed_offset=0,
+                 profiler=None, warmup=0):
+        super().__init__(parent)
+        self.processes = list(processes)
+        self.quantum = quantum
+        self.policy = policy
+        self.switch_cost = switch_cost
+        self.warmup = warmup
+        self.steps = steps
+        self.offset = offset
+        self.completed_offset = completed_offset
+        self.profiler = profiler
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._demand = 0
+        self._condition = threading.Condition()
+
+    def request_steps(self, count):
+        """Permitir que el hilo genere pasos hasta ``count`` (exclusivo)"""
+        with self._condition:
+            if count > self._demand:
+                self._demand = count
+                self._condition.notify_all()
+
+    def cancel(self):
+        """Pedir la cancelación; el hilo termina al final del paso actual"""
+        self.requestInterruption()
+        with self._condition:
+            self._condition.notify_all()
+
+    def _wait_for_demand(self, produced):
+        with self._condition:
+            while produced >= self._demand and not self.isInterruptionRequested():
+                self._condition.wait()
+        return not self.isInterruptionRequested()
+
+    def run(self):
+        total = len(self.processes)
+        produced = self.offset
+        completed = self.completed_offset
+        batch = []
+        last_emit = time.monotonic()
+
+        if self.steps is not None:
+            steps = self.steps
+        elif self.policy == 'rr':
+            steps = iter_rr_steps(self.processes, self.quantum, self.switch_cost, self.warmup,
+                                  profiler=self.profiler)
+        else:
+            steps = iter_policy_steps(self.processes, make_policy(self.policy, self.quantum),
+                                      self.switch_cost, self.warmup)
+        for step in steps:
+            if self.isInterruptionRequested():
+                break
+            batch.append(step)
+            produced += 1
+            if step['completed'] is not None:
+                completed += 1
+
+            # Antes de esperar a la interfaz hay que entregarle lo pendiente
+            blocked = produced >= self._demand
+            now = time.monotonic()
+            if (blocked or produced == self.offset + 1 or len(batch) >= self.batch_size
+                    or now - last_emit >= self.batch_interval):
+                self.steps_ready.emit(batch)
+                self.progress.emit(produced, completed, total)
+                batch = []
+                last_emit = now
+            if blocked and not self._wait_for_demand(produced):
+                break
+
+        cancelled = self.isInterruptionRequested()
+        if batch and not cancelled:
+            self.steps_ready.emit(batch)
+            self.progress.emit(produced, completed, total)
+        self.simulation_finished.emit(cancelled)
@@ -0,0 +1,219 @@
+"""Lectura de cargas de trabajo y escritura de resultados para el modo por lotes.
+
+Formatos de entrada admitidos (un proceso por registro):
+
+- CSV: columnas ``arrival,burst`` y opcionalmente ``id`` y ``priority``. La
+  cabecera es opcional; sin ella se asume ``arrival,burst``,
+  ``id,arrival,burst`` o ``id,arrival,burst,priority`` según el número de
+  columnas.
+- JSON: lista de objetos ``{"id": ..., "arrival": ..., "burst": ...}`` (con
+  ``"priority"`` opcional) o lista de pares ``[arrival, burst]``. También se
+  acepta un objeto con la lista en la clave ``"processes"``.
+
+La prioridad (menor número, más prioridad; 0 por defecto) solo la usan las
+políticas que la tienen en cuenta.
+
+Los procesos sin ``id`` se numeran ``P1, P2, ...`` igual que en la interfaz.
+"""
+import csv
+import io
+import json
+import os
+import sys
+from collections.abc import Sequence
+
+from scheduler import Process, ProcessTable
+
+INPUT_FORMATS = ('csv', 'json')
+OUTPUT_FORMATS = ('table', 'csv', 'json')
+
+
+def _number(value):
+    """Convertir a int cuando es posible (los tiempos suelen ser enteros)"""
+    if isinstance(value, (int, float)):
+        return value
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _make_process(index, pid, arrival, burst, priority=None):
+    arrival = _number(arrival)
+    burst = _number(burst)
+    priority = 0 if priority is None or str(priority).strip() == '' else _number(priority)
+    if arrival < 0:
+        raise ValueError(f"registro {index + 1}: la llegada no puede ser negativa ({arrival})")
+    if burst <= 0:
+        raise ValueError(f"registro {index + 1}: la ráfaga debe ser positiva ({burst})")
+    if pid is None or str(pid).strip() == '':
+        pid = f'P{index + 1}'
+    return Process(str(pid).strip(), arrival, burst, priority)
+
+
+def iter_csv(lines):
+    """Generar procesos a medida que se leen las líneas CSV de ``lines``.
+
+    ``lines`` puede ser un archivo o cualquier iterador de líneas, incluso
+    uno que no termina (un archivo que sigue creciendo, un socket). Si la
+    carga llega en varios tramos con la misma cabecera, las cabeceras
+    repetidas se ignoran.
+    """
+    columns = None
+    header = None
+    count = 0
+    for row in csv.reader(lines):
+        if not row or all(not cell.strip() for cell in row) or row[0].lstrip().startswith('#'):
+            continue
+        if columns is None:
+            header = [cell.strip().lower() for cell in row]
+            if 'arrival' in header and 'burst' in header:
+                columns = header
+                arrival = header.index('arrival')
+                continue
+            header = None
+            columns = ['id', 'arrival', 'burst', 'priority'][:len(row)] if len(row) >= 3 else ['arrival', 'burst']
+        elif header is not None and arrival < len(row) and row[arrival].strip().lower() == 'arrival' \
+                and [cell.strip().lower() for cell in row] == header:
+            continue  # Cabecera repetida: solo se compara si la columna de llegada lo parece
+        record = dict(zip(columns, row))
+        yield _make_process(count, record.get('id'), record['arrival'], record['burst'],
+                            record.get('priority'))
+        count += 1
+
+
+def parse_csv(stream):
+    """Leer procesos desde un flujo CSV"""
+    return list(iter_csv(stream))
+
+
+def parse_json(stream):
+    """Leer procesos desde un flujo JSON"""
+    data = json.load(stream)
+    if isinstance(data, dict):
+        data = data.get('processes', [])
+    processes = []
+    for index, item in enumerate(data):
+        if isinstance(item, dict):
+            processes.append(_make_process(index, item.get('id'), item['arrival'], item['burst'],
+                                           item.get('priority')))
+        else:
+            arrival, burst = item[0], item[1]
+            processes.append(_make_process(index, None, arrival, burst))
+    return processes
+
+
+def detect_format(path, sample=''):
+    """Deducir el formato por la extensión o, si no la hay, por el contenido"""
+    if path and path != '-':
+        extension = os.path.splitext(path)[1].lower().lstrip('.')
+        if extension in INPUT_FORMATS:
+            return extension
+    return 'json' if sample.lstrip()[:1] in ('[', '{') else 'csv'
+
+
+def load_processes(path, fmt=None):
+    """Cargar procesos desde un archivo o desde stdin (``path`` = ``'-'``).
+
+    Devuelve una ``ProcessTable``: en CSV las filas pasan a la tabla a
+    medida que se leen, sin un objeto ``Process`` por proceso.
+    """
+    if path == '-':
+        text = sys.stdin.read()
+    else:
+        with open(path, newline='', encoding='utf-8') as stream:
+            text = stream.read()
+    fmt = fmt or detect_format(path, text[:64])
+    stream = io.StringIO(text)
+    return ProcessTable.from_processes(parse_json(stream) if fmt == 'json' else iter_csv(stream))
+
+
+def write_processes(processes, stream, fmt='csv', priority=None):
+    """Escribir una carga de trabajo en un formato que ``load_processes`` lee.
+
+    ``processes`` puede ser un iterador: en CSV se escribe proceso por
+    proceso, sin tener la carga entera en memoria. La prioridad se escribe
+    (columna ``priority``, clave ``"priority"``) si ``priority`` es verdadero;
+    con ``None`` se decide sola: si algún proceso tiene prioridad distinta
+    de 0 en una lista, y siempre en un iterador, que no se puede recorrer
+    dos veces.
+    """
+    if fmt == 'json':
+        processes = list(processes)
+        if priority is None:
+            priority = any(p.priority for p in processes)
+        json.dump([{'id': p.id, 'arrival': p.arrival, 'burst': p.burst,
+                    **({'priority': p.priority} if priority else {})} for p in processes],
+                  stream, ensure_ascii=False)
+        stream.write('\n')
+        return
+
+    if priority is None:
+        priority = not isinstance(processes, Sequence) or any(p.priority for p in processes)
+    writer = csv.writer(stream, lineterminator='\n')
+    if priority:
+        writer.writerow(['id', 'arrival', 'burst', 'priority'])
+        for p in processes:
+            writer.writerow([p.id, p.arrival, p.burst, p.priority])
+        return
+    writer.writerow(['id', 'arrival', 'burst'])
+    for p in processes:
+        writer.writerow([p.id, p.arrival, p.burst])
+
+
+def summarize(completed):
+    """Promedios de retorno y espera de los procesos completados"""
+    count = len(completed)
+    if not count:
+        return {'processes': 0, 'avg_turnaround': 0.0, 'avg_waiting': 0.0}
+    return {
+        'processes': count,
+        'avg_turnaround': sum(p.turnaround for p in completed) / count,
+        'avg_waiting': sum(p.waiting for p in completed) / count,
+    }
+
+
+def write_results(completed, stream, fmt='table', extra=None):
+    """Escribir Tf/Tr/Te por proceso y los promedios en el formato pedido.
+
+    Los procesos se escriben en el orden en que terminaron. ``extra`` agrega
+    campos al resumen (por ejemplo, el tiempo total de la simulación).
+    """
+    summary = summarize(completed)
+    if extra:
+        summary.update(extra)
+
+    if fmt == 'json':
+        json.dump({
+            'processes': [
+                {'id': p.id, 'arrival': p.arrival, 'burst': p.original_burst,
+                 'finish': p.finish_time, 'turnaround': p.turnaround, 'waiting': p.waiting}
+                for p in completed
+            ],
+            'summary': summary,
+        }, stream, ensure_ascii=False)
+        stream.write('\n')
+        return
+
+    if fmt == 'csv':
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(['id', 'arrival', 'burst', 'finish', 'turnaround', 'waiting'])
+        for p in completed:
+            writer.writerow([p.id, p.arrival, p.original_burst,
+                             p.finish_time, p.turnaround, p.waiting])
+        for key, value in summary.items():
+            stream.write(f"# {key},{value}\n")
+        return
+
+    stream.write("Proceso | Llegada | Ráfaga | Tf | Tr | Te\n")
+    stream.write("--------|---------|--------|----|----|----\n")
+    for p in completed:
+        stream.write(f"{p.id:7} | {p.arrival:7} | {p.original_burst:6} | "
+                     f"{p.finish_time:2} | {p.turnaround:2} | {p.waiting:2}\n")
+    stream.write("\n")
+    stream.write(f"⏱️ Tiempo promedio de retorno: {summary['avg_turnaround']:.2f}\n")
+    stream.write(f"⏰ Tiempo promedio de espera: {summary['avg_waiting']:.2f}\n")
+    for key, value in summary.items():
+        if key not in ('processes', 'avg_turnaround', 'avg_waiting'):
+            stream.write(f"{key}: {value}\n")